@@ -0,0 +1,38 @@
+import tempfile
+import time
+
+import dgl
+
+from .. import utils
+
+
+@utils.skip_if_gpu()
+@utils.benchmark("time")
+@utils.parametrize("batch_size", [32, 256, 1024])
+@utils.parametrize("method", ["dgl.batch", "archive"])
+def track_time(batch_size, method):
+    ds = dgl.data.QM7bDataset()
+    graphs, labels = ds[0:batch_size]
+    indices = list(range(batch_size))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dgl.data.utils.save_graph_archive(tmpdir, graphs, {"label": labels})
+        archive = dgl.data.utils.GraphArchiveDataset(tmpdir)
+
+        # Both methods collate a minibatch from the dataset, as done by
+        # GraphDataLoader.
+        def collate():
+            if method == "archive":
+                return archive.batch(indices)
+            items = [archive[i] for i in indices]
+            return dgl.batch([g for g, _ in items])
+
+        # dry run
+        for i in range(10):
+            collate()
+
+        # timing
+        with utils.Timer() as t:
+            for i in range(100):
+                collate()
+
+    return t.elapsed_secs / 100
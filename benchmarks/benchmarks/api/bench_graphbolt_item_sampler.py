@@ -0,0 +1,69 @@
+import dgl.graphbolt as gb
+
+import torch
+
+from .. import utils
+
+
+def collate_batch_per_type_scan(sampler, buffer, indices, offsets):
+    """The previous ItemSetDict collation, which scans the whole batch once
+    per type."""
+    keys = list(buffer.keys())
+    key_indices = torch.searchsorted(offsets, indices, right=True) - 1
+    batch = {}
+    for j, key in enumerate(keys):
+        mask = (key_indices == j).nonzero().squeeze(1)
+        if len(mask) == 0:
+            continue
+        batch[key] = sampler._collate_batch(
+            buffer[key], indices[mask] - offsets[j]
+        )
+    return batch
+
+
+@utils.benchmark("time")
+@utils.parametrize("num_types", [4, 32, 128])
+@utils.parametrize("batch_size", [1024, 16384])
+@utils.parametrize("collate", ["per_type_scan", "sorted_split"])
+def track_time(num_types, batch_size, collate):
+    num_items_per_type = 20000
+    item_set = gb.ItemSetDict(
+        {
+            f"n{i}:e{i}:n{i}": gb.ItemSet(
+                torch.randint(0, 100000, (num_items_per_type, 2)),
+                names="node_pairs",
+            )
+            for i in range(num_types)
+        }
+    )
+    sampler = gb.ItemShufflerAndBatcher(
+        item_set,
+        shuffle=True,
+        batch_size=batch_size,
+        drop_last=False,
+        buffer_size=len(item_set),
+        rng=torch.Generator(),
+    )
+    buffer = item_set[0 : len(item_set)]
+    offsets = sampler._calculate_offsets(buffer)
+    indices = torch.randperm(len(item_set))
+    batches = torch.split(indices, batch_size)[:20]
+    if collate == "per_type_scan":
+        collate_fn = lambda batch_indices: collate_batch_per_type_scan(
+            sampler, buffer, batch_indices, offsets
+        )
+    else:
+        collate_fn = lambda batch_indices: sampler._collate_batch(
+            buffer, batch_indices, offsets
+        )
+
+    # dry run
+    for batch_indices in batches[:3]:
+        collate_fn(batch_indices)
+
+    # timing
+    with utils.Timer() as t:
+        for batch_indices in batches:
+            collate_fn(batch_indices)
+
+    return t.elapsed_secs / len(batches)
@@ -0,0 +1,169 @@
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+
+import numpy as np
+import psutil
+import yaml
+
+from dgl.graphbolt.impl import ondisk_dataset
+
+from .. import utils
+
+
+class PeakRSSMonitor:
+    """Samples the total RSS of this process and its children in the
+    background and records the peak."""
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.peak_rss = 0
+
+    def _rss(self):
+        process = psutil.Process()
+        rss = process.memory_info().rss
+        for child in process.children(recursive=True):
+            try:
+                rss += child.memory_info().rss
+            except psutil.NoSuchProcess:
+                pass
+        return rss
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak_rss = max(self.peak_rss, self._rss())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self.peak_rss = self._rss()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.tic = time.time()
+        return self
+
+    def __exit__(self, *args):
+        self.elapsed_secs = time.time() - self.tic
+        self._stop.set()
+        self._thread.join()
+
+
+def generate_dataset(
+    dataset_dir, num_ntypes, num_etypes, num_nodes, num_edges, feat_dim
+):
+    """Generate a heterogeneous dataset with csv edges, numpy node features
+    and one train set per node type."""
+    ntypes = [f"n{i}" for i in range(num_ntypes)]
+    etypes = [
+        f"{ntypes[i % num_ntypes]}:e{i}:{ntypes[(i + 1) % num_ntypes]}"
+        for i in range(num_etypes)
+    ]
+    os.makedirs(os.path.join(dataset_dir, "edges"), exist_ok=True)
+    os.makedirs(os.path.join(dataset_dir, "data"), exist_ok=True)
+    os.makedirs(os.path.join(dataset_dir, "set"), exist_ok=True)
+    config = {
+        "dataset_name": "bench_preprocess",
+        "graph": {"nodes": [], "edges": []},
+        "feature_data": [],
+        "tasks": [{"name": "node_classification", "train_set": []}],
+    }
+    for ntype in ntypes:
+        config["graph"]["nodes"].append({"type": ntype, "num": num_nodes})
+        path = os.path.join("data", f"{ntype}-feat.npy")
+        np.save(
+            os.path.join(dataset_dir, path),
+            np.random.rand(num_nodes, feat_dim).astype(np.float32),
+        )
+        config["feature_data"].append(
+            {
+                "domain": "node",
+                "type": ntype,
+                "name": "feat",
+                "format": "numpy",
+                "path": path,
+            }
+        )
+        path = os.path.join("set", f"{ntype}-train.npy")
+        np.save(
+            os.path.join(dataset_dir, path),
+            np.random.randint(0, num_nodes, num_nodes // 10),
+        )
+        config["tasks"][0]["train_set"].append(
+            {
+                "type": ntype,
+                "data": [
+                    {"name": "seed_nodes", "format": "numpy", "path": path}
+                ],
+            }
+        )
+    for etype in etypes:
+        path = os.path.join("edges", f"{etype.replace(':', '-')}.csv")
+        edges = np.random.randint(0, num_nodes, (num_edges, 2))
+        np.savetxt(os.path.join(dataset_dir, path), edges, "%d", ",")
+        config["graph"]["edges"].append(
+            {"type": etype, "format": "csv", "path": path}
+        )
+    with open(os.path.join(dataset_dir, "metadata.yaml"), "w") as f:
+        yaml.dump(config, f)
+    return config
+
+
+def preprocess_by_stage(dataset_dir, config, num_workers):
+    """Run the stages of preprocess_ondisk_dataset one by one and return the
+    wall-clock time and peak RSS of each of them."""
+    processed_dir = "preprocessed"
+    os.makedirs(os.path.join(dataset_dir, processed_dir), exist_ok=True)
+    output_config = deepcopy(config)
+    executor = None
+    if num_workers > 0:
+        executor = ProcessPoolExecutor(max_workers=num_workers)
+    results = {}
+    with PeakRSSMonitor() as monitor:
+        graph = ondisk_dataset._graph_data_to_fused_csc_sampling_graph(
+            dataset_dir,
+            deepcopy(config["graph"]),
+            include_original_edge_id=False,
+            auto_cast_to_optimal_dtype=True,
+            executor=executor,
+        )
+    results["graph"] = (monitor.elapsed_secs, monitor.peak_rss)
+    del graph
+    with PeakRSSMonitor() as monitor:
+        ondisk_dataset._convert_feature_data(
+            dataset_dir, config, output_config, processed_dir, executor
+        )
+    results["feature_data"] = (monitor.elapsed_secs, monitor.peak_rss)
+    with PeakRSSMonitor() as monitor:
+        ondisk_dataset._convert_tvt_sets(
+            dataset_dir, config, output_config, processed_dir, True, executor
+        )
+    results["tvt_sets"] = (monitor.elapsed_secs, monitor.peak_rss)
+    if executor is not None:
+        executor.shutdown()
+    return results
+
+
+@utils.benchmark("time", timeout=1200)
+@utils.parametrize("num_etypes", [8, 40])
+@utils.parametrize("num_workers", [0, 4, 16])
+def track_time(num_etypes, num_workers):
+    with tempfile.TemporaryDirectory() as dataset_dir:
+        config = generate_dataset(
+            dataset_dir,
+            num_ntypes=4,
+            num_etypes=num_etypes,
+            num_nodes=100000,
+            num_edges=500000,
+            feat_dim=128,
+        )
+        results = preprocess_by_stage(dataset_dir, config, num_workers)
+    for stage, (elapsed_secs, peak_rss) in results.items():
+        print(
+            f"[num_etypes={num_etypes}, num_workers={num_workers}] "
+            f"{stage}: {elapsed_secs:.2f} s, "
+            f"peak RSS {peak_rss / 2**30:.2f} GiB"
+        )
+    return sum(elapsed_secs for elapsed_secs, _ in results.values())
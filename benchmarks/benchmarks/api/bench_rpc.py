@@ -0,0 +1,133 @@
+import multiprocessing as mp
+import os
+import socket
+import tempfile
+import time
+
+import dgl
+
+import torch
+
+from .. import utils
+
+ECHO_SERVICE_ID = 901250
+
+
+class EchoResponse(dgl.distributed.Response):
+    def __init__(self, seed, etype, num):
+        self.seed = seed
+        self.etype = etype
+        self.num = num
+
+    def __getstate__(self):
+        return self.seed, self.etype, self.num
+
+    def __setstate__(self, state):
+        self.seed, self.etype, self.num = state
+
+
+class EchoRequest(dgl.distributed.Request):
+    """A request shaped like a sampling request: a small tensor of seeds
+    and a few scalars."""
+
+    def __init__(self, seed, etype, prob, num, replace):
+        self.seed = seed
+        self.etype = etype
+        self.prob = prob
+        self.num = num
+        self.replace = replace
+
+    def __getstate__(self):
+        return self.seed, self.etype, self.prob, self.num, self.replace
+
+    def __setstate__(self, state):
+        self.seed, self.etype, self.prob, self.num, self.replace = state
+
+    def process_request(self, server_state):
+        return EchoResponse(self.seed, self.etype, self.num)
+
+
+def register_echo_service(codec):
+    dgl.distributed.register_service(ECHO_SERVICE_ID, EchoRequest, EchoResponse)
+    if codec == "struct":
+        dgl.distributed.register_struct_codec(
+            EchoRequest, ("tensor", "str", "opt_str", "int", "bool")
+        )
+        dgl.distributed.register_struct_codec(
+            EchoResponse, ("tensor", "str", "int")
+        )
+
+
+def write_ip_config(ip_config):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    with open(ip_config, "w") as f:
+        f.write("127.0.0.1 {}\n".format(port))
+
+
+def run_server(ip_config, codec):
+    os.environ["DGL_DIST_MODE"] = "distributed"
+    register_echo_service(codec)
+    server_state = dgl.distributed.ServerState(
+        None, local_g=None, partition_book=None
+    )
+    dgl.distributed.start_server(
+        server_id=0,
+        ip_config=ip_config,
+        num_servers=1,
+        num_clients=1,
+        server_state=server_state,
+    )
+
+
+def run_client(ip_config, codec, seed_size, num_messages, queue):
+    os.environ["DGL_DIST_MODE"] = "distributed"
+    register_echo_service(codec)
+    dgl.distributed.connect_to_server(ip_config=ip_config, num_servers=1)
+    req = EchoRequest(
+        torch.randint(0, 1000000, (seed_size,)), "_N:_E:_N", None, 10, False
+    )
+    # dry run
+    for _ in range(100):
+        dgl.distributed.send_request(0, req)
+        dgl.distributed.recv_response()
+
+    # timing
+    with utils.Timer() as t:
+        for _ in range(num_messages):
+            dgl.distributed.send_request(0, req)
+            dgl.distributed.recv_response()
+    queue.put(t.elapsed_secs)
+    dgl.distributed.exit_client()
+
+
+@utils.skip_if_gpu()
+@utils.benchmark("time", timeout=600)
+@utils.parametrize("seed_size", [16, 1024])
+@utils.parametrize("codec", ["pickle", "struct"])
+def track_time(seed_size, codec):
+    num_messages = 10000
+    ctx = mp.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ip_config = os.path.join(tmpdir, "ip_config.txt")
+        write_ip_config(ip_config)
+        queue = ctx.Queue()
+        pserver = ctx.Process(target=run_server, args=(ip_config, codec))
+        pclient = ctx.Process(
+            target=run_client,
+            args=(ip_config, codec, seed_size, num_messages, queue),
+        )
+        pserver.start()
+        time.sleep(1)
+        pclient.start()
+        elapsed_secs = queue.get()
+        pclient.join()
+        pserver.join()
+    print(
+        f"[seed_size={seed_size}, codec={codec}] "
+        f"{num_messages / elapsed_secs:.0f} messages/s"
+    )
+    # The latency of a request-response round trip.
+    return elapsed_secs / num_messages
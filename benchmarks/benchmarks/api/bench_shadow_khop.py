@@ -0,0 +1,55 @@
+import time
+
+import dgl
+import dgl.graphbolt as gb
+
+import numpy as np
+import torch
+
+from .. import utils
+
+
+def shadow_khop_blocks(g, seed_nodes, fanouts):
+    # The hop by hop implementation building a block per hop, as a baseline.
+    for fanout in reversed(fanouts):
+        frontier = g.sample_neighbors(seed_nodes, fanout)
+        block = dgl.to_block(frontier, seed_nodes)
+        seed_nodes = block.srcdata[dgl.NID]
+    return g.subgraph(seed_nodes, relabel_nodes=True)
+
+
+@utils.skip_if_gpu()
+@utils.benchmark("time")
+@utils.parametrize("graph_name", ["reddit", "ogbn-products"])
+@utils.parametrize("batch_size", [64, 1024])
+@utils.parametrize("impl", ["blocks", "fused", "graphbolt"])
+def track_time(graph_name, batch_size, impl):
+    fanouts = [10, 5]
+    graph = utils.get_graph(graph_name)
+    seed_nodes = np.random.randint(0, graph.num_nodes(), (20, batch_size))
+    seed_nodes = [torch.from_numpy(np.unique(seeds)) for seeds in seed_nodes]
+
+    if impl == "blocks":
+        sample = lambda seeds: shadow_khop_blocks(graph, seeds, fanouts)
+    elif impl == "fused":
+        sampler = dgl.dataloading.ShaDowKHopSampler(fanouts)
+        sample = lambda seeds: sampler.sample(graph, seeds)
+    else:
+        gb_graph = gb.from_dglgraph(graph, is_homogeneous=True)
+        sampler = gb.ShaDowKHopSampler(
+            gb.ItemSampler(gb.ItemSet(1, names="seed_nodes"), 1),
+            gb_graph,
+            fanouts,
+        )
+        sample = lambda seeds: sampler.sample_subgraphs(seeds, None)
+
+    # dry run
+    for seeds in seed_nodes[:3]:
+        sample(seeds)
+
+    # timing
+    with utils.Timer() as t:
+        for seeds in seed_nodes:
+            sample(seeds)
+
+    return t.elapsed_secs / len(seed_nodes)
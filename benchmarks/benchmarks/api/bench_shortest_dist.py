@@ -0,0 +1,50 @@
+import time
+
+import dgl
+
+import numpy as np
+import torch
+
+from .. import utils
+
+
+def make_molecules(num_graphs, num_nodes, seed=0):
+    """Random bidirected graphs shaped like molecules: a random tree with a
+    few extra bonds closing rings."""
+    rng = np.random.default_rng(seed)
+    graphs = []
+    for _ in range(num_graphs):
+        n = int(rng.integers(num_nodes // 2, num_nodes + 1))
+        src = np.arange(1, n)
+        dst = rng.integers(0, np.maximum(src, 1))
+        rings = rng.integers(0, n, (2, n // 10))
+        src = np.concatenate([src, rings[0]])
+        dst = np.concatenate([dst, rings[1]])
+        g = dgl.graph((torch.tensor(src), torch.tensor(dst)), num_nodes=n)
+        graphs.append(dgl.to_bidirected(g))
+    return graphs
+
+
+@utils.skip_if_gpu()
+@utils.benchmark("time", timeout=600)
+@utils.parametrize("max_dist", [None, 5])
+@utils.parametrize("path_format", ["dense", "ragged"])
+def track_time(max_dist, path_format):
+    graphs = make_molecules(1000, 30)
+    # dry run
+    for g in graphs[:10]:
+        dgl.shortest_dist(
+            g, return_paths=True, max_dist=max_dist, path_format=path_format
+        )
+
+    # timing
+    with utils.Timer() as t:
+        for g in graphs:
+            dgl.shortest_dist(
+                g,
+                return_paths=True,
+                max_dist=max_dist,
+                path_format=path_format,
+            )
+
+    return t.elapsed_secs / len(graphs)
@@ -46,3 +46,42 @@ def track_time(graph_name, format, feat_size, msg_type, reduce_type):
             )
 
     return t.elapsed_secs / 3
+
+
+@utils.benchmark("time", timeout=600)
+@utils.parametrize("graph_name", ["pubmed", "ogbn-arxiv"])
+@utils.parametrize("feat_size", [8, 64])
+@utils.parametrize("reduce_type", ["sum", "max"])
+@utils.parametrize("max_ratio", [None, 1.5, 2.0])
+def track_time_degree_padding(graph_name, feat_size, reduce_type, max_ratio):
+    device = utils.get_bench_device()
+    graph = utils.get_graph(graph_name, "coo")
+    graph = graph.to(device)
+    graph.ndata["h"] = torch.randn(
+        (graph.num_nodes(), feat_size), device=device
+    )
+
+    reduct_udf_dict = {
+        "sum": lambda nodes: {"h_new": torch.sum(nodes.mailbox["x"], dim=1)},
+        "max": lambda nodes: {"h_new": torch.max(nodes.mailbox["x"], dim=1)[0]},
+    }
+    fill_value = {"sum": 0.0, "max": -float("inf")}[reduce_type]
+
+    def run():
+        graph.update_all(
+            lambda edges: {"x": edges.src["h"]}, reduct_udf_dict[reduce_type]
+        )
+
+    dgl.use_udf_degree_padding(max_ratio, fill_value)
+    try:
+        # dry run
+        run()
+
+        # timing
+        with utils.Timer() as t:
+            for i in range(3):
+                run()
+    finally:
+        dgl.use_udf_degree_padding(None)
+
+    return t.elapsed_secs / 3
@@ -15,6 +15,7 @@
 #include "./expand_indptr.h"
 #include "./index_select.h"
 #include "./random.h"
+#include "./shared_memory_tensors.h"
 
 #ifdef GRAPHBOLT_USE_CUDA
 #include "./cuda/gpu_cache.h"
@@ -84,6 +85,8 @@ TORCH_LIBRARY(graphbolt, m) {
   m.def("fused_csc_sampling_graph", &FusedCSCSamplingGraph::Create);
   m.def(
       "load_from_shared_memory", &FusedCSCSamplingGraph::LoadFromSharedMemory);
+  m.def("copy_tensors_to_shared_memory", &CopyTensorsToSharedMemory);
+  m.def("load_tensors_from_shared_memory", &LoadTensorsFromSharedMemory);
   m.def("unique_and_compact", &UniqueAndCompact);
   m.def("isin", &IsIn);
   m.def("index_select", &ops::IndexSelect);
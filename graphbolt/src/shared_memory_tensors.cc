@@ -0,0 +1,66 @@
+/**
+ *  Copyright (c) 2024 by Contributors
+ * @file shared_memory_tensors.cc
+ * @brief Source file of the operators sharing plain tensors across processes.
+ */
+#include "./shared_memory_tensors.h"
+
+#include <graphbolt/serialize.h>
+
+#include <memory>
+#include <utility>
+
+#include "./shared_memory_helper.h"
+
+namespace graphbolt {
+namespace sampling {
+
+static std::vector<torch::Tensor> ReadTensorsFromSharedMemoryHelper(
+    SharedMemoryHelper&& helper) {
+  helper.InitializeRead();
+  auto archive = helper.ReadTorchArchive();
+  int64_t num_tensors = read_from_archive<int64_t>(archive, "num_tensors");
+  std::vector<torch::Tensor> tensors;
+  for (int64_t i = 0; i < num_tensors; ++i) {
+    tensors.push_back(helper.ReadTorchTensor().value());
+  }
+  // The tensors returned by the helper do not own their memory. Let each of
+  // them hold a reference to the shared memory objects so that the segment
+  // lives as long as any of the tensors does.
+  auto holder =
+      std::make_shared<std::pair<SharedMemoryPtr, SharedMemoryPtr>>(
+          helper.ReleaseSharedMemory());
+  std::vector<torch::Tensor> ret;
+  for (const auto& tensor : tensors) {
+    ret.push_back(torch::from_blob(
+        tensor.data_ptr(), tensor.sizes(), [holder](void*) {},
+        tensor.options()));
+  }
+  return ret;
+}
+
+std::vector<torch::Tensor> CopyTensorsToSharedMemory(
+    const std::string& shared_memory_name,
+    const std::vector<torch::Tensor>& tensors) {
+  SharedMemoryHelper helper(shared_memory_name);
+  torch::serialize::OutputArchive archive;
+  archive.write("num_tensors", static_cast<int64_t>(tensors.size()));
+  helper.WriteTorchArchive(std::move(archive));
+  for (const auto& tensor : tensors) {
+    TORCH_CHECK(
+        tensor.device().is_cpu(),
+        "Only CPU tensors can be copied to shared memory.");
+    helper.WriteTorchTensor(tensor);
+  }
+  helper.Flush();
+  return ReadTensorsFromSharedMemoryHelper(std::move(helper));
+}
+
+std::vector<torch::Tensor> LoadTensorsFromSharedMemory(
+    const std::string& shared_memory_name) {
+  SharedMemoryHelper helper(shared_memory_name);
+  return ReadTensorsFromSharedMemoryHelper(std::move(helper));
+}
+
+}  // namespace sampling
+}  // namespace graphbolt
@@ -0,0 +1,47 @@
+/**
+ *  Copyright (c) 2024 by Contributors
+ * @file shared_memory_tensors.h
+ * @brief Operators to share plain tensors across processes through named
+ * shared memory.
+ */
+#ifndef GRAPHBOLT_SHARED_MEMORY_TENSORS_H_
+#define GRAPHBOLT_SHARED_MEMORY_TENSORS_H_
+
+#include <torch/script.h>
+
+#include <string>
+#include <vector>
+
+namespace graphbolt {
+namespace sampling {
+
+/**
+ * @brief Copy the given CPU tensors to a named shared memory segment.
+ *
+ * The segment is removed when all the returned tensors are released.
+ *
+ * @param shared_memory_name The name of the shared memory.
+ * @param tensors The tensors to copy.
+ *
+ * @return The copied tensors, backed by the shared memory.
+ */
+std::vector<torch::Tensor> CopyTensorsToSharedMemory(
+    const std::string& shared_memory_name,
+    const std::vector<torch::Tensor>& tensors);
+
+/**
+ * @brief Attach to the tensors copied to the shared memory by
+ * `CopyTensorsToSharedMemory` without copying them.
+ *
+ * @param shared_memory_name The name of the shared memory.
+ *
+ * @return The tensors backed by the shared memory, in the order they were
+ * written.
+ */
+std::vector<torch::Tensor> LoadTensorsFromSharedMemory(
+    const std::string& shared_memory_name);
+
+}  // namespace sampling
+}  // namespace graphbolt
+
+#endif  // GRAPHBOLT_SHARED_MEMORY_TENSORS_H_
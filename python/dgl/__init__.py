@@ -57,7 +57,11 @@ from .random import *
 from . import optim
 from .data.utils import load_graphs, save_graphs
 from .frame import LazyFeature
-from .global_config import is_libxsmm_enabled, use_libxsmm
+from .global_config import (
+    is_libxsmm_enabled,
+    use_libxsmm,
+    use_udf_degree_padding,
+)
 from .utils import apply_each
 from .mpops import *
 from .homophily import *
@@ -1,8 +1,11 @@
 """Utilities for batching/unbatching graphs."""
 from collections.abc import Mapping
 
-from . import backend as F, convert, utils
+import numpy as np
+
+from . import backend as F, heterograph_index, utils
 from .base import ALL, DGLError, EID, is_all, NID
+from .frame import Frame
 from .heterograph import DGLGraph
 from .heterograph_index import disjoint_union, slice_gidx
 
@@ -396,51 +399,107 @@ def unbatch(g, node_split=None, edge_split=None):
             )
         num_split = len(split)
 
-    node_split = {
-        k: F.asnumpy(split).tolist() for k, split in node_split.items()
-    }
-    edge_split = {
-        k: F.asnumpy(split).tolist() for k, split in edge_split.items()
-    }
-
-    # Split edges for each relation
-    edge_dict_per = [{} for i in range(num_split)]
+    # Build all the graphs in one pass: the edges and features are split
+    # with one call per tensor and every graph index is created directly,
+    # bypassing the argument checks of dgl.heterograph.
+    ntype_ids = {ntype: i for i, ntype in enumerate(g.ntypes)}
+    node_counts = np.stack(
+        [
+            F.asnumpy(node_split[ntype]).astype(np.int64).reshape(-1)
+            for ntype in g.ntypes
+        ],
+        axis=1,
+    )
+    node_offsets = np.cumsum(node_counts, 0) - node_counts
+    metagraph = g._graph.metagraph
+    rel_gidx_per = [[] for _ in range(num_split)]
+    edge_split_per = {}
     for rel in g.canonical_etypes:
-        srctype, etype, dsttype = rel
-        srcnid_off = dstnid_off = 0
+        srctype, _, dsttype = rel
+        stid, dtid = ntype_ids[srctype], ntype_ids[dsttype]
+        edge_counts = F.asnumpy(edge_split[rel]).astype(np.int64).reshape(-1)
+        edge_split_per[rel] = edge_counts.tolist()
         u, v = g.edges(order="eid", etype=rel)
-        us = F.split(u, edge_split[rel], 0)
-        vs = F.split(v, edge_split[rel], 0)
+        # Subtract the node offset of the graph of every edge at once.
+        src_shift, dst_shift, src_bound, dst_bound = [
+            F.copy_to(
+                F.repeat(F.tensor(x, g.idtype), F.tensor(edge_counts), 0),
+                g.device,
+            )
+            for x in [
+                node_offsets[:, stid],
+                node_offsets[:, dtid],
+                node_counts[:, stid],
+                node_counts[:, dtid],
+            ]
+        ]
+        u, v = u - src_shift, v - dst_shift
+        invalid = (u < 0) | (u >= src_bound) | (v < 0) | (v >= dst_bound)
+        if len(u) > 0 and F.as_scalar(F.sum(F.astype(invalid, F.int64), 0)):
+            raise DGLError(
+                "The edges of relation {} connect nodes of different "
+                "graphs with the given node_split and edge_split.".format(rel)
+            )
+        us = F.split(u, edge_split_per[rel], 0)
+        vs = F.split(v, edge_split_per[rel], 0)
         for i, (subu, subv) in enumerate(zip(us, vs)):
-            edge_dict_per[i][rel] = (subu - srcnid_off, subv - dstnid_off)
-            srcnid_off += node_split[srctype][i]
-            dstnid_off += node_split[dsttype][i]
-    num_nodes_dict_per = [
-        {k: split[i] for k, split in node_split.items()}
-        for i in range(num_split)
-    ]
-
-    # Create graphs
-    gs = [
-        convert.heterograph(edge_dict, num_nodes_dict, idtype=g.idtype)
-        for edge_dict, num_nodes_dict in zip(edge_dict_per, num_nodes_dict_per)
-    ]
+            rel_gidx_per[i].append(
+                heterograph_index.create_unitgraph_from_coo(
+                    1 if srctype == dsttype else 2,
+                    node_counts[i, stid],
+                    node_counts[i, dtid],
+                    subu,
+                    subv,
+                    ["coo", "csr", "csc"],
+                )
+            )
 
-    # Unbatch node features
+    # Unbatch node and edge features
+    node_frames_per = [[] for _ in range(num_split)]
     for ntype in g.ntypes:
-        for key, feat in g.nodes[ntype].data.items():
-            subfeats = F.split(feat, node_split[ntype], 0)
-            for subg, subf in zip(gs, subfeats):
-                subg.nodes[ntype].data[key] = subf
-
-    # Unbatch edge features
+        ntid = ntype_ids[ntype]
+        split = node_counts[:, ntid].tolist()
+        subfeats = {
+            key: F.split(feat, split, 0)
+            for key, feat in g.nodes[ntype].data.items()
+        }
+        for i in range(num_split):
+            node_frames_per[i].append(
+                Frame(
+                    {key: feats[i] for key, feats in subfeats.items()},
+                    num_rows=split[i],
+                )
+            )
+    edge_frames_per = [[] for _ in range(num_split)]
     for etype in g.canonical_etypes:
-        for key, feat in g.edges[etype].data.items():
-            subfeats = F.split(feat, edge_split[etype], 0)
-            for subg, subf in zip(gs, subfeats):
-                subg.edges[etype].data[key] = subf
+        split = edge_split_per[etype]
+        subfeats = {
+            key: F.split(feat, split, 0)
+            for key, feat in g.edges[etype].data.items()
+        }
+        for i in range(num_split):
+            edge_frames_per[i].append(
+                Frame(
+                    {key: feats[i] for key, feats in subfeats.items()},
+                    num_rows=split[i],
+                )
+            )
 
-    return gs
+    # Create graphs
+    return [
+        DGLGraph(
+            heterograph_index.create_heterograph_from_relations(
+                metagraph,
+                rel_gidx_per[i],
+                utils.toindex(node_counts[i], "int64"),
+            ),
+            g.ntypes,
+            g.etypes,
+            node_frames_per[i],
+            edge_frames_per[i],
+        )
+        for i in range(num_split)
+    ]
 
 
 def slice_batch(g, gid, store_ids=False):
@@ -483,29 +542,20 @@ def slice_batch(g, gid, store_ids=False):
           ndata_schemes={}
           edata_schemes={})
     """
+    # Read the batch sizes with one copy to host memory per type.
     start_nid = []
     num_nodes = []
     for ntype in g.ntypes:
-        batch_num_nodes = g.batch_num_nodes(ntype)
-        num_nodes.append(F.as_scalar(batch_num_nodes[gid]))
-        if gid == 0:
-            start_nid.append(0)
-        else:
-            start_nid.append(
-                F.as_scalar(F.sum(F.slice_axis(batch_num_nodes, 0, 0, gid), 0))
-            )
+        batch_num_nodes = F.asnumpy(g.batch_num_nodes(ntype))
+        num_nodes.append(int(batch_num_nodes[gid]))
+        start_nid.append(int(batch_num_nodes[:gid].sum()))
 
     start_eid = []
     num_edges = []
     for etype in g.canonical_etypes:
-        batch_num_edges = g.batch_num_edges(etype)
-        num_edges.append(F.as_scalar(batch_num_edges[gid]))
-        if gid == 0:
-            start_eid.append(0)
-        else:
-            start_eid.append(
-                F.as_scalar(F.sum(F.slice_axis(batch_num_edges, 0, 0, gid), 0))
-            )
+        batch_num_edges = F.asnumpy(g.batch_num_edges(etype))
+        num_edges.append(int(batch_num_edges[gid]))
+        start_eid.append(int(batch_num_edges[:gid].sum()))
 
     # Slice graph structure
     gidx = slice_gidx(
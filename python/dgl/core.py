@@ -5,6 +5,7 @@ import numpy as np
 from . import backend as F, function as fn, ops
 from .base import ALL, dgl_warning, DGLError, EID, is_all, NID
 from .frame import Frame
+from .global_config import get_udf_degree_padding
 from .udf import EdgeBatch, NodeBatch
 
 
@@ -100,7 +101,9 @@ def invoke_udf_reduce(graph, func, msgdata, *, orig_nid=None):
     """Invoke user-defined reduce function on all the nodes in the graph.
 
     It analyzes the graph, groups nodes by their degrees and applies the UDF on each
-    group -- a strategy called *degree-bucketing*.
+    group -- a strategy called *degree-bucketing*. If degree padding is turned on by
+    :func:`dgl.use_udf_degree_padding`, nodes of close degrees are grouped together
+    and their mailboxes are padded to the largest degree of the group.
 
     Parameters
     ----------
@@ -125,31 +128,76 @@ def invoke_udf_reduce(graph, func, msgdata, *, orig_nid=None):
     ntype = graph.dsttypes[0]
     ntid = graph.get_ntype_id_from_dst(ntype)
     dstdata = graph._node_frames[ntid]
-    msgdata = Frame(msgdata)
+    padding = get_udf_degree_padding()
 
     # degree bucketing
-    unique_degs, bucketor = _bucketing(degs)
+    max_degs, bucketor = _bucketing(
+        degs, max_ratio=None if padding is None else padding[0]
+    )
+    node_bkts = bucketor(nodes)
+    nonzero_bkts = [node_bkts[i] for i, deg in enumerate(max_degs) if deg > 0]
+    if len(nonzero_bkts) > 0:
+        # the incoming edges of all the buckets, grouped by node
+        eids = F.asnumpy(graph.in_edges(F.cat(nonzero_bkts, 0), form="eid"))
+    padded_msgdata = None
+    eid_offset = 0
     bkt_rsts = []
     bkt_nodes = []
-    for deg, node_bkt, orig_nid_bkt in zip(
-        unique_degs, bucketor(nodes), bucketor(orig_nid)
+    for deg, node_bkt, orig_nid_bkt, deg_bkt in zip(
+        max_degs, node_bkts, bucketor(orig_nid), bucketor(degs)
     ):
         if deg == 0:
             # skip reduce function for zero-degree nodes
             continue
+        deg = int(deg)
         bkt_nodes.append(node_bkt)
         ndata_bkt = dstdata.subframe(node_bkt)
+        deg_bkt = F.asnumpy(deg_bkt)
+        num_eids = int(deg_bkt.sum())
+        eid_bkt = eids[eid_offset : eid_offset + num_eids]
+        eid_offset += num_eids
 
         # order the incoming edges per node by edge ID
-        eid_bkt = F.zerocopy_to_numpy(graph.in_edges(node_bkt, form="eid"))
-        assert len(eid_bkt) == deg * len(node_bkt)
-        eid_bkt = np.sort(eid_bkt.reshape((len(node_bkt), deg)), 1)
-        eid_bkt = F.zerocopy_from_numpy(eid_bkt.flatten())
+        if deg_bkt[0] == deg:
+            eid_bkt = np.sort(eid_bkt.reshape((len(node_bkt), deg)), 1)
+            bkt_msgdata = msgdata
+        else:
+            # pad the mailboxes of the nodes of lower degrees with a message
+            # appended after the real ones
+            seg = np.repeat(np.arange(len(node_bkt)), deg_bkt)
+            pos = np.arange(num_eids) - np.repeat(
+                np.cumsum(deg_bkt) - deg_bkt, deg_bkt
+            )
+            padded_eid_bkt = np.full(
+                (len(node_bkt), deg), graph.num_edges(), dtype=eid_bkt.dtype
+            )
+            padded_eid_bkt[seg, pos] = eid_bkt[np.lexsort((eid_bkt, seg))]
+            eid_bkt = padded_eid_bkt
+            if padded_msgdata is None:
+                padded_msgdata = {
+                    k: F.cat(
+                        [
+                            msg,
+                            F.zeros(
+                                (1,) + F.shape(msg)[1:],
+                                F.dtype(msg),
+                                F.context(msg),
+                            )
+                            + padding[1],
+                        ],
+                        0,
+                    )
+                    for k, msg in msgdata.items()
+                }
+            bkt_msgdata = padded_msgdata
+        eid_bkt = F.copy_to(
+            F.zerocopy_from_numpy(eid_bkt.flatten()), F.context(node_bkt)
+        )
 
-        msgdata_bkt = msgdata.subframe(eid_bkt)
         # reshape all msg tensors to (num_nodes_bkt, degree, feat_size)
         maildata = {}
-        for k, msg in msgdata_bkt.items():
+        for k, msg in bkt_msgdata.items():
+            msg = F.gather_row(msg, eid_bkt)
             newshape = (len(node_bkt), deg) + F.shape(msg)[1:]
             maildata[k] = F.reshape(msg, newshape)
         # invoke udf
@@ -174,34 +222,51 @@ def invoke_udf_reduce(graph, func, msgdata, *, orig_nid=None):
     return retf
 
 
-def _bucketing(val):
+def _bucketing(val, max_ratio=None):
     """Internal function to create groups on the values.
 
+    The values are sorted once and split into runs of equal values.
+
     Parameters
     ----------
     val : Tensor
         Value tensor.
+    max_ratio : float, optional
+        If given, consecutive runs are merged into a group as long as the
+        largest value of the group is at most ``max_ratio`` times its
+        smallest value.
 
     Returns
     -------
-    unique_val : Tensor
-        Unique values.
+    max_val : numpy.ndarray
+        The largest value of every group, i.e. the unique values if
+        :attr:`max_ratio` is None.
     bucketor : callable[Tensor -> list[Tensor]]
         A bucketing function that splits the given tensor data as the same
         way of how the :attr:`val` tensor is grouped.
     """
     sorted_val, idx = F.sort_1d(val)
-    unique_val = F.asnumpy(F.unique(sorted_val))
-    bkt_idx = []
-    for v in unique_val:
-        eqidx = F.nonzero_1d(F.equal(sorted_val, v))
-        bkt_idx.append(F.gather_row(idx, eqidx))
+    sorted_val = F.asnumpy(sorted_val)
+    if len(sorted_val) == 0:
+        return sorted_val, lambda data: []
+    starts = np.flatnonzero(
+        np.concatenate([[True], sorted_val[1:] != sorted_val[:-1]])
+    )
+    if max_ratio is not None:
+        unique_val = sorted_val[starts]
+        merged_starts = []
+        i = 0
+        while i < len(starts):
+            merged_starts.append(starts[i])
+            i = np.searchsorted(unique_val, unique_val[i] * max_ratio, "right")
+        starts = np.array(merged_starts)
+    ends = np.append(starts[1:], len(sorted_val))
+    sizes = (ends - starts).tolist()
 
     def bucketor(data):
-        bkts = [F.gather_row(data, idx) for idx in bkt_idx]
-        return bkts
+        return F.split(F.gather_row(data, idx), sizes, 0)
 
-    return unique_val, bucketor
+    return sorted_val[ends - 1], bucketor
 
 
 def data_dict_to_list(graph, data_dict, func, target):
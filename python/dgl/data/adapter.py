@@ -2,6 +2,7 @@
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -204,24 +205,62 @@ class AsNodePredDataset(DGLDataset):
         self.test_idx = F.nonzero_1d(ndata["test_mask"])
 
 
-def negative_sample(g, num_samples):
+def negative_sample(
+    g, num_samples, batch_size=1 << 20, num_workers=1, seed=None
+):
     """Random sample negative edges from graph, excluding self-loops,
     the result samples might be less than num_samples
+
+    The candidate node pairs are drawn and checked against the graph in
+    batches of at most ``batch_size`` pairs, by ``num_workers`` threads, until
+    ``num_samples`` distinct negative edges are found, so that the memory does
+    not grow with the number of edges of the graph. The pairs are encoded as
+    single integers to remove the duplicates.
+
+    If ``seed`` is None, the samples are drawn with a seed taken from the
+    global NumPy random state, so that they are reproducible with
+    ``np.random.seed``.
     """
     num_nodes = g.num_nodes()
+    if seed is None:
+        seed = np.random.randint(np.iinfo(np.int32).max)
+    rng = np.random.default_rng(seed)
     redundancy = _calc_redundancy(num_samples, g.num_edges(), num_nodes**2)
-    sample_size = int(num_samples * (1 + redundancy))
-    edges = np.random.randint(0, num_nodes, size=(2, sample_size))
-    edges = np.unique(edges, axis=1)
-    # remove self loop
-    mask_self_loop = edges[0] == edges[1]
-    # remove existing edges
-    has_edges = F.asnumpy(g.has_edges_between(edges[0], edges[1]))
-    mask = ~(np.logical_or(mask_self_loop, has_edges))
-    edges = edges[:, mask]
-    if edges.shape[1] >= num_samples:
-        edges = edges[:, :num_samples]
-    return edges
+    chunk_size = max(batch_size // num_workers, 1)
+
+    def _is_negative(keys):
+        src, dst = keys // num_nodes, keys % num_nodes
+        has_edges = F.asnumpy(g.has_edges_between(src, dst))
+        return ~has_edges & (src != dst)
+
+    samples = []
+    num_found = num_unique = 0
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        while True:
+            sample_size = min(
+                int((num_samples - num_found) * (1 + redundancy)) + 1,
+                batch_size,
+            )
+            keys = rng.integers(0, num_nodes**2, size=sample_size)
+            chunks = [
+                keys[start : start + chunk_size]
+                for start in range(0, sample_size, chunk_size)
+            ]
+            mask = np.concatenate(list(executor.map(_is_negative, chunks)))
+            samples.append(keys[mask])
+            num_found += len(samples[-1])
+            if num_found < num_samples and len(samples[-1]) > 0:
+                continue
+            # Remove the duplicates, keeping the sampling order, and draw
+            # more samples unless no new negative edge could be found.
+            samples = np.concatenate(samples)
+            _, idx = np.unique(samples, return_index=True)
+            samples = [samples[np.sort(idx)]]
+            if len(idx) >= num_samples or len(idx) == num_unique:
+                break
+            num_found = num_unique = len(idx)
+    samples = np.concatenate(samples)[:num_samples]
+    return np.stack([samples // num_nodes, samples % num_nodes])
 
 
 class AsLinkPredDataset(DGLDataset):
@@ -0,0 +1,406 @@
+"""Random-access archive of many small graphs."""
+from __future__ import absolute_import
+
+import json
+import os
+
+import numpy as np
+
+from .. import backend as F
+from ..base import DGLError
+from ..convert import heterograph
+from ..dataloading.base import CollatedBatch
+from ..utils import concat_ranges
+
+__all__ = ["save_graph_archive", "GraphArchiveDataset"]
+
+_ARCHIVE_VERSION = 1
+_META_FILE = "archive.json"
+
+
+def _schema(frame):
+    """Returns the name, dtype and per-item shape of every feature in a
+    node or edge frame."""
+    schema = []
+    for name, value in frame.items():
+        value = F.asnumpy(value)
+        schema.append(
+            {
+                "name": name,
+                "dtype": value.dtype.name,
+                "shape": list(value.shape[1:]),
+            }
+        )
+    return schema
+
+
+def _check_schema(frame, schema, what):
+    if sorted(frame.keys()) != sorted(field["name"] for field in schema):
+        raise DGLError(
+            "All the graphs of an archive must have the same {} features, "
+            "expect {}, got {}.".format(
+                what, [field["name"] for field in schema], list(frame.keys())
+            )
+        )
+
+
+def save_graph_archive(path, g_list, labels=None):
+    r"""Save graphs and optionally their labels to a graph archive.
+
+    Unlike :func:`save_graphs`, a graph archive can be read one graph at a
+    time with :class:`GraphArchiveDataset` without loading the whole file.
+    The archive is a directory holding the edges and the features of all the
+    graphs concatenated in raw binary files, and the offsets of every graph
+    in them.
+
+    The graphs are written one by one, so :attr:`g_list` can be a generator
+    over more graphs than fit in memory. All the graphs must have the same
+    node and edge types, ID type, and feature names, dtypes and shapes.
+
+    Parameters
+    ----------
+    path : str
+        The directory to store the archive.
+    g_list : iterable[DGLGraph]
+        The graphs to be saved.
+    labels : dict[str, Tensor], optional
+        The graph labels, whose first dimension is the number of graphs.
+
+    Examples
+    --------
+    >>> import dgl
+    >>> import torch as th
+    >>> from dgl.data.utils import save_graph_archive
+    >>> g1 = dgl.graph(([0, 1, 2], [1, 2, 3]))
+    >>> g2 = dgl.graph(([0, 2], [2, 3]))
+    >>> save_graph_archive("./data", [g1, g2], {"glabel": th.tensor([0, 1])})
+
+    See Also
+    --------
+    GraphArchiveDataset
+    """
+    if os.path.exists(path) and not os.path.isdir(path):
+        raise DGLError("Path {} is an existing file.".format(path))
+    os.makedirs(path, exist_ok=True)
+    labels = {} if labels is None else labels
+
+    meta = None
+    files = {}
+    node_offsets = edge_offsets = None
+    num_graphs = 0
+    try:
+        for g in g_list:
+            if meta is None:
+                meta = {
+                    "version": _ARCHIVE_VERSION,
+                    "idtype": F.reverse_data_type_dict[g.idtype],
+                    "ntypes": g.ntypes,
+                    "canonical_etypes": [list(c) for c in g.canonical_etypes],
+                    "ndata": [_schema(g.nodes[nt].data) for nt in g.ntypes],
+                    "edata": [
+                        _schema(g.edges[c].data) for c in g.canonical_etypes
+                    ],
+                }
+                node_offsets = np.zeros(len(g.ntypes), dtype=np.int64)
+                edge_offsets = np.zeros(len(g.canonical_etypes), dtype=np.int64)
+                _write(files, path, "node_offsets", node_offsets)
+                _write(files, path, "edge_offsets", edge_offsets)
+            elif (
+                g.ntypes != meta["ntypes"]
+                or [list(c) for c in g.canonical_etypes]
+                != meta["canonical_etypes"]
+                or F.reverse_data_type_dict[g.idtype] != meta["idtype"]
+            ):
+                raise DGLError(
+                    "All the graphs of an archive must have the same node "
+                    "types, edge types and ID type."
+                )
+
+            for i, ntype in enumerate(g.ntypes):
+                frame = g.nodes[ntype].data
+                _check_schema(frame, meta["ndata"][i], "node")
+                for j, field in enumerate(meta["ndata"][i]):
+                    _append(
+                        files, path, "ndata_{}_{}".format(i, j), frame, field
+                    )
+                node_offsets[i] += g.num_nodes(ntype)
+            for i, etype in enumerate(g.canonical_etypes):
+                src, dst = g.edges(etype=etype)
+                edges = np.stack([F.asnumpy(src), F.asnumpy(dst)], axis=1)
+                _write(files, path, "edges_{}".format(i), edges)
+                frame = g.edges[etype].data
+                _check_schema(frame, meta["edata"][i], "edge")
+                for j, field in enumerate(meta["edata"][i]):
+                    _append(
+                        files, path, "edata_{}_{}".format(i, j), frame, field
+                    )
+                edge_offsets[i] += g.num_edges(etype)
+            _write(files, path, "node_offsets", node_offsets)
+            _write(files, path, "edge_offsets", edge_offsets)
+            num_graphs += 1
+    finally:
+        for f in files.values():
+            f.close()
+    if meta is None:
+        raise DGLError("Expect at least one graph to save.")
+
+    meta["num_graphs"] = num_graphs
+    meta["labels"] = []
+    for j, (name, value) in enumerate(labels.items()):
+        value = F.asnumpy(value)
+        if len(value) != num_graphs:
+            raise DGLError(
+                "Expect label {} to have {} rows, got {}.".format(
+                    name, num_graphs, len(value)
+                )
+            )
+        np.ascontiguousarray(value).tofile(
+            os.path.join(path, "labels_{}.bin".format(j))
+        )
+        meta["labels"].append(
+            {
+                "name": name,
+                "dtype": value.dtype.name,
+                "shape": list(value.shape[1:]),
+            }
+        )
+    with open(os.path.join(path, _META_FILE), "w") as f:
+        json.dump(meta, f)
+
+
+def _write(files, path, key, array):
+    if key not in files:
+        files[key] = open(os.path.join(path, key + ".bin"), "wb")
+    np.ascontiguousarray(array).tofile(files[key])
+
+
+def _append(files, path, key, frame, field):
+    value = F.asnumpy(frame[field["name"]])
+    if (
+        value.dtype.name != field["dtype"]
+        or list(value.shape[1:]) != field["shape"]
+    ):
+        raise DGLError(
+            "Expect feature {} of dtype {} and shape {}, got {} and {}.".format(
+                field["name"],
+                field["dtype"],
+                field["shape"],
+                value.dtype.name,
+                list(value.shape[1:]),
+            )
+        )
+    _write(files, path, key, value)
+
+
+class GraphArchiveDataset(object):
+    r"""Dataset over a graph archive written by :func:`save_graph_archive`.
+
+    The structure, features and labels of the graphs are memory-mapped, and
+    indexing the dataset only reads the requested graph. Opening a dataset
+    over millions of graphs is therefore instant, and the DataLoader
+    workers share the page cache instead of each holding a copy of the
+    data.
+
+    Parameters
+    ----------
+    path : str
+        The directory of the archive.
+
+    Examples
+    --------
+    Following the example in :func:`save_graph_archive`.
+
+    >>> from dgl.data.utils import GraphArchiveDataset
+    >>> dataset = GraphArchiveDataset("./data")
+    >>> g, labels = dataset[1]  # g is g2, labels is {"glabel": tensor(1)}
+    """
+
+    def __init__(self, path):
+        meta_path = os.path.join(path, _META_FILE)
+        if not os.path.exists(meta_path):
+            raise DGLError("{} is not a graph archive.".format(path))
+        with open(meta_path) as f:
+            self._meta = json.load(f)
+        if self._meta["version"] != _ARCHIVE_VERSION:
+            raise DGLError(
+                "Invalid graph archive version {}.".format(
+                    self._meta["version"]
+                )
+            )
+        self._path = path
+        self._arrays = None
+
+    def __getstate__(self):
+        # The workers of a DataLoader map the files themselves.
+        state = self.__dict__.copy()
+        state["_arrays"] = None
+        return state
+
+    def _map(self, key, dtype, shape):
+        file_path = os.path.join(self._path, key + ".bin")
+        if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
+            return np.empty((0,) + tuple(shape), dtype=dtype)
+        return np.memmap(file_path, dtype=dtype, mode="r").reshape(
+            (-1,) + tuple(shape)
+        )
+
+    def _open(self):
+        meta = self._meta
+        num_ntypes = len(meta["ntypes"])
+        num_etypes = len(meta["canonical_etypes"])
+        arrays = {
+            "node_offsets": self._map("node_offsets", np.int64, [num_ntypes]),
+            "edge_offsets": self._map("edge_offsets", np.int64, [num_etypes]),
+        }
+        for i in range(num_etypes):
+            key = "edges_{}".format(i)
+            arrays[key] = self._map(key, meta["idtype"], [2])
+        for kind in ["ndata", "edata"]:
+            for i, schema in enumerate(meta[kind]):
+                for j, field in enumerate(schema):
+                    key = "{}_{}_{}".format(kind, i, j)
+                    arrays[key] = self._map(key, field["dtype"], field["shape"])
+        for j, field in enumerate(meta["labels"]):
+            key = "labels_{}".format(j)
+            arrays[key] = self._map(key, field["dtype"], field["shape"])
+        self._arrays = arrays
+
+    def __len__(self):
+        return self._meta["num_graphs"]
+
+    def __getitem__(self, idx):
+        r"""Get the idx-th graph and its labels.
+
+        Parameters
+        ----------
+        idx : int
+            The graph index.
+
+        Returns
+        -------
+        (:class:`dgl.DGLGraph`, dict[str, Tensor])
+            The graph and its labels.
+        """
+        if idx < 0:
+            idx += len(self)
+        if idx < 0 or idx >= len(self):
+            raise IndexError(
+                "Index {} out of range for {} graphs.".format(idx, len(self))
+            )
+        g, labels = self.batch([idx])
+        return g, {name: label[0] for name, label in labels.items()}
+
+    def __getitems__(self, indices):
+        # Called by the PyTorch DataLoader with all the indices of a
+        # minibatch, which skips building the graphs one by one.
+        return CollatedBatch(self.batch(indices))
+
+    def batch(self, indices):
+        r"""Get the batched graph of the graphs of the given indices, and
+        their stacked labels.
+
+        The result is the same as batching the graphs returned by
+        :meth:`__getitem__` with :func:`dgl.batch`, but the batched graph
+        is built directly from the concatenated structure and features in
+        the archive with a few vectorized gathers, without building the
+        graphs one by one. :class:`~dgl.dataloading.GraphDataLoader` uses it
+        to collate the minibatches.
+
+        Parameters
+        ----------
+        indices : list[int] or Tensor
+            The graph indices.
+
+        Returns
+        -------
+        (:class:`dgl.DGLGraph`, dict[str, Tensor])
+            The batched graph and the labels of the graphs.
+        """
+        if self._arrays is None:
+            self._open()
+        meta, arrays = self._meta, self._arrays
+        idtype = F.data_type_dict[meta["idtype"]]
+        indices = np.array(
+            F.asnumpy(indices) if F.is_tensor(indices) else indices,
+            dtype=np.int64,
+        ).reshape(-1)
+        indices[indices < 0] += len(self)
+        node_starts = arrays["node_offsets"][indices]
+        node_counts = arrays["node_offsets"][indices + 1] - node_starts
+        edge_starts = arrays["edge_offsets"][indices]
+        edge_counts = arrays["edge_offsets"][indices + 1] - edge_starts
+        # The offsets of the nodes of each graph in the batched graph.
+        node_shifts = np.cumsum(node_counts, 0) - node_counts
+
+        def _read(key, starts, counts):
+            if len(starts) == 1:
+                return np.array(arrays[key][starts[0] : starts[0] + counts[0]])
+            return arrays[key][concat_ranges(starts, counts)]
+
+        ntype_ids = {ntype: i for i, ntype in enumerate(meta["ntypes"])}
+        data_dict = {}
+        for i, (src_type, etype, dst_type) in enumerate(
+            meta["canonical_etypes"]
+        ):
+            edges = _read(
+                "edges_{}".format(i), edge_starts[:, i], edge_counts[:, i]
+            )
+            src = edges[:, 0] + np.repeat(
+                node_shifts[:, ntype_ids[src_type]], edge_counts[:, i]
+            )
+            dst = edges[:, 1] + np.repeat(
+                node_shifts[:, ntype_ids[dst_type]], edge_counts[:, i]
+            )
+            data_dict[(src_type, etype, dst_type)] = (
+                F.zerocopy_from_numpy(src),
+                F.zerocopy_from_numpy(dst),
+            )
+        g = heterograph(
+            data_dict,
+            num_nodes_dict={
+                ntype: int(node_counts[:, i].sum())
+                for i, ntype in enumerate(meta["ntypes"])
+            },
+            idtype=idtype,
+        )
+        if len(indices) > 1:
+            g.set_batch_num_nodes(
+                {
+                    ntype: F.tensor(node_counts[:, i], idtype)
+                    for i, ntype in enumerate(meta["ntypes"])
+                }
+            )
+            g.set_batch_num_edges(
+                {
+                    tuple(etype): F.tensor(edge_counts[:, i], idtype)
+                    for i, etype in enumerate(meta["canonical_etypes"])
+                }
+            )
+
+        for i, ntype in enumerate(meta["ntypes"]):
+            for j, field in enumerate(meta["ndata"][i]):
+                g.nodes[ntype].data[field["name"]] = F.zerocopy_from_numpy(
+                    _read(
+                        "ndata_{}_{}".format(i, j),
+                        node_starts[:, i],
+                        node_counts[:, i],
+                    )
+                )
+        for i, etype in enumerate(meta["canonical_etypes"]):
+            for j, field in enumerate(meta["edata"][i]):
+                g.edges[tuple(etype)].data[field["name"]] = (
+                    F.zerocopy_from_numpy(
+                        _read(
+                            "edata_{}_{}".format(i, j),
+                            edge_starts[:, i],
+                            edge_counts[:, i],
+                        )
+                    )
+                )
+        labels = {
+            field["name"]: F.zerocopy_from_numpy(
+                np.array(arrays["labels_{}".format(j)][indices])
+            )
+            for j, field in enumerate(meta["labels"])
+        }
+        return g, labels
@@ -15,6 +15,7 @@ import requests
 from tqdm.auto import tqdm
 
 from .. import backend as F
+from .graph_archive import GraphArchiveDataset, save_graph_archive
 from .graph_serialize import load_graphs, load_labels, save_graphs
 from .tensor_serialize import load_tensors, save_tensors
 
@@ -29,6 +30,8 @@ __all__ = [
     "save_graphs",
     "load_graphs",
     "load_labels",
+    "save_graph_archive",
+    "GraphArchiveDataset",
     "save_tensors",
     "load_tensors",
     "add_nodepred_split",
@@ -161,6 +161,18 @@ def set_dst_lazy_features(g, feature_names):
     return _set_lazy_features(g.dstnodes, g.dstdata, feature_names)
 
 
+class CollatedBatch(list):
+    """A minibatch collated by the dataset itself.
+
+    The PyTorch DataLoader calls the ``__getitems__`` method of a map-style
+    dataset, if any, with all the indices of a minibatch. A dataset that can
+    build the whole minibatch at once, e.g.
+    :class:`~dgl.data.utils.GraphArchiveDataset`, returns it as a
+    :class:`CollatedBatch`, which :class:`~dgl.dataloading.GraphCollator`
+    returns as is instead of collating the items one by one.
+    """
+
+
 class Sampler(object):
     """Base class for graph samplers.
 
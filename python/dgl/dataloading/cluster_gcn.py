@@ -4,11 +4,54 @@ import pickle
 
 import numpy as np
 
-from .. import backend as F
+from .. import backend as F, utils
 from ..base import DGLError
+from ..convert import graph as create_graph
 from ..partition import metis_partition_assignment
 from .base import Sampler, set_edge_lazy_features, set_node_lazy_features
 
+# The arrays of the partition cache, each stored in "<name>.npy".
+_CACHE_ARRAYS = (
+    "partition_offset",
+    "partition_node_ids",
+    "edge_offset",
+    "edge_src",
+    "edge_dst",
+    "edge_dst_part",
+    "edge_ids",
+)
+
+
+def _partition_layout(g, partition_ids, k):
+    """Lays out the nodes partition by partition and sorts the edges by the
+    partitions of their source and destination nodes, so that the edges
+    within a partition are a contiguous block.
+
+    The nodes are renumbered by their position in the layout, which is used
+    for the end nodes of the edges.
+    """
+    partition_ids = partition_ids.astype(np.int64)
+    partition_node_ids = np.argsort(partition_ids, kind="stable")
+    partition_offset = np.insert(
+        np.cumsum(np.bincount(partition_ids, minlength=k)), 0, 0
+    )
+    new_ids = np.empty_like(partition_node_ids)
+    new_ids[partition_node_ids] = np.arange(len(partition_node_ids))
+    src, dst = g.edges()
+    src, dst = F.asnumpy(src).astype(np.int64), F.asnumpy(dst).astype(np.int64)
+    src_part, dst_part = partition_ids[src], partition_ids[dst]
+    edge_ids = np.lexsort((dst_part, src_part))
+    edge_offset = np.insert(np.cumsum(np.bincount(src_part, minlength=k)), 0, 0)
+    return {
+        "partition_offset": partition_offset,
+        "partition_node_ids": partition_node_ids,
+        "edge_offset": edge_offset,
+        "edge_src": new_ids[src[edge_ids]],
+        "edge_dst": new_ids[dst[edge_ids]],
+        "edge_dst_part": dst_part[edge_ids],
+        "edge_ids": edge_ids,
+    }
+
 
 class ClusterGCNSampler(Sampler):
     """Cluster sampler from `Cluster-GCN: An Efficient Algorithm for Training
@@ -22,6 +65,11 @@ class ClusterGCNSampler(Sampler):
     partition IDs, take the union of all nodes in those partitions, and return an
     induced subgraph in its :attr:`sample` method.
 
+    The cache lays out the nodes partition by partition, and sorts the edges by the
+    partitions of their end nodes, so that the edges within a partition are a
+    contiguous block. The cached arrays are memory-mapped, and a subgraph is assembled
+    from the blocks of the selected partitions and the edges between them.
+
     Parameters
     ----------
     g : DGLGraph
@@ -30,8 +78,14 @@ class ClusterGCNSampler(Sampler):
         The number of partitions.
     cache_path : str
         The path to the cache directory for storing the partition result.
+        A cache file written by previous versions is also accepted.
     balance_ntypes, balkance_edges, mode :
         Passed to :func:`dgl.metis_partition_assignment`.
+    cache_ndata : list[str], optional
+        The node data to store in the cache directory in the layout of the
+        partitions, so that the features of a partition are read contiguously
+        instead of being gathered from ``g.ndata``. They are stored when the
+        cache is created.
     prefetch_ndata : list[str], optional
         The node data to prefetch for the subgraph.
 
@@ -66,37 +120,49 @@ class ClusterGCNSampler(Sampler):
         self,
         g,
         k,
-        cache_path="cluster_gcn.pkl",
+        cache_path="cluster_gcn",
         balance_ntypes=None,
         balance_edges=False,
         mode="k-way",
         prefetch_ndata=None,
         prefetch_edata=None,
         output_device=None,
+        cache_ndata=None,
     ):
         super().__init__()
-        if os.path.exists(cache_path):
+        self.cache_path = cache_path
+        self.cache_ndata = cache_ndata or []
+        self._arrays = None
+        if os.path.isfile(cache_path):
+            # A pickled partition result of previous versions.
             try:
                 with open(cache_path, "rb") as f:
-                    (
-                        self.partition_offset,
-                        self.partition_node_ids,
-                    ) = pickle.load(f)
+                    partition_offset, partition_node_ids = pickle.load(f)
             except (EOFError, TypeError, ValueError):
                 raise DGLError(
                     f"The contents in the cache file {cache_path} is invalid. "
                     f"Please remove the cache file {cache_path} or specify another path."
                 )
-            if len(self.partition_offset) != k + 1:
-                raise DGLError(
-                    f"Number of partitions in the cache does not match the value of k. "
-                    f"Please remove the cache file {cache_path} or specify another path."
-                )
-            if len(self.partition_node_ids) != g.num_nodes():
-                raise DGLError(
-                    f"Number of nodes in the cache does not match the given graph. "
-                    f"Please remove the cache file {cache_path} or specify another path."
-                )
+            self._check_cache(
+                g, k, len(partition_offset), len(partition_node_ids)
+            )
+            partition_ids = np.empty(g.num_nodes(), dtype=np.int64)
+            partition_ids[F.asnumpy(partition_node_ids)] = np.repeat(
+                np.arange(k), np.diff(F.asnumpy(partition_offset))
+            )
+            self._arrays = _partition_layout(g, partition_ids, k)
+            self._cache_dir = None
+            self.cache_ndata = []
+        elif os.path.isdir(cache_path):
+            self._cache_dir = cache_path
+            arrays = self._load_arrays()
+            self._check_cache(
+                g,
+                k,
+                len(arrays["partition_offset"]),
+                len(arrays["partition_node_ids"]),
+                len(arrays["edge_ids"]),
+            )
         else:
             partition_ids = metis_partition_assignment(
                 g,
@@ -105,24 +171,76 @@ class ClusterGCNSampler(Sampler):
                 balance_edges=balance_edges,
                 mode=mode,
             )
-            partition_ids = F.asnumpy(partition_ids)
-            partition_node_ids = np.argsort(partition_ids)
-            partition_size = F.zerocopy_from_numpy(
-                np.bincount(partition_ids, minlength=k)
-            )
-            partition_offset = F.zerocopy_from_numpy(
-                np.insert(np.cumsum(partition_size), 0, 0)
-            )
-            partition_node_ids = F.zerocopy_from_numpy(partition_node_ids)
-            with open(cache_path, "wb") as f:
-                pickle.dump((partition_offset, partition_node_ids), f)
-            self.partition_offset = partition_offset
-            self.partition_node_ids = partition_node_ids
+            arrays = _partition_layout(g, F.asnumpy(partition_ids), k)
+            for name in self.cache_ndata:
+                arrays["ndata_" + name] = F.asnumpy(
+                    F.gather_row(
+                        g.ndata[name],
+                        F.zerocopy_from_numpy(arrays["partition_node_ids"]),
+                    )
+                )
+            os.makedirs(cache_path)
+            for name, array in arrays.items():
+                np.save(os.path.join(cache_path, name + ".npy"), array)
+            self._cache_dir = cache_path
 
         self.prefetch_ndata = prefetch_ndata or []
         self.prefetch_edata = prefetch_edata or []
         self.output_device = output_device
 
+    def _check_cache(self, g, k, num_offsets, num_nodes, num_edges=None):
+        if num_offsets != k + 1:
+            raise DGLError(
+                f"Number of partitions in the cache does not match the value of k. "
+                f"Please remove the cache file {self.cache_path} or specify another path."
+            )
+        if num_nodes != g.num_nodes() or (
+            num_edges is not None and num_edges != g.num_edges()
+        ):
+            raise DGLError(
+                f"Number of nodes in the cache does not match the given graph. "
+                f"Please remove the cache file {self.cache_path} or specify another path."
+            )
+
+    def _load_arrays(self):
+        if self._arrays is None:
+            try:
+                # Copy-on-write mappings can be wrapped as tensors without
+                # copying the arrays.
+                self._arrays = {
+                    name: np.load(
+                        os.path.join(self._cache_dir, name + ".npy"),
+                        mmap_mode="c",
+                    )
+                    for name in _CACHE_ARRAYS
+                    + tuple("ndata_" + name for name in self.cache_ndata)
+                }
+            except (OSError, ValueError):
+                raise DGLError(
+                    f"The contents in the cache directory {self._cache_dir} is invalid. "
+                    f"Please remove the cache directory {self._cache_dir} or specify "
+                    f"another path."
+                )
+        return self._arrays
+
+    def __getstate__(self):
+        # The memory-mapped arrays are mapped again in the worker processes
+        # rather than copied.
+        state = self.__dict__.copy()
+        if state["_cache_dir"] is not None:
+            state["_arrays"] = None
+        return state
+
+    @property
+    def partition_offset(self):
+        """The offsets of the partitions in :attr:`partition_node_ids`."""
+        return F.zerocopy_from_numpy(self._load_arrays()["partition_offset"])
+
+    @property
+    def partition_node_ids(self):
+        """The node IDs sorted by partition."""
+        return F.zerocopy_from_numpy(self._load_arrays()["partition_node_ids"])
+
     def sample(self, g, partition_ids):  # pylint: disable=arguments-differ
         """Sampling function.
 
@@ -138,18 +256,53 @@ class ClusterGCNSampler(Sampler):
         DGLGraph
             The sampled subgraph.
         """
-        node_ids = F.cat(
-            [
-                self.partition_node_ids[
-                    self.partition_offset[i] : self.partition_offset[i + 1]
-                ]
-                for i in F.asnumpy(partition_ids)
-            ],
-            0,
+        arrays = self._load_arrays()
+        offset = arrays["partition_offset"]
+        parts = F.asnumpy(partition_ids).astype(np.int64)
+        num_nodes = offset[parts + 1] - offset[parts]
+        nodes = utils.concat_ranges(offset[parts], num_nodes)
+        # A node of a selected partition is renumbered by adding the shift
+        # of its partition to its position in the layout.
+        shift = np.zeros(len(offset) - 1, dtype=np.int64)
+        shift[parts] = np.cumsum(num_nodes) - num_nodes - offset[parts]
+        selected = np.zeros(len(offset) - 1, dtype=bool)
+        selected[parts] = True
+
+        edge_offset = arrays["edge_offset"]
+        num_edges = edge_offset[parts + 1] - edge_offset[parts]
+        edges = utils.concat_ranges(edge_offset[parts], num_edges)
+        src_part = np.repeat(parts, num_edges)
+        dst_part = arrays["edge_dst_part"][edges]
+        # Keep the blocks of the selected partitions and the edges between
+        # them.
+        mask = selected[dst_part]
+        edges, src_part, dst_part = edges[mask], src_part[mask], dst_part[mask]
+        src = arrays["edge_src"][edges] + shift[src_part]
+        dst = arrays["edge_dst"][edges] + shift[dst_part]
+
+        sg = create_graph(
+            (F.zerocopy_from_numpy(src), F.zerocopy_from_numpy(dst)),
+            num_nodes=len(nodes),
+            idtype=g.idtype,
         )
-        sg = g.subgraph(
-            node_ids, relabel_nodes=True, output_device=self.output_device
+        node_ids = F.zerocopy_from_numpy(arrays["partition_node_ids"][nodes])
+        edge_ids = F.zerocopy_from_numpy(arrays["edge_ids"][edges])
+        utils.set_new_frames(
+            sg,
+            node_frames=utils.extract_node_subframes(
+                g, [F.astype(node_ids, g.idtype)]
+            ),
+            edge_frames=utils.extract_edge_subframes(
+                g, [F.astype(edge_ids, g.idtype)]
+            ),
         )
+        for name in self.cache_ndata:
+            feat = arrays["ndata_" + name]
+            sg.ndata[name] = F.zerocopy_from_numpy(
+                np.concatenate([feat[offset[i] : offset[i + 1]] for i in parts])
+            )
+        if self.output_device is not None:
+            sg = sg.to(self.output_device)
         set_node_lazy_features(sg, self.prefetch_ndata)
         set_edge_lazy_features(sg, self.prefetch_edata)
         return sg
@@ -37,6 +37,7 @@ from ..utils import (
     recursive_apply_pair,
     set_num_threads,
 )
+from .base import CollatedBatch
 
 PYTHON_EXIT_STATUS = False
 
@@ -1289,6 +1290,9 @@ class GraphCollator(object):
 
     If the set of graphs has no graph-level data, the collate function will yield a batched graph.
 
+    A minibatch already collated by the dataset as a
+    :class:`~dgl.dataloading.CollatedBatch` is returned as is.
+
     Examples
     --------
     To train a GNN for graph classification on a set of graphs in ``dataset`` (assume
@@ -1324,6 +1328,8 @@ class GraphCollator(object):
         -------
         A tuple of the batching results.
         """
+        if isinstance(items, CollatedBatch):
+            return list(items)
         elem = items[0]
         elem_type = type(elem)
         if isinstance(elem, DGLGraph):
@@ -1,6 +1,9 @@
 """GraphSAINT samplers."""
-from ..base import DGLError
-from ..random import choice
+import os
+import pickle
+import tempfile
+
+from ..base import DGLError, EID, NID
 from ..sampling import pack_traces, random_walk
 from .base import Sampler, set_edge_lazy_features, set_node_lazy_features
 
@@ -10,6 +13,51 @@ except ImportError:
     pass
 
 
+def _build_alias_table(weights):
+    """Builds the table of Walker's alias method to draw indices in
+    proportion to ``weights`` in O(1) per draw.
+
+    Bucket ``i`` holds index ``i`` with probability ``prob[i]`` and
+    ``alias[i]`` otherwise. The buckets of the light indices are filled by the
+    heavy indices in order, like the sweep of Vose's algorithm, which is
+    computed at once with prefix sums.
+    """
+    w = weights.double()
+    num = len(w)
+    w = w * (num / w.sum())
+    light = torch.nonzero(w < 1).squeeze(1)
+    heavy = torch.nonzero(w >= 1).squeeze(1)
+    prob = torch.ones(num, dtype=torch.float64)
+    alias = torch.arange(num)
+    if len(light) == 0 or len(heavy) == 0:
+        return prob.float(), alias
+    # The light bucket i is filled by the first heavy index whose cumulative
+    # excess covers the cumulative deficit before bucket i.
+    deficit = 1 - w[light]
+    filled = torch.cumsum(deficit, 0)
+    before = filled - deficit
+    excess = torch.cumsum(w[heavy] - 1, 0)
+    donor = torch.searchsorted(excess, before).clamp(max=len(heavy) - 1)
+    prob[light] = w[light]
+    alias[light] = heavy[donor]
+    # A heavy index keeps what is left after filling its light buckets, and
+    # its own bucket is filled by the next heavy index.
+    num_filled = torch.searchsorted(before, excess, right=True)
+    filled = torch.cat([filled.new_zeros(1), filled])
+    prob[heavy] = (excess + 1 - filled[num_filled]).clamp(0, 1)
+    alias[heavy[:-1]] = heavy[1:]
+    return prob.float(), alias
+
+
+def _alias_sample(table, size):
+    """Draws ``size`` indices with the table of :func:`_build_alias_table`."""
+    prob, alias = table
+    buckets = torch.randint(0, len(prob), (size,))
+    return torch.where(
+        torch.rand(size) < prob[buckets], buckets, alias[buckets]
+    )
+
+
 class SAINTSampler(Sampler):
     """Random node/edge/walk sampler from
     `GraphSAINT: Graph Sampling Based Inductive Learning Method
@@ -25,6 +73,15 @@ class SAINTSampler(Sampler):
     - The :attr:`'walk'` sampler uses the nodes visited by random walks. It uniformly selects
       a number of root nodes and then performs a fixed-length random walk from each root node.
 
+    The nodes and edges are drawn with alias tables, which are built once per graph
+    and then draw each sample in constant time.
+
+    If :attr:`num_norm_subgraphs` is positive, the sampler also estimates the
+    normalization coefficients of GraphSAINT from that many pre-sampled subgraphs,
+    and stores them in the ``ndata['loss_norm']`` and ``edata['aggr_norm']`` of the
+    sampled subgraphs. ``loss_norm`` weights the loss of a node and ``aggr_norm``
+    weights the message of an edge in the aggregation.
+
     Parameters
     ----------
     mode : str
@@ -41,8 +98,15 @@ class SAINTSampler(Sampler):
           the length of a random walk.
 
     cache : bool, optional
-        If False, it will not cache the probability arrays for sampling. Setting
+        If False, it will not cache the alias tables for sampling. Setting
         it to False is required if you want to use the sampler across different graphs.
+    num_norm_subgraphs : int, optional
+        The number of subgraphs to pre-sample for estimating the normalization
+        coefficients. The coefficients are not computed if it is 0.
+    cache_path : str, optional
+        The path of a file storing the alias table and the normalization
+        coefficients, so that they are only computed once for a graph. They are
+        not stored if None.
     prefetch_ndata : list[str], optional
         The node data to prefetch for the subgraph.
 
@@ -65,6 +129,16 @@ class SAINTSampler(Sampler):
     >>> dataloader = DataLoader(g, torch.arange(num_iters), sampler, num_workers=4)
     >>> for subg in dataloader:
     ...     train_on(subg)
+
+    With the normalization coefficients, call :meth:`prepare` before creating the
+    data loader so that the pre-sampling is not repeated by every worker.
+
+    >>> sampler = SAINTSampler(mode='node', budget=6000, num_norm_subgraphs=50,
+    ...                        cache_path='saint_node.pkl')
+    >>> sampler.prepare(g)
+    >>> dataloader = DataLoader(g, torch.arange(num_iters), sampler, num_workers=4)
+    >>> for subg in dataloader:
+    ...     loss = (subg.ndata['loss_norm'] * loss_fn(subg)).sum()
     """
 
     def __init__(
@@ -75,8 +149,11 @@ class SAINTSampler(Sampler):
         prefetch_ndata=None,
         prefetch_edata=None,
         output_device="cpu",
+        num_norm_subgraphs=0,
+        cache_path=None,
     ):
         super().__init__()
+        self.mode = mode
         self.budget = budget
         if mode == "node":
             self.sampler = self.node_sampler
@@ -90,44 +167,47 @@ class SAINTSampler(Sampler):
             )
 
         self.cache = cache
-        self.prob = None
+        self.alias_table = None
+        self.num_norm_subgraphs = num_norm_subgraphs
+        self.cache_path = cache_path
+        self.loss_norm = None
+        self.aggr_norm = None
         self.prefetch_ndata = prefetch_ndata or []
         self.prefetch_edata = prefetch_edata or []
         self.output_device = output_device
 
+    def _alias_weights(self, g):
+        if self.mode == "node":
+            # Alternatively, this can be realized by uniformly sampling an edge subset,
+            # and then take the src node of the sampled edges. However, the number of edges
+            # is typically much larger than the number of nodes.
+            weights = g.out_degrees().float().clamp(min=1)
+        else:
+            src, dst = g.edges()
+            in_deg = g.in_degrees().float().clamp(min=1)
+            out_deg = g.out_degrees().float().clamp(min=1)
+            # We can reduce the sample space by half if graphs are always symmetric.
+            weights = 1.0 / in_deg[dst.long()] + 1.0 / out_deg[src.long()]
+        return weights
+
+    def _get_alias_table(self, g):
+        if self.cache and self.alias_table is not None:
+            return self.alias_table
+        table = _build_alias_table(self._alias_weights(g))
+        if self.cache:
+            self.alias_table = table
+        return table
+
     def node_sampler(self, g):
         """Node ID sampler for random node sampler"""
-        # Alternatively, this can be realized by uniformly sampling an edge subset,
-        # and then take the src node of the sampled edges. However, the number of edges
-        # is typically much larger than the number of nodes.
-        if self.cache and self.prob is not None:
-            prob = self.prob
-        else:
-            prob = g.out_degrees().float().clamp(min=1)
-            if self.cache:
-                self.prob = prob
-        return (
-            torch.multinomial(prob, num_samples=self.budget, replacement=True)
-            .unique()
-            .type(g.idtype)
-        )
+        table = self._get_alias_table(g)
+        return _alias_sample(table, self.budget).unique().type(g.idtype)
 
     def edge_sampler(self, g):
         """Node ID sampler for random edge sampler"""
         src, dst = g.edges()
-        if self.cache and self.prob is not None:
-            prob = self.prob
-        else:
-            in_deg = g.in_degrees().float().clamp(min=1)
-            out_deg = g.out_degrees().float().clamp(min=1)
-            # We can reduce the sample space by half if graphs are always symmetric.
-            prob = 1.0 / in_deg[dst.long()] + 1.0 / out_deg[src.long()]
-            prob /= prob.sum()
-            if self.cache:
-                self.prob = prob
-        sampled_edges = torch.unique(
-            choice(len(prob), size=self.budget, prob=prob)
-        )
+        table = self._get_alias_table(g)
+        sampled_edges = torch.unique(_alias_sample(table, self.budget))
         sampled_nodes = torch.cat([src[sampled_edges], dst[sampled_edges]])
         return sampled_nodes.unique().type(g.idtype)
 
@@ -139,6 +219,91 @@ class SAINTSampler(Sampler):
         sampled_nodes, _, _, _ = pack_traces(traces, types)
         return sampled_nodes.unique().type(g.idtype)
 
+    def _compute_norm(self, g):
+        """Estimates the normalization coefficients of GraphSAINT from the
+        counts of the nodes and edges in pre-sampled subgraphs."""
+        node_count = torch.zeros(g.num_nodes())
+        edge_count = torch.zeros(g.num_edges())
+        for _ in range(self.num_norm_subgraphs):
+            node_ids = self.sampler(g)
+            edge_ids = g.subgraph(node_ids).edata[EID]
+            node_count[node_ids.long()] += 1
+            edge_count[edge_ids.long()] += 1
+        node_count = node_count.clamp(min=1)
+        edge_count = edge_count.clamp(min=1)
+        self.loss_norm = self.num_norm_subgraphs / node_count / g.num_nodes()
+        _, dst = g.edges()
+        self.aggr_norm = node_count[dst.long()] / edge_count
+
+    def prepare(self, g):
+        """Builds the alias table and estimates the normalization coefficients
+        of the graph, or loads them from :attr:`cache_path`.
+
+        It is called by :meth:`sample` when needed. Call it before creating a
+        data loader with multiple workers to prepare the graph only once.
+
+        Parameters
+        ----------
+        g : DGLGraph
+            The graph to sample from.
+        """
+        if self.cache_path is not None and os.path.exists(self.cache_path):
+            try:
+                with open(self.cache_path, "rb") as f:
+                    (
+                        config,
+                        self.alias_table,
+                        self.loss_norm,
+                        self.aggr_norm,
+                    ) = pickle.load(f)
+            except (EOFError, TypeError, ValueError):
+                raise DGLError(
+                    f"The contents in the cache file {self.cache_path} is invalid. "
+                    f"Please remove the cache file {self.cache_path} or specify another path."
+                )
+            if config != self._cache_config(g):
+                raise DGLError(
+                    f"The cache file {self.cache_path} does not match the sampler or "
+                    f"the given graph. "
+                    f"Please remove the cache file {self.cache_path} or specify another path."
+                )
+            return
+        if self.mode != "walk":
+            self.alias_table = _build_alias_table(self._alias_weights(g))
+        if self.num_norm_subgraphs > 0:
+            self._compute_norm(g)
+        if self.cache_path is not None:
+            # Write to a temporary file and move it into place, so that the
+            # workers preparing the graph at the same time never read a
+            # partially written cache file.
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.cache_path))
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(
+                        (
+                            self._cache_config(g),
+                            self.alias_table,
+                            self.loss_norm,
+                            self.aggr_norm,
+                        ),
+                        f,
+                    )
+                os.replace(tmp_path, self.cache_path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+
+    def _cache_config(self, g):
+        return (
+            self.mode,
+            self.budget,
+            self.num_norm_subgraphs,
+            g.num_nodes(),
+            g.num_edges(),
+        )
+
     def sample(self, g, indices):
         """Sampling function
 
@@ -154,10 +319,26 @@ class SAINTSampler(Sampler):
         DGLGraph
             The sampled subgraph.
         """
+        # Load the cached alias table, or compute the normalization
+        # coefficients, when the sampler has not been prepared.
+        if (self.loss_norm is None and self.num_norm_subgraphs > 0) or (
+            self.cache
+            and self.cache_path is not None
+            and self.alias_table is None
+            and self.mode != "walk"
+        ):
+            self.prepare(g)
         node_ids = self.sampler(g)
         sg = g.subgraph(
             node_ids, relabel_nodes=True, output_device=self.output_device
         )
+        if self.loss_norm is not None:
+            sg.ndata["loss_norm"] = self.loss_norm[sg.ndata[NID].long()].to(
+                sg.device
+            )
+            sg.edata["aggr_norm"] = self.aggr_norm[sg.edata[EID].long()].to(
+                sg.device
+            )
         set_node_lazy_features(sg, self.prefetch_ndata)
         set_edge_lazy_features(sg, self.prefetch_edata)
         return sg
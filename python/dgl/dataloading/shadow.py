@@ -1,9 +1,30 @@
 """ShaDow-GNN subgraph samplers."""
-from .. import transforms
-from ..base import NID
+from collections.abc import Mapping
+
 from ..sampling.utils import EidExcluder
 from .base import Sampler, set_edge_lazy_features, set_node_lazy_features
 
+try:
+    import torch
+except ImportError:
+    pass
+
+
+def _append_unique(nodes, candidates):
+    """Appends the distinct ``candidates`` which are not in ``nodes`` to
+    ``nodes``, in the order of their first occurrence."""
+    nodes = nodes.to(device=candidates.device, dtype=candidates.dtype)
+    all_nodes = torch.cat([nodes, candidates])
+    unique, inverse = torch.unique(all_nodes, return_inverse=True)
+    first = torch.full_like(unique, len(all_nodes), dtype=torch.int64)
+    first.scatter_reduce_(
+        0,
+        inverse,
+        torch.arange(len(all_nodes), device=all_nodes.device),
+        reduce="amin",
+    )
+    return all_nodes[first.sort().values]
+
 
 class ShaDowKHopSampler(Sampler):
     """K-hop subgraph sampler from `Deep Graph Neural Networks with Shallow
@@ -13,6 +34,9 @@ class ShaDowKHopSampler(Sampler):
     all the sampled nodes. The seed nodes from which the neighbors are sampled
     will appear the first in the induced nodes of the subgraph.
 
+    The sampled neighbors of each hop are merged into the node set in place,
+    and the subgraph is induced once at the end.
+
     Parameters
     ----------
     fanouts : list[int] or list[dict[etype, int]]
@@ -108,17 +132,30 @@ class ShaDowKHopSampler(Sampler):
             IDs that are sampled in this minibatch, and (3) the subgraph itself.
         """
         output_nodes = seed_nodes
+        is_hetero = isinstance(seed_nodes, Mapping)
+        if not is_hetero:
+            seed_nodes = {g.ntypes[0]: seed_nodes}
         for fanout in reversed(self.fanouts):
             frontier = g.sample_neighbors(
-                seed_nodes,
+                seed_nodes if is_hetero else seed_nodes[g.ntypes[0]],
                 fanout,
                 output_device=self.output_device,
                 replace=self.replace,
                 prob=self.prob,
                 exclude_edges=exclude_eids,
             )
-            block = transforms.to_block(frontier, seed_nodes)
-            seed_nodes = block.srcdata[NID]
+            # Merge the sampled neighbors into the node set without building
+            # a block, keeping the nodes already gathered first.
+            seed_nodes = dict(seed_nodes)
+            for etype in frontier.canonical_etypes:
+                src, _ = frontier.edges(etype=etype)
+                ntype = etype[0]
+                if ntype in seed_nodes:
+                    seed_nodes[ntype] = _append_unique(seed_nodes[ntype], src)
+                else:
+                    seed_nodes[ntype] = _append_unique(src[:0], src)
+        if not is_hetero:
+            seed_nodes = seed_nodes[g.ntypes[0]]
 
         subg = g.subgraph(
             seed_nodes, relabel_nodes=True, output_device=self.output_device
@@ -204,6 +204,82 @@ class DistTensor:
         idx = totensor(idx)
         return self.kvstore.pull(name=self._name, id_tensor=idx)
 
+    def enable_cache(self, cache_size, max_staleness=None):
+        """Cache the rows read from other machines in this trainer.
+
+        This cuts the cross-machine traffic of the rows read by most
+        minibatches, e.g. the features of high-degree nodes in a power-law
+        graph. Rows owned by the local machine are not cached.
+
+        Parameters
+        ----------
+        cache_size : int
+            The number of rows the cache can hold.
+        max_staleness : int, optional
+            If given, a cached row is invalidated after this trainer writes
+            to the tensor ``max_staleness`` times, which bounds how stale the
+            rows written by other trainers can get, e.g. for embeddings. If
+            None, the tensor is considered read-only, e.g. for features, and
+            cached rows never expire. Default: None.
+
+        Examples
+        --------
+        >>> feat = g.ndata["feat"]
+        >>> feat.enable_cache(100000)
+        >>> for input_nodes, seeds, blocks in dataloader:
+        ...     batch_feat = feat[input_nodes]
+        >>> feat.cache_stats()["hit_rate"]
+        0.64
+        """
+        self.kvstore.enable_cache(self._name, cache_size, max_staleness)
+
+    def disable_cache(self):
+        """Drop the cache enabled by :meth:`enable_cache`."""
+        self.kvstore.disable_cache(self._name)
+
+    def cache_stats(self):
+        """Return the statistics of the cache enabled by :meth:`enable_cache`.
+
+        Returns
+        -------
+        dict
+            The number of rows read from other machines (``num_queries``),
+            the number of them served from the cache (``num_hits``) and the
+            hit rate (``hit_rate``).
+        """
+        return self.kvstore.cache_stats(self._name)
+
+    def get_async(self, idx, flush=True):
+        """Get the rows of the tensor without blocking.
+
+        This is the non-blocking version of ``__getitem__``, it allows to fetch
+        the features of the next minibatch while the current one is being
+        computed. See :meth:`KVClient.pull_async` for details.
+
+        Parameters
+        ----------
+        idx : tensor
+            The IDs of the rows.
+        flush : bool, optional
+            If False, the request is buffered and coalesced with the next
+            flushed ones. Default: True.
+
+        Returns
+        -------
+        Future
+            A future whose ``wait()`` returns the rows.
+
+        Examples
+        --------
+        >>> future = g.ndata["feat"].get_async(next_input_nodes)
+        >>> loss = model(block, feat)  # overlaps with the pull.
+        >>> next_feat = future.wait()
+        """
+        idx = totensor(idx)
+        return self.kvstore.pull_async(
+            name=self._name, id_tensor=idx, flush=flush
+        )
+
     def __setitem__(self, idx, val):
         idx = totensor(idx)
         # TODO(zhengda) how do we want to support broadcast (e.g., G.ndata['h'][idx] = 1).
@@ -17,6 +17,7 @@ from ..subgraph import in_subgraph as local_in_subgraph
 from .rpc import (
     recv_responses,
     register_service,
+    register_struct_codec,
     Request,
     Response,
     send_requests_to_machine,
@@ -1315,3 +1316,18 @@ register_service(INDEGREE_SERVICE_ID, InDegreeRequest, InDegreeResponse)
 register_service(
     ETYPE_SAMPLING_SERVICE_ID, SamplingRequestEtype, SubgraphResponse
 )
+
+# The small and frequent messages are encoded with fixed schemas rather than
+# pickle.
+register_struct_codec(
+    SamplingRequest, ("tensor", "str", "opt_str", "bool", "int", "bool")
+)
+register_struct_codec(
+    SubgraphResponse, ("tensor", "tensor", "opt_tensor", "opt_tensor")
+)
+register_struct_codec(EdgesRequest, ("tensor", "int"))
+register_struct_codec(FindEdgeResponse, ("tensor", "tensor", "int"))
+register_struct_codec(InDegreeRequest, ("tensor", "int"))
+register_struct_codec(InDegreeResponse, ("tensor", "int"))
+register_struct_codec(OutDegreeRequest, ("tensor", "int"))
+register_struct_codec(OutDegreeResponse, ("tensor", "int"))
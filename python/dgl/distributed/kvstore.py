@@ -9,6 +9,7 @@ from .._ffi.ndarray import empty_shared_mem
 
 from . import rpc
 from .graph_partition_book import EdgePartitionPolicy, NodePartitionPolicy
+from .remote_row_cache import RemoteRowCache
 from .standalone_kvstore import KVClient as SA_KVClient
 
 ############################ Register KVStore Requsts and Responses ###############################
@@ -683,6 +684,127 @@ class CountLocalNonzeroRequest(rpc.Request):
         return res
 
 
+KVSTORE_BATCH_PULL = 901242
+
+
+class BatchPullResponse(rpc.Response):
+    """Send the sliced data tensors of a BatchPullRequest back to the client.
+
+    Parameters
+    ----------
+    batch_id : int
+        ID of the batch assigned by the client
+    data_tensors : list of tensor
+        sliced data tensors, one for each pull in the batch
+    """
+
+    def __init__(self, batch_id, data_tensors):
+        self.batch_id = batch_id
+        self.data_tensors = data_tensors
+
+    def __getstate__(self):
+        return (self.batch_id,) + tuple(self.data_tensors)
+
+    def __setstate__(self, state):
+        self.batch_id = state[0]
+        self.data_tensors = list(state[1:])
+
+
+class BatchPullRequest(rpc.Request):
+    """Send several ID tensors, possibly of different data, to a machine in one
+    request and get the target data tensors as response.
+
+    Parameters
+    ----------
+    batch_id : int
+        ID of the batch assigned by the client
+    names : list of str
+        data names
+    id_tensors : list of tensor
+        vectors storing the data ID, one for each name
+    """
+
+    def __init__(self, batch_id, names, id_tensors):
+        self.batch_id = batch_id
+        self.names = names
+        self.id_tensors = id_tensors
+
+    def __getstate__(self):
+        return (self.batch_id, self.names) + tuple(self.id_tensors)
+
+    def __setstate__(self, state):
+        self.batch_id, self.names = state[0], state[1]
+        self.id_tensors = list(state[2:])
+
+    def process_request(self, server_state):
+        kv_store = server_state.kv_store
+        data_tensors = []
+        for name, id_tensor in zip(self.names, self.id_tensors):
+            if name not in kv_store.part_policy:
+                raise RuntimeError(
+                    "KVServer cannot find partition policy with name: %s" % name
+                )
+            if name not in kv_store.data_store:
+                raise RuntimeError(
+                    "KVServer Cannot find data tensor with name: %s" % name
+                )
+            local_id = kv_store.part_policy[name].to_local(id_tensor)
+            data_tensors.append(
+                kv_store.pull_handlers[name](
+                    kv_store.data_store, name, local_id
+                )
+            )
+        return BatchPullResponse(self.batch_id, data_tensors)
+
+
+class PullFuture(object):
+    """Future of a pull issued by :meth:`KVClient.pull_async`.
+
+    Parameters
+    ----------
+    kvclient : KVClient
+        The client which issued the pull.
+    name : str
+        data name
+    back_sorted_id : tensor
+        The permutation restoring the original order of the IDs from the
+        IDs sorted by machine.
+    num_parts : int
+        The number of machines the IDs belong to.
+    """
+
+    def __init__(self, kvclient, name, back_sorted_id, num_parts):
+        self._kvclient = kvclient
+        self._name = name
+        self._back_sorted_id = back_sorted_id
+        self._parts = [None] * num_parts
+        self._num_pending_parts = num_parts
+        # The position and local IDs of the part on the local machine, which
+        # is pulled when waiting so that it overlaps with the remote pulls.
+        self._local_part = None
+        self._result = None
+
+    def _set_part(self, pos, data_tensor):
+        self._parts[pos] = data_tensor
+        self._num_pending_parts -= 1
+
+    def wait(self):
+        """Wait for the pull to complete.
+
+        Returns
+        -------
+        tensor
+            a data tensor with the same row size of the pulled ID tensor.
+        """
+        if self._result is None:
+            self._kvclient._wait_pull(self)
+            data_tensor = F.cat(seq=self._parts, dim=0)
+            # return data with original index order
+            self._result = data_tensor[self._back_sorted_id]
+            self._parts = None
+        return self._result
+
+
 ############################ KVServer ###############################
 
 
@@ -795,6 +917,9 @@ class KVServer(object):
             CountLocalNonzeroRequest,
             CountLocalNonzeroResponse,
         )
+        rpc.register_service(
+            KVSTORE_BATCH_PULL, BatchPullRequest, BatchPullResponse
+        )
         # Store the tensor data with specified data name
         self._data_store = {}
         # Store original tensor data names when instantiating DistGraphServer
@@ -1019,6 +1144,9 @@ class KVClient(object):
             CountLocalNonzeroRequest,
             CountLocalNonzeroResponse,
         )
+        rpc.register_service(
+            KVSTORE_BATCH_PULL, BatchPullRequest, BatchPullResponse
+        )
         # Store the tensor data with specified data name
         self._data_store = {}
         # Store the partition information with specified data name
@@ -1045,6 +1173,14 @@ class KVClient(object):
         self._push_handlers = {}
         # register role on server-0
         self._role = role
+        # Pulls issued by pull_async, which are not sent yet, grouped by
+        # machine ID.
+        self._pending_pulls = {}
+        # Futures of the sent batched pulls, keyed by batch ID.
+        self._inflight_pulls = {}
+        self._next_pull_batch_id = 0
+        # Caches of remote rows, keyed by data name.
+        self._row_caches = {}
 
     @property
     def all_possible_part_policy(self):
@@ -1078,7 +1214,7 @@ class KVClient(object):
         """
         request = BarrierRequest(self._role)
         rpc.send_request(0, request)
-        response = rpc.recv_response()
+        response = self._recv_response()
         assert response.msg == BARRIER_MSG
 
     def register_push_handler(self, name, func):
@@ -1109,7 +1245,7 @@ class KVClient(object):
             rpc.send_request(server_id, request)
         # recv response from all the server nodes
         for _ in range(self._server_count):
-            response = rpc.recv_response()
+            response = self._recv_response()
             assert response.msg == REGISTER_PUSH_MSG
         self._push_handlers[name] = func
         self.barrier()
@@ -1141,7 +1277,7 @@ class KVClient(object):
             rpc.send_request(server_id, request)
         # recv response from all the server nodes
         for _ in range(self._server_count):
-            response = rpc.recv_response()
+            response = self._recv_response()
             assert response.msg == REGISTER_PULL_MSG
         self._pull_handlers[name] = func
         self.barrier()
@@ -1191,7 +1327,7 @@ class KVClient(object):
             server_id = part_policy.part_id * self._group_count + n
             rpc.send_request(server_id, request)
         for _ in range(self._group_count):
-            response = rpc.recv_response()
+            response = self._recv_response()
             assert response.msg == INIT_MSG
 
         self.barrier()
@@ -1236,7 +1372,7 @@ class KVClient(object):
             rpc.send_request(server_id, request)
         # recv response from all the backup server nodes
         for _ in range(self._group_count - 1):
-            response = rpc.recv_response()
+            response = self._recv_response()
             assert response.msg == SEND_META_TO_BACKUP_MSG
         self.barrier()
 
@@ -1259,7 +1395,7 @@ class KVClient(object):
             server_id = part_policy.part_id * self._group_count + n
             rpc.send_request(server_id, request)
         for _ in range(self._group_count):
-            response = rpc.recv_response()
+            response = self._recv_response()
             assert response.msg == DELETE_MSG
 
         self.barrier()
@@ -1272,6 +1408,7 @@ class KVClient(object):
         del self._part_policy[name]
         del self._pull_handlers[name]
         del self._push_handlers[name]
+        self._row_caches.pop(name, None)
         self.barrier()
 
     def map_shared_data(self, partition_book):
@@ -1294,7 +1431,7 @@ class KVClient(object):
         self.barrier()
         request = GetSharedDataRequest(GET_SHARED_MSG)
         rpc.send_request(self._main_server_id, request)
-        response = rpc.recv_response()
+        response = self._recv_response()
         for name, meta in response.meta.items():
             if name not in self._data_name_list:
                 shape, dtype, policy_str = meta
@@ -1322,7 +1459,7 @@ class KVClient(object):
                     rpc.send_request(server_id, request)
                 # recv response from all the main server nodes
                 for _ in range(self._machine_count):
-                    res = rpc.recv_response()
+                    res = self._recv_response()
                     data_shape[0] += res.shape[0]
                 self._full_data_shape[name] = tuple(data_shape)
         # Send meta data to backup servers
@@ -1342,7 +1479,7 @@ class KVClient(object):
                 rpc.send_request(server_id, request)
             # recv response from all the backup server nodes
             for _ in range(self._group_count - 1):
-                response = rpc.recv_response()
+                response = self._recv_response()
                 assert response.msg == SEND_META_TO_BACKUP_MSG
             self._data_name_list.add(name)
             # map_shared_data happens only at DistGraph initialization
@@ -1401,6 +1538,8 @@ class KVClient(object):
         assert (
             F.shape(id_tensor)[0] == F.shape(data_tensor)[0]
         ), "The data must has the same row size with ID."
+        if name in self._row_caches:
+            self._row_caches[name].invalidate(id_tensor)
         # partition data
         machine_id = self._part_policy[name].to_partid(id_tensor)
         # sort index by machine id
@@ -1449,7 +1588,18 @@ class KVClient(object):
         """
         assert len(name) > 0, "name cannot be empty."
         assert F.ndim(id_tensor) == 1, "ID must be a vector."
+        if name in self._row_caches:
+            return self._row_caches[name].pull(
+                id_tensor, lambda ids: self._pull(name, ids)
+            )
+        return self._pull(name, id_tensor)
+
+    def _pull(self, name, id_tensor):
+        """Pull message from KVServer bypassing the cache."""
         if self._pull_handlers[name] is default_pull_handler:  # Use fast-pull
+            # fast_pull receives the responses by itself, so the outstanding
+            # asynchronous pulls have to complete first.
+            self._wait_all_pulls()
             part_id = self._part_policy[name].to_partid(id_tensor)
             return rpc.fast_pull(
                 name,
@@ -1502,7 +1652,7 @@ class KVClient(object):
                 response_list.append(local_response)
             # wait response from remote server nodes
             for _ in range(pull_count):
-                remote_response = rpc.recv_response()
+                remote_response = self._recv_response()
                 response_list.append(remote_response)
             # sort response by server_id and concat tensor
             response_list.sort(key=self._take_id)
@@ -1513,6 +1663,189 @@ class KVClient(object):
                 back_sorted_id
             ]  # return data with original index order
 
+    def enable_cache(self, name, cache_size, max_staleness=None):
+        """Cache the rows of the data that are pulled from other machines.
+
+        Only :meth:`pull` consults the cache, :meth:`pull_async` always reads
+        from the servers.
+
+        Parameters
+        ----------
+        name : str
+            data name
+        cache_size : int
+            The number of rows the cache can hold.
+        max_staleness : int, optional
+            If given, a cached row is invalidated after ``max_staleness``
+            pushes to the data by this client, which bounds the staleness of
+            the rows updated by other clients. If None, the data is considered
+            read-only and cached rows never expire. Default: None.
+        """
+        dtype, shape, part_policy = self.get_data_meta(name)
+        self._row_caches[name] = RemoteRowCache(
+            part_policy, cache_size, shape[1:], dtype, max_staleness
+        )
+
+    def disable_cache(self, name):
+        """Drop the cache of the data.
+
+        Parameters
+        ----------
+        name : str
+            data name
+        """
+        self._row_caches.pop(name, None)
+
+    def cache_stats(self, name):
+        """Return the statistics of the cache of the data.
+
+        Parameters
+        ----------
+        name : str
+            data name
+
+        Returns
+        -------
+        dict
+            The number of remote rows pulled, the number of them served from
+            the cache and the hit rate.
+        """
+        cache = self._row_caches[name]
+        return {
+            "num_queries": cache.num_queries,
+            "num_hits": cache.num_hits,
+            "hit_rate": cache.hit_rate,
+        }
+
+    def pull_async(self, name, id_tensor, flush=True):
+        """Pull message from KVServer without blocking.
+
+        The IDs of the pulls that are issued with ``flush=False`` are buffered
+        and sent together with those of the next flushed pull, so that several
+        outstanding pulls, even of different data, are coalesced into one
+        request per machine.
+
+        While any pull is outstanding, RPCs that are not issued by this
+        KVClient, e.g. distributed sampling in the same process, must not be
+        used.
+
+        Parameters
+        ----------
+        name : str
+            data name
+        id_tensor : tensor
+            a vector storing the ID list
+        flush : bool, optional
+            If True, send the buffered pulls right away. Default: True.
+
+        Returns
+        -------
+        PullFuture
+            a future whose ``wait()`` returns a data tensor with the same row
+            size of id_tensor.
+        """
+        assert len(name) > 0, "name cannot be empty."
+        assert F.ndim(id_tensor) == 1, "ID must be a vector."
+        # partition data
+        machine_id = self._part_policy[name].to_partid(id_tensor)
+        # sort index by machine id
+        sorted_id = F.tensor(np.argsort(F.asnumpy(machine_id), kind="stable"))
+        back_sorted_id = F.tensor(np.argsort(F.asnumpy(sorted_id)))
+        id_tensor = id_tensor[sorted_id]
+        machine, count = np.unique(F.asnumpy(machine_id), return_counts=True)
+        if len(machine) == 0:
+            # Pull nothing from the local partition to get an empty tensor of
+            # the right shape and type.
+            machine, count = [self._machine_id], [0]
+        future = PullFuture(self, name, back_sorted_id, len(machine))
+        start = 0
+        for pos, (machine_idx, num_ids) in enumerate(zip(machine, count)):
+            partial_id = id_tensor[start : start + num_ids]
+            start += num_ids
+            if machine_idx == self._machine_id:  # local pull
+                future._local_part = (
+                    pos,
+                    self._part_policy[name].to_local(partial_id),
+                )
+            else:
+                self._pending_pulls.setdefault(int(machine_idx), []).append(
+                    (name, partial_id, future, pos)
+                )
+        if flush:
+            self.flush_pulls()
+        return future
+
+    def flush_pulls(self):
+        """Send the pulls buffered by :meth:`pull_async`, one request per
+        machine."""
+        for machine_idx, pulls in self._pending_pulls.items():
+            batch_id = self._next_pull_batch_id
+            self._next_pull_batch_id += 1
+            request = BatchPullRequest(
+                batch_id,
+                [name for name, _, _, _ in pulls],
+                [partial_id for _, partial_id, _, _ in pulls],
+            )
+            rpc.send_request_to_machine(machine_idx, request)
+            self._inflight_pulls[batch_id] = [
+                (future, pos) for _, _, future, pos in pulls
+            ]
+        self._pending_pulls = {}
+
+    def _on_batch_pull_response(self, response):
+        """Hand the data of a BatchPullResponse over to the futures."""
+        for (future, pos), data_tensor in zip(
+            self._inflight_pulls.pop(response.batch_id),
+            response.data_tensors,
+        ):
+            future._set_part(pos, data_tensor)
+
+    def _recv_response(self):
+        """Receive the next response which is not of an asynchronous pull.
+
+        Responses of the asynchronous pulls that arrive in the meantime are
+        handed over to their futures.
+        """
+        while True:
+            response = rpc.recv_response()
+            if not isinstance(response, BatchPullResponse):
+                return response
+            self._on_batch_pull_response(response)
+
+    def _wait_pull(self, future):
+        """Block until all the parts of the future have arrived."""
+        if any(
+            f is future
+            for pulls in self._pending_pulls.values()
+            for _, _, f, _ in pulls
+        ):
+            self.flush_pulls()
+        if future._local_part is not None:
+            # Pull the local data while waiting for the remote machines.
+            pos, local_id = future._local_part
+            future._local_part = None
+            future._set_part(
+                pos,
+                self._pull_handlers[future._name](
+                    self._data_store, future._name, local_id
+                ),
+            )
+        while future._num_pending_parts > 0:
+            self._recv_batch_pull_response()
+
+    def _wait_all_pulls(self):
+        """Block until all the sent asynchronous pulls have arrived."""
+        while self._inflight_pulls:
+            self._recv_batch_pull_response()
+
+    def _recv_batch_pull_response(self):
+        response = rpc.recv_response()
+        assert isinstance(response, BatchPullResponse), (
+            "Got an unexpected response %s while waiting for a pull."
+            % type(response).__name__
+        )
+        self._on_batch_pull_response(response)
+
     def union(self, operand1_name, operand2_name, output_name):
         """Compute the union of two mask arrays in the KVStore."""
         # Each trainer computes its own result from its local storage.
@@ -1552,7 +1885,7 @@ class KVClient(object):
                 rpc.send_request_to_machine(machine_id, request)
                 pull_count += 1
         for _ in range(pull_count):
-            res = rpc.recv_response()
+            res = self._recv_response()
             total += res.num_local_nonzero
         return total
 
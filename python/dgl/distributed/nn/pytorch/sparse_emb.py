@@ -43,6 +43,13 @@ class DistEmbedding:
         The partition policy that assigns embeddings to different machines in the cluster.
         Currently, it only supports node partition policy or edge partition policy.
         The system determines the right partition policy automatically.
+    cache_size : int, optional
+        If positive, the embeddings read from other machines are cached in
+        this trainer, see :meth:`dgl.distributed.DistTensor.enable_cache`.
+        Default: 0.
+    cache_max_staleness : int, optional
+        A cached embedding is invalidated after ``cache_max_staleness``
+        updates of the embeddings by this trainer. Default: 1.
 
     Examples
     --------
@@ -73,6 +80,8 @@ class DistEmbedding:
         name=None,
         init_func=None,
         part_policy=None,
+        cache_size=0,
+        cache_max_staleness=1,
     ):
         self._tensor = DistTensor(
             (num_embeddings, embedding_dim),
@@ -81,6 +90,8 @@ class DistEmbedding:
             init_func=init_func,
             part_policy=part_policy,
         )
+        if cache_size > 0:
+            self._tensor.enable_cache(cache_size, cache_max_staleness)
         self._trace = []
         self._name = name
         self._num_embeddings = num_embeddings
@@ -12,7 +12,7 @@ from .... import backend as F
 from ...dist_tensor import DistTensor
 from ...graph_partition_book import EDGE_PART_POLICY, NODE_PART_POLICY
 from ...nn.pytorch import DistEmbedding
-from .utils import alltoall, alltoallv
+from .utils import alltoall_sizes, alltoallv_single
 
 EMB_STATES = "emb_states"
 WORLD_SIZE = "world_size"
@@ -21,6 +21,15 @@ PARAMS = "params"
 STATES = "states"
 
 
+def _sum_duplicates(idx, values):
+    """Sum up the rows of ``values`` sharing the same index in ``idx`` and
+    return the unique indices with the summed rows."""
+    uniq_idx, inverse = th.unique(idx, return_inverse=True)
+    summed = values.new_zeros((uniq_idx.shape[0],) + values.shape[1:])
+    summed.index_add_(0, inverse, values)
+    return uniq_idx, summed
+
+
 class DistSparseGradOptimizer(abc.ABC):
     r"""The abstract dist sparse optimizer.
 
@@ -32,11 +41,19 @@ class DistSparseGradOptimizer(abc.ABC):
         The list of DistEmbedding.
     lr : float
         The learning rate.
+    async_step : bool, Optional
+        If True, :meth:`step` only launches the exchange of the gradients and
+        the embeddings are updated at the next call of :meth:`step` or
+        :meth:`flush`, overlapping the exchange with the next forward pass
+        at the cost of reading embeddings one update behind.
+        Default: False
     """
 
-    def __init__(self, params, lr):
+    def __init__(self, params, lr, async_step=False):
         self._params = params
         self._lr = lr
+        self._async_step = async_step
+        self._pending = []
         self._rank = None
         self._world_size = None
         self._shared_cache = {}
@@ -184,6 +201,7 @@ class DistSparseGradOptimizer(abc.ABC):
         --------
         load
         """
+        self.flush()
         if self._world_size > 1:
             th.distributed.barrier()
         f = f if isinstance(f, str) else str(f, "UTF-8")
@@ -254,20 +272,16 @@ class DistSparseGradOptimizer(abc.ABC):
 
         The step function is invoked at the end of every batch to push the gradients
         of the embeddings involved in a mini-batch to DGL's servers and update the embeddings.
+
+        The gradients of the same embedding are summed up locally before being sent
+        to the trainer owning it. If the optimizer is created with ``async_step``,
+        the exchange is only launched here and the embeddings are updated when the
+        next step starts, so that the push overlaps with the next forward pass.
         """
         with th.no_grad():
-            device = (
-                th.device(f"cuda:{self._rank}")
-                if th.distributed.get_backend() == "nccl"
-                else th.device("cpu")
-            )
-            local_indics = {emb.name: [] for emb in self._params}
-            local_grads = {emb.name: [] for emb in self._params}
+            # finish the exchange launched by the previous step, if any
+            self._apply_pending()
             for emb in self._params:
-                name = emb.weight.name
-                kvstore = emb.weight.kvstore
-                trainers_per_server = self._world_size // kvstore.num_servers
-
                 idics = []
                 grads = []
                 for trace in emb._trace:
@@ -297,101 +311,16 @@ class DistSparseGradOptimizer(abc.ABC):
                         device=th.device("cpu"),
                     )
                 )
-                device = grads.device
-
-                # will send grad to each corresponding trainer
+                # The update averages the gradients of an embedding, so the
+                # number of gradients summed up travels as the last column.
+                idics, grads = _sum_duplicates(
+                    idics.to(grads.device),
+                    th.cat([grads, grads.new_ones((grads.shape[0], 1))], dim=1),
+                )
                 if self._world_size > 1:
-                    # get idx split from kvstore
-                    idx_split = kvstore.get_partid(emb.data_name, idics)
-                    idx_split_size = []
-                    idics_list = []
-                    grad_list = []
-                    # split idx and grad first
-                    for i in range(kvstore.num_servers):
-                        mask = idx_split == i
-                        idx_i = idics[mask]
-                        grad_i = grads[mask]
-
-                        if trainers_per_server <= 1:
-                            idx_split_size.append(
-                                th.tensor(
-                                    [idx_i.shape[0]],
-                                    dtype=th.int64,
-                                    device=device,
-                                )
-                            )
-                            idics_list.append(idx_i)
-                            grad_list.append(grad_i)
-                        else:
-                            kv_idx_split = th.remainder(
-                                idx_i, trainers_per_server
-                            ).long()
-                            for j in range(trainers_per_server):
-                                mask = kv_idx_split == j
-                                idx_j = idx_i[mask]
-                                grad_j = grad_i[mask]
-                                idx_split_size.append(
-                                    th.tensor(
-                                        [idx_j.shape[0]],
-                                        dtype=th.int64,
-                                        device=device,
-                                    )
-                                )
-                                idics_list.append(idx_j)
-                                grad_list.append(grad_j)
-
-                    # if one machine launch multiple KVServer, they share the same storage.
-                    # For each machine, the pytorch rank is num_trainers *
-                    # machine_id + i
-
-                    # use scatter to sync across trainers about the p2p tensor size
-                    # Note: If we have GPU nccl support, we can use all_to_all to
-                    # sync information here
-                    gather_list = list(
-                        th.empty(
-                            [self._world_size], dtype=th.int64, device=device
-                        ).chunk(self._world_size)
-                    )
-                    alltoall(
-                        self._rank,
-                        self._world_size,
-                        gather_list,
-                        idx_split_size,
-                        device,
-                    )
-                    idx_gather_list = [
-                        th.empty(
-                            (int(num_emb),), dtype=idics.dtype, device=device
-                        )
-                        for num_emb in gather_list
-                    ]
-                    alltoallv(
-                        self._rank,
-                        self._world_size,
-                        idx_gather_list,
-                        idics_list,
-                        device,
-                    )
-                    local_indics[name] = idx_gather_list
-                    grad_gather_list = [
-                        th.empty(
-                            (int(num_emb), grads.shape[1]),
-                            dtype=grads.dtype,
-                            device=device,
-                        )
-                        for num_emb in gather_list
-                    ]
-                    alltoallv(
-                        self._rank,
-                        self._world_size,
-                        grad_gather_list,
-                        grad_list,
-                        device,
-                    )
-                    local_grads[name] = grad_gather_list
+                    self._pending.append(self._exchange(emb, idics, grads))
                 else:
-                    local_indics[name] = [idics]
-                    local_grads[name] = [grads]
+                    self._pending.append((emb, idics, grads, [], grads.device))
 
             if self._clean_grad:
                 # clean gradient track
@@ -399,20 +328,68 @@ class DistSparseGradOptimizer(abc.ABC):
                     emb.reset_trace()
                 self._clean_grad = False
 
-            # do local update
-            for emb in self._params:
-                name = emb.weight.name
-                idx = th.cat(local_indics[name], dim=0)
-                grad = th.cat(local_grads[name], dim=0)
-                self.update(
-                    idx.to(device, non_blocking=True),
-                    grad.to(device, non_blocking=True),
-                    emb,
-                )
+            if not self._async_step or self._world_size == 1:
+                self._apply_pending()
+                # synchronized gradient update
+                if self._world_size > 1:
+                    th.distributed.barrier()
 
-        # synchronized gradient update
-        if self._world_size > 1:
-            th.distributed.barrier()
+    def flush(self):
+        """Update the embeddings with the gradients still being exchanged.
+
+        Only has an effect if the optimizer is created with ``async_step``. It
+        should be called before reading the embeddings for evaluation or saving.
+        """
+        with th.no_grad():
+            self._apply_pending()
+
+    def _exchange(self, emb, idics, grads):
+        """Launch the exchange of the summed up gradients with the trainers
+        owning the embeddings."""
+        device = (
+            th.device(f"cuda:{self._rank}")
+            if th.distributed.get_backend() == "nccl"
+            else th.device("cpu")
+        )
+        kvstore = emb.weight.kvstore
+        # if one machine launch multiple KVServer, they share the same storage.
+        # For each machine, the pytorch rank is num_trainers *
+        # machine_id + i, and trainer i owns the ids equal to i modulo
+        # num_trainers.
+        trainers_per_server = max(1, self._world_size // kvstore.num_servers)
+        cpu_idics = idics.cpu()
+        dst = (
+            kvstore.get_partid(emb.data_name, cpu_idics) * trainers_per_server
+            + th.remainder(cpu_idics, trainers_per_server)
+        ).long()
+        order = th.argsort(dst)
+        send_sizes = th.bincount(dst, minlength=self._world_size)
+        recv_sizes = alltoall_sizes(send_sizes, device).tolist()
+        send_sizes = send_sizes.tolist()
+        order = order.to(idics.device)
+        exec_dev = grads.device
+        idics, idx_work = alltoallv_single(
+            idics[order], send_sizes, recv_sizes, device, self._async_step
+        )
+        grads, grad_work = alltoallv_single(
+            grads[order], send_sizes, recv_sizes, device, self._async_step
+        )
+        return emb, idics, grads, [idx_work, grad_work], exec_dev
+
+    def _apply_pending(self):
+        """Wait for the pending exchanges and update the embeddings."""
+        pending, self._pending = self._pending, []
+        for emb, idx, grad, works, exec_dev in pending:
+            for work in works:
+                if work is not None:
+                    work.wait()
+            if works:
+                # ids sent by different trainers may repeat
+                idx, grad = _sum_duplicates(
+                    idx.to(exec_dev, non_blocking=True),
+                    grad.to(exec_dev, non_blocking=True),
+                )
+            self.update(idx, grad[:, :-1] / grad[:, -1:], emb)
 
     @abstractmethod
     def update(self, idx, grad, emb):
@@ -472,10 +449,14 @@ class SparseAdagrad(DistSparseGradOptimizer):
     eps : float, Optional
         The term added to the denominator to improve numerical stability
         Default: 1e-10
+    async_step : bool, Optional
+        If True, overlap the exchange of the gradients with the next forward
+        pass. See :class:`DistSparseGradOptimizer`.
+        Default: False
     """
 
-    def __init__(self, params, lr, eps=1e-10):
-        super(SparseAdagrad, self).__init__(params, lr)
+    def __init__(self, params, lr, eps=1e-10, async_step=False):
+        super(SparseAdagrad, self).__init__(params, lr, async_step)
         self._eps = eps
         self._defaults = {"_lr": lr, "_eps": eps}
         # We need to register a state sum for each embedding in the kvstore.
@@ -593,10 +574,16 @@ class SparseAdam(DistSparseGradOptimizer):
     eps : float, Optional
         The term added to the denominator to improve numerical stability
         Default: 1e-8
+    async_step : bool, Optional
+        If True, overlap the exchange of the gradients with the next forward
+        pass. See :class:`DistSparseGradOptimizer`.
+        Default: False
     """
 
-    def __init__(self, params, lr, betas=(0.9, 0.999), eps=1e-08):
-        super(SparseAdam, self).__init__(params, lr)
+    def __init__(
+        self, params, lr, betas=(0.9, 0.999), eps=1e-08, async_step=False
+    ):
+        super(SparseAdam, self).__init__(params, lr, async_step)
         self._eps = eps
         # We need to register a state sum for each embedding in the kvstore.
         self._beta1 = betas[0]
@@ -122,3 +122,63 @@ def alltoallv(rank, world_size, output_tensor_list, input_tensor_list, device):
             output_tensor_list,
             input_tensor_list,
         )
+
+
+def alltoall_sizes(send_sizes, device):
+    """Each process tells all processes in a cluster how many elements it will
+    send to them and return the number of elements to receive from each of them.
+
+    Parameters
+    ----------
+    send_sizes : tensor
+        The number of elements to send to each process
+    device: th.device
+        Device of the tensors
+
+    Returns
+    -------
+    tensor
+        The number of elements to receive from each process
+    """
+    send_sizes = send_sizes.to(device)
+    recv_sizes = th.empty_like(send_sizes)
+    dist.all_to_all_single(recv_sizes, send_sizes)
+    return recv_sizes.cpu()
+
+
+def alltoallv_single(input_tensor, send_sizes, recv_sizes, device, async_op):
+    """Each process scatters consecutive slices of the input tensor to all
+    processes in a cluster and return the gathered slices in one tensor.
+
+    Parameters
+    ----------
+    input_tensor : tensor
+        The tensor to exchange, whose rows are sorted by destination process
+    send_sizes : list of int
+        The number of rows to send to each process
+    recv_sizes : list of int
+        The number of rows to receive from each process
+    device: th.device
+        Device of the tensors
+    async_op : bool
+        Whether to return before the exchange is finished
+
+    Returns
+    -------
+    tensor
+        The received tensor
+    Work or None
+        The handle to wait on for the exchange to finish if async_op is True
+    """
+    input_tensor = input_tensor.to(device).contiguous()
+    output_tensor = input_tensor.new_empty(
+        (sum(recv_sizes),) + input_tensor.shape[1:]
+    )
+    work = dist.all_to_all_single(
+        output_tensor,
+        input_tensor,
+        output_split_sizes=recv_sizes,
+        input_split_sizes=send_sizes,
+        async_op=async_op,
+    )
+    return output_tensor, work
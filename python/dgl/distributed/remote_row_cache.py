@@ -0,0 +1,135 @@
+"""Define the client-side cache of remote rows of the kvstore tensors."""
+
+import torch
+
+# Knuth's multiplicative hash constant. It spreads out the IDs owned by a
+# partition, which are contiguous, across the slots of the cache.
+_HASH_MULTIPLIER = 2654435761
+
+
+class RemoteRowCache:
+    """Direct-mapped cache of the rows of a kvstore tensor that are owned by
+    other machines.
+
+    Every row is cached in the slot determined by the hash of its global ID,
+    evicting the row that was there. Rows that are pulled repeatedly, like the
+    features of high-degree nodes in a power-law graph, are thus served from
+    the cache most of the time, without any per-ID bookkeeping.
+
+    Rows owned by the local machine are never cached because they are
+    already accessible through shared memory.
+
+    Parameters
+    ----------
+    part_policy : PartitionPolicy
+        The partition policy of the tensor.
+    cache_size : int
+        The number of rows the cache can hold.
+    row_shape : tuple of int
+        The shape of a row of the tensor.
+    dtype : torch.dtype
+        The data type of the tensor.
+    max_staleness : int, optional
+        If given, a cached row is invalidated once this trainer has pushed
+        ``max_staleness`` times to the tensor since the row was cached. This
+        bounds how stale the rows updated by other trainers can get, e.g. for
+        embeddings. If None, the tensor is considered read-only and cached rows
+        never expire. The rows pushed by this trainer are invalidated in both
+        cases.
+    """
+
+    def __init__(
+        self, part_policy, cache_size, row_shape, dtype, max_staleness=None
+    ):
+        assert cache_size > 0, "cache_size must be positive."
+        assert (
+            max_staleness is None or max_staleness > 0
+        ), "max_staleness must be positive."
+        self._part_policy = part_policy
+        self._max_staleness = max_staleness
+        self._keys = torch.full((cache_size,), -1, dtype=torch.int64)
+        self._versions = torch.zeros(cache_size, dtype=torch.int64)
+        self._values = torch.empty(
+            (cache_size,) + tuple(row_shape), dtype=dtype
+        )
+        self._num_pushes = 0
+        self.num_queries = 0
+        self.num_hits = 0
+
+    def _slots(self, ids):
+        return torch.remainder(ids * _HASH_MULTIPLIER, self._keys.shape[0])
+
+    def pull(self, id_tensor, pull_func):
+        """Pull the rows from the cache, falling back to ``pull_func`` for the
+        rows which are local or not cached.
+
+        Parameters
+        ----------
+        id_tensor : tensor
+            a vector storing the global data ID
+        pull_func : callable
+            The function pulling the rows of the given IDs from the kvstore.
+
+        Returns
+        -------
+        tensor
+            a data tensor with the same row size of id_tensor.
+        """
+        ids = id_tensor.to(torch.int64)
+        is_remote = (
+            self._part_policy.to_partid(id_tensor) != self._part_policy.part_id
+        )
+        slots = self._slots(ids)
+        hit = is_remote & (self._keys[slots] == ids)
+        if self._max_staleness is not None:
+            hit &= (
+                self._num_pushes - self._versions[slots] < self._max_staleness
+            )
+        self.num_queries += int(is_remote.sum())
+        self.num_hits += int(hit.sum())
+        miss = ~hit
+        if not miss.any():
+            return self._values[slots]
+        missing_data = pull_func(id_tensor[miss])
+        data = torch.empty(
+            (ids.shape[0],) + self._values.shape[1:], dtype=self._values.dtype
+        )
+        data[hit] = self._values[slots[hit]]
+        data[miss] = missing_data
+        # Cache the remote rows that were missing. When several of them map
+        # to the same slot, the last one wins.
+        insert = is_remote[miss]
+        if insert.any():
+            insert_pos = torch.nonzero(insert).squeeze(1)
+            insert_slots = slots[miss][insert_pos]
+            unique_slots, inverse = torch.unique(
+                insert_slots, return_inverse=True
+            )
+            last_pos = torch.zeros_like(unique_slots).scatter_reduce_(
+                0, inverse, torch.arange(insert_pos.shape[0]), "amax"
+            )
+            insert_pos = insert_pos[last_pos]
+            self._keys[unique_slots] = ids[miss][insert_pos]
+            self._values[unique_slots] = missing_data[insert_pos].to(
+                self._values.dtype
+            )
+            self._versions[unique_slots] = self._num_pushes
+        return data
+
+    def invalidate(self, id_tensor):
+        """Record a push to the tensor and invalidate the pushed rows.
+
+        Parameters
+        ----------
+        id_tensor : tensor
+            a vector storing the global data ID of the pushed rows
+        """
+        self._num_pushes += 1
+        ids = id_tensor.to(torch.int64)
+        slots = self._slots(ids)
+        self._keys[slots[self._keys[slots] == ids]] = -1
+
+    @property
+    def hit_rate(self):
+        """The fraction of the remote rows served from the cache."""
+        return self.num_hits / max(self.num_queries, 1)
@@ -1,9 +1,11 @@
 """RPC components. They are typically functions or utilities used by both
 server and clients."""
 import abc
+import numbers
 import os
 import pickle
 import random
+import struct
 
 import numpy as np
 
@@ -19,6 +21,7 @@ __all__ = [
     "Request",
     "Response",
     "register_service",
+    "register_struct_codec",
     "create_sender",
     "create_receiver",
     "finalize_sender",
@@ -49,6 +52,7 @@ __all__ = [
 REQUEST_CLASS_TO_SERVICE_ID = {}
 RESPONSE_CLASS_TO_SERVICE_ID = {}
 SERVICE_ID_TO_PROPERTY = {}
+CLASS_TO_STRUCT_CODEC = {}
 
 DEFUALT_PORT = 30050
 
@@ -393,6 +397,143 @@ def get_service_property(service_id):
     return SERVICE_ID_TO_PROPERTY[service_id]
 
 
+# Payloads encoded by StructCodec start with this byte. Pickled payloads start
+# with the PROTO opcode (0x80) instead, so the two can be told apart.
+_STRUCT_CODEC_MAGIC = 0x01
+# The struct format and the value used when the element is None for the kinds
+# packed in the fixed-size part of the payload. Strings are packed as their
+# length, followed by their bytes after the fixed-size part.
+_STRUCT_CODEC_FORMATS = {
+    "bool": ("?", False),
+    "int": ("q", 0),
+    "float": ("d", 0.0),
+    "str": ("I", 0),
+}
+
+
+class StructCodec:
+    """Encode the states of a request or response class with a fixed schema
+    instead of pickle.
+
+    The schema lists the kind of every element of the state returned by
+    ``__getstate__``: ``"tensor"``, ``"str"``, ``"bool"``, ``"int"`` or
+    ``"float"``, prefixed with ``"opt_"`` if the element can be None. All the
+    scalars of a message are packed with a single precompiled
+    :class:`struct.Struct`, which is much cheaper than pickling them for small
+    messages.
+
+    Parameters
+    ----------
+    schema : tuple of str
+        The kind of every element of the state.
+    """
+
+    def __init__(self, schema):
+        assert len(schema) <= 64, "At most 64 state elements are supported."
+        self._fields = []
+        fmt = "<BQ"
+        for i, kind in enumerate(schema):
+            optional = kind.startswith("opt_")
+            base_kind = kind[len("opt_") :] if optional else kind
+            assert (
+                base_kind == "tensor" or base_kind in _STRUCT_CODEC_FORMATS
+            ), "Unknown kind {} in the schema.".format(kind)
+            if base_kind != "tensor":
+                fmt += _STRUCT_CODEC_FORMATS[base_kind][0]
+            self._fields.append((i, base_kind, optional))
+        self._struct = struct.Struct(fmt)
+
+    def encode(self, state):
+        """Encode the state into payloads, or return None if it does not fit
+        the schema."""
+        if len(state) != len(self._fields):
+            return None
+        present = 0
+        packed = [_STRUCT_CODEC_MAGIC, 0]
+        strs = []
+        tensors = []
+        for i, kind, optional in self._fields:
+            value = state[i]
+            if value is None:
+                if not optional:
+                    return None
+                if kind != "tensor":
+                    packed.append(_STRUCT_CODEC_FORMATS[kind][1])
+                continue
+            present |= 1 << i
+            if kind == "tensor":
+                if not F.is_tensor(value):
+                    return None
+                tensors.append(value)
+            elif kind == "str":
+                if not isinstance(value, str):
+                    return None
+                value = value.encode("utf-8")
+                strs.append(value)
+                packed.append(len(value))
+            elif kind == "int":
+                if not isinstance(value, numbers.Integral):
+                    return None
+                packed.append(value)
+            elif kind == "bool":
+                if value is not True and value is not False:
+                    return None
+                packed.append(value)
+            else:
+                if not isinstance(value, numbers.Real):
+                    return None
+                packed.append(value)
+        packed[1] = present
+        data = bytearray(self._struct.pack(*packed))
+        for value in strs:
+            data += value
+        return data, tensors
+
+    def decode(self, data, tensors):
+        """Decode the state from payloads."""
+        packed = self._struct.unpack_from(data, 0)
+        present = packed[1]
+        offset = self._struct.size
+        state = []
+        j, k = 2, 0
+        for i, kind, _ in self._fields:
+            if kind == "tensor":
+                if present >> i & 1:
+                    state.append(tensors[k])
+                    k += 1
+                else:
+                    state.append(None)
+                continue
+            value = packed[j]
+            j += 1
+            if not present >> i & 1:
+                value = None
+            elif kind == "str":
+                length = value
+                value = bytes(data[offset : offset + length]).decode("utf-8")
+                offset += length
+            state.append(value)
+        return state
+
+
+def register_struct_codec(cls, schema):
+    """Encode the requests or responses of the given class with a
+    :class:`StructCodec` instead of pickle.
+
+    States that do not fit the schema are still pickled, so the schema only
+    needs to cover the common case.
+
+    Parameters
+    ----------
+    cls : class
+        Request or response class.
+    schema : tuple of str
+        The kind of every element of the state returned by ``__getstate__``,
+        see :class:`StructCodec`.
+    """
+    CLASS_TO_STRUCT_CODEC[cls] = StructCodec(schema)
+
+
 class Request:
     """Base request class"""
 
@@ -496,6 +637,11 @@ def serialize_to_payload(serializable):
     state = serializable.__getstate__()
     if not isinstance(state, tuple):
         state = (state,)
+    codec = CLASS_TO_STRUCT_CODEC.get(type(serializable))
+    if codec is not None:
+        payload = codec.encode(state)
+        if payload is not None:
+            return payload
     nonarray_pos = []
     nonarray_state = []
     array_state = []
@@ -535,18 +681,21 @@ def deserialize_from_payload(cls, data, tensors):
     object
         De-serialized object of class cls.
     """
-    pos, nonarray_state = pickle.loads(data)
-    # Use _PLACEHOLDER to distinguish with other deserizliaed elements
-    state = [_PLACEHOLDER] * (len(nonarray_state) + len(tensors))
-    for i, no_state in zip(pos, nonarray_state):
-        state[i] = no_state
-    if len(tensors) != 0:
-        j = 0
-        state_len = len(state)
-        for i in range(state_len):
-            if state[i] is _PLACEHOLDER:
-                state[i] = tensors[j]
-                j += 1
+    if len(data) > 0 and data[0] == _STRUCT_CODEC_MAGIC:
+        state = CLASS_TO_STRUCT_CODEC[cls].decode(data, tensors)
+    else:
+        pos, nonarray_state = pickle.loads(data)
+        # Use _PLACEHOLDER to distinguish with other deserizliaed elements
+        state = [_PLACEHOLDER] * (len(nonarray_state) + len(tensors))
+        for i, no_state in zip(pos, nonarray_state):
+            state[i] = no_state
+        if len(tensors) != 0:
+            j = 0
+            state_len = len(state)
+            for i in range(state_len):
+                if state[i] is _PLACEHOLDER:
+                    state[i] = tensors[j]
+                    j += 1
     if len(state) == 1:
         state = state[0]
     else:
@@ -6,6 +6,17 @@ This kvstore is used when running in the standalone mode
 from .. import backend as F
 
 
+class _CompletedPullFuture(object):
+    """The future of a pull that has already completed."""
+
+    def __init__(self, data_tensor):
+        self._data_tensor = data_tensor
+
+    def wait(self):
+        """Return the pulled data."""
+        return self._data_tensor
+
+
 class KVClient(object):
     """The fake KVStore client.
 
@@ -91,6 +102,23 @@ class KVClient(object):
         else:
             return F.gather_row(self._data[name], id_tensor)
 
+    def enable_cache(self, name, cache_size, max_staleness=None):
+        """all the data is local in the standalone mode, nothing to cache"""
+
+    def disable_cache(self, name):
+        """all the data is local in the standalone mode, nothing to cache"""
+
+    def cache_stats(self, name):
+        """all the data is local in the standalone mode, nothing is cached"""
+        return {"num_queries": 0, "num_hits": 0, "hit_rate": 0.0}
+
+    def pull_async(self, name, id_tensor, flush=True):
+        """pull data from kvstore, the returned future is already completed"""
+        return _CompletedPullFuture(self.pull(name, id_tensor))
+
+    def flush_pulls(self):
+        """nothing to flush in the standalone mode"""
+
     def map_shared_data(self, partition_book):
         """Mapping shared-memory tensor from server to client."""
 
@@ -1,7 +1,14 @@
 """Module for global configuration operators."""
 from ._ffi.function import _init_api
 
-__all__ = ["is_libxsmm_enabled", "use_libxsmm"]
+__all__ = [
+    "is_libxsmm_enabled",
+    "use_libxsmm",
+    "use_udf_degree_padding",
+    "get_udf_degree_padding",
+]
+
+_UDF_DEGREE_PADDING = None
 
 
 def use_libxsmm(flag):
@@ -37,4 +44,55 @@ def is_libxsmm_enabled():
     return _CAPI_DGLConfigGetLibxsmm()
 
 
+def use_udf_degree_padding(max_ratio, fill_value=0.0):
+    r"""Set whether DGL pads the mailboxes of nodes of close in-degrees to
+    run a user-defined reduce function on fewer and larger node batches.
+
+    By default, the nodes are grouped by their in-degrees and the reduce
+    function is called once per distinct in-degree, which can mean
+    thousands of calls on graphs with power-law degree distributions. With
+    degree padding, a node of in-degree :math:`d` can be grouped with nodes
+    of in-degree up to :math:`d \times` :attr:`max_ratio`, and its mailbox
+    is padded with messages filled with :attr:`fill_value`.
+
+    The reduce function must give the same result with the padded messages,
+    e.g. a sum with ``fill_value=0`` or a max with
+    ``fill_value=-float("inf")``.
+
+    Parameters
+    ----------
+    max_ratio : float or None
+        The maximum ratio between the largest and the smallest in-degrees of
+        the nodes of a batch. None turns off degree padding.
+    fill_value : float, optional
+        The value of the padded messages. Default: 0.
+
+    See Also
+    --------
+    get_udf_degree_padding
+    """
+    global _UDF_DEGREE_PADDING
+    if max_ratio is None:
+        _UDF_DEGREE_PADDING = None
+    else:
+        assert max_ratio >= 1, "max_ratio must be no less than 1."
+        _UDF_DEGREE_PADDING = (max_ratio, fill_value)
+
+
+def get_udf_degree_padding():
+    r"""Get the degree padding setting of user-defined reduce functions.
+
+    Returns
+    -------
+    (float, float) or None
+        The maximum degree ratio and the fill value, or None if degree padding
+        is turned off.
+
+    See Also
+    --------
+    use_udf_degree_padding
+    """
+    return _UDF_DEGREE_PADDING
+
+
 _init_api("dgl.global_config")
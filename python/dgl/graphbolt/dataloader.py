@@ -112,6 +112,12 @@ class DataLoader(torch.utils.data.DataLoader):
         high value will limit the amount of overlap while setting it too low may
         cause the PCI-e bandwidth to not get fully utilized. Manually tuned
         default is 6144, meaning around 3-4 Streaming Multiprocessors.
+    overlap_disk_feature_fetch : bool, optional
+        If True and the UVA feature fetch overlap is not in effect, the
+        features of the next minibatch are read in a background thread while
+        the current one is being consumed. This hides the latency of features
+        stored on disk, e.g. :class:`dgl.graphbolt.DiskBasedFeature` or numpy
+        features loaded with ``in_memory: false``. Default is False.
     """
 
     def __init__(
@@ -122,6 +128,7 @@ class DataLoader(torch.utils.data.DataLoader):
         overlap_feature_fetch=True,
         overlap_graph_fetch=False,
         max_uva_threads=6144,
+        overlap_disk_feature_fetch=False,
     ):
         # Multiprocessing requires two modifications to the datapipe:
         #
@@ -176,6 +183,19 @@ class DataLoader(torch.utils.data.DataLoader):
                     feature_fetcher,
                     feature_fetcher.buffer(1).wait(),
                 )
+        elif overlap_disk_feature_fetch:
+            feature_fetchers = dp_utils.find_dps(
+                datapipe_graph,
+                FeatureFetcher,
+            )
+            executor = ThreadPoolExecutor(max_workers=1)
+            for feature_fetcher in feature_fetchers:
+                feature_fetcher.executor = executor
+                datapipe_graph = dp_utils.replace_dp(
+                    datapipe_graph,
+                    feature_fetcher,
+                    feature_fetcher.buffer(1).wait(),
+                )
 
         if (
             overlap_graph_fetch
@@ -55,6 +55,7 @@ class FeatureFetcher(MiniBatchTransformer):
         self.node_feature_keys = node_feature_keys
         self.edge_feature_keys = edge_feature_keys
         self.stream = None
+        self.executor = None
 
     def _read_data(self, data, stream):
         """
@@ -167,6 +168,11 @@ class FeatureFetcher(MiniBatchTransformer):
         return data
 
     def _read(self, data):
+        if self.executor is not None:
+            # Read the features in the background, the minibatch is ready
+            # once its wait function returns.
+            data.wait = self.executor.submit(self._read_data, data, None).result
+            return data
         current_stream = None
         if self.stream is not None:
             current_stream = torch.cuda.current_stream()
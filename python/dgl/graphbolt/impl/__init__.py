@@ -1,5 +1,8 @@
 """Implementation of GraphBolt."""
 from .basic_feature_store import *
+from .cpu_cache import *
+from .cpu_cached_feature import *
+from .disk_based_feature import *
 from .fused_csc_sampling_graph import *
 from .gpu_cache import *
 from .gpu_cached_feature import *
@@ -10,5 +13,6 @@ from .temporal_neighbor_sampler import *
 from .ondisk_dataset import *
 from .ondisk_metadata import *
 from .sampled_subgraph_impl import *
+from .shadow_khop_sampler import *
 from .torch_based_feature_store import *
 from .uniform_negative_sampler import *
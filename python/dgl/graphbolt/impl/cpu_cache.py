@@ -0,0 +1,453 @@
+"""CPU feature cache for graphbolt."""
+import math
+from collections import deque, OrderedDict
+
+import torch
+
+__all__ = ["CPUCache"]
+
+
+class _CachePolicy:
+    r"""Base class of the eviction policies used by :class:`CPUCache`.
+
+    A policy only manages the mapping from keys to slots of the cache storage,
+    the storage itself is owned by :class:`CPUCache`.
+
+    Parameters
+    ----------
+    capacity : int
+        The number of slots of the cache.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+
+    def query(self, key):
+        """Returns the slot holding `key` and records the access, or None if
+        `key` is not cached."""
+        raise NotImplementedError
+
+    def insert(self, key):
+        """Inserts `key` into the cache, evicting another key if it is full.
+
+        Returns
+        -------
+        int or None
+            The slot assigned to `key`, or None if `key` was not admitted.
+        """
+        raise NotImplementedError
+
+    def query_batch(self, keys):
+        """Returns the slots holding `keys`, -1 for the keys not cached, and
+        records the accesses."""
+        slots = [self.query(key) for key in keys.tolist()]
+        return torch.tensor(
+            [-1 if slot is None else slot for slot in slots], dtype=torch.int64
+        )
+
+    def insert_batch(self, keys):
+        """Inserts `keys` into the cache, evicting other keys if it is full.
+
+        Returns
+        -------
+        tuple(Tensor, Tensor)
+            The positions in `keys` of the keys kept in the cache and the slots
+            assigned to them.
+        """
+        # A slot may be reassigned while inserting a large batch, so only the
+        # last key assigned to each slot is kept.
+        slot_to_index = {}
+        for i, key in enumerate(keys.tolist()):
+            slot = self.insert(key)
+            if slot is not None:
+                slot_to_index[slot] = i
+        return (
+            torch.tensor(list(slot_to_index.values()), dtype=torch.int64),
+            torch.tensor(list(slot_to_index.keys()), dtype=torch.int64),
+        )
+
+    def __len__(self):
+        raise NotImplementedError
+
+
+class SetAssociativeCachePolicy(_CachePolicy):
+    r"""Set-associative CLOCK eviction policy working on whole batches of keys
+    with tensor operations.
+
+    A key can only be stored in one of the `ways` slots of the set selected by
+    the key modulo the number of sets, so looking keys up is a single gather
+    and comparison. Every slot has a small access counter, incremented when
+    the key is hit and decremented when new keys are inserted into its set.
+    New keys take the empty slots of their set first, then the slots with the
+    lowest counters.
+
+    Parameters
+    ----------
+    capacity : int
+        The number of slots of the cache. If it is not a multiple of `ways`,
+        the last set has fewer slots.
+    ways : int, optional
+        The number of slots of a set. Default: 8.
+    """
+
+    def __init__(self, capacity, ways=8):
+        super().__init__(capacity)
+        self.ways = min(ways, capacity)
+        self.num_sets = math.ceil(capacity / self.ways)
+        shape = (self.num_sets, self.ways)
+        self._keys = torch.full(shape, -1, dtype=torch.int64)
+        # -1 marks an empty slot.
+        self._freq = torch.full(shape, -1, dtype=torch.int8)
+        # The slots past the capacity in the last set are never used.
+        self._valid = (torch.arange(self.num_sets * self.ways) < capacity).view(
+            shape
+        )
+
+    def _lookup(self, keys):
+        sets = torch.remainder(keys, self.num_sets)
+        match = self._keys[sets] == keys.unsqueeze(1)
+        return sets, match.to(torch.uint8).argmax(1), match.any(1)
+
+    def _touch(self, sets, ways):
+        self._freq[sets, ways] = torch.clamp(self._freq[sets, ways] + 1, max=3)
+
+    def query(self, key):
+        slot = self.query_batch(torch.tensor([key]))[0].item()
+        return None if slot < 0 else slot
+
+    def insert(self, key):
+        index, slots = self.insert_batch(torch.tensor([key]))
+        return slots[0].item() if index.numel() > 0 else None
+
+    def query_batch(self, keys):
+        keys = keys.to(torch.int64)
+        sets, ways, hit = self._lookup(keys)
+        sets, ways = sets[hit], ways[hit]
+        self._touch(sets, ways)
+        slots = torch.full_like(keys, -1)
+        slots[hit] = sets * self.ways + ways
+        return slots
+
+    def insert_batch(self, keys):
+        keys = keys.to(torch.int64)
+        # Keep the last occurrence of every key.
+        keys, inverse = torch.unique(keys, return_inverse=True)
+        index = torch.full_like(keys, -1).scatter_reduce_(
+            0, inverse, torch.arange(inverse.shape[0]), "amax"
+        )
+        sets, ways, hit = self._lookup(keys)
+        hit_index, hit_sets, hit_ways = index[hit], sets[hit], ways[hit]
+        self._touch(hit_sets, hit_ways)
+
+        miss = ~hit
+        keys, index, sets = keys[miss], index[miss], sets[miss]
+        sets, order = torch.sort(sets, stable=True)
+        keys, index = keys[order], index[order]
+        touched, counts = torch.unique_consecutive(sets, return_counts=True)
+        # The position of every new key among the new keys of its set.
+        set_pos = torch.repeat_interleave(
+            torch.arange(touched.shape[0]), counts
+        )
+        rank = (
+            torch.arange(sets.shape[0])
+            - (torch.cumsum(counts, 0) - counts)[set_pos]
+        )
+        # Age the sets receiving new keys, then evict the least used slots.
+        freq = self._freq[touched]
+        freq = torch.where(freq > 0, freq - 1, freq)
+        valid = self._valid[touched]
+        victims = torch.argsort(
+            freq.masked_fill(~valid, torch.iinfo(torch.int8).max),
+            dim=1,
+            stable=True,
+        )
+        admit = rank < valid.sum(1)[set_pos]
+        set_pos, keys, index, sets = (
+            set_pos[admit],
+            keys[admit],
+            index[admit],
+            sets[admit],
+        )
+        ways = victims[set_pos, rank[admit]]
+        freq[set_pos, ways] = 0
+        self._freq[touched] = freq
+        self._keys[sets, ways] = keys
+        return (
+            torch.cat([hit_index, index]),
+            torch.cat(
+                [hit_sets * self.ways + hit_ways, sets * self.ways + ways]
+            ),
+        )
+
+    def __len__(self):
+        return int((self._freq >= 0).sum())
+
+
+class LRUCachePolicy(_CachePolicy):
+    r"""Least-Recently Used eviction policy."""
+
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self._slots = OrderedDict()
+        self._free = list(range(capacity - 1, -1, -1))
+
+    def query(self, key):
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._slots.move_to_end(key)
+        return slot
+
+    def insert(self, key):
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._slots.move_to_end(key)
+            return slot
+        if self._free:
+            slot = self._free.pop()
+        else:
+            _, slot = self._slots.popitem(last=False)
+        self._slots[key] = slot
+        return slot
+
+    def __len__(self):
+        return len(self._slots)
+
+
+class ClockCachePolicy(_CachePolicy):
+    r"""CLOCK (second chance) eviction policy, an approximation of LRU that
+    only sets a reference bit on a hit."""
+
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self._slots = {}
+        self._keys = [None] * capacity
+        self._referenced = bytearray(capacity)
+        self._hand = 0
+        self._size = 0
+
+    def query(self, key):
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._referenced[slot] = 1
+        return slot
+
+    def insert(self, key):
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._referenced[slot] = 1
+            return slot
+        if self._size < self.capacity:
+            slot = self._size
+            self._size += 1
+        else:
+            while self._referenced[self._hand]:
+                self._referenced[self._hand] = 0
+                self._hand = (self._hand + 1) % self.capacity
+            slot = self._hand
+            self._hand = (self._hand + 1) % self.capacity
+            del self._slots[self._keys[slot]]
+        self._keys[slot] = key
+        self._referenced[slot] = 0
+        self._slots[key] = slot
+        return slot
+
+    def __len__(self):
+        return len(self._slots)
+
+
+class S3FifoCachePolicy(_CachePolicy):
+    r"""S3-FIFO eviction policy.
+
+    New keys enter a small FIFO queue holding about 10% of the capacity. Keys
+    that are hit again before leaving the small queue are promoted to the main
+    FIFO queue, the others are evicted and remembered in a ghost queue so that
+    they are admitted directly to the main queue if requested again soon. This
+    keeps one-hit wonders, which are common when sampling neighbors of
+    low-degree nodes, from flushing the hot rows out of the cache.
+
+    Reference: Yang et al., "FIFO queues are all you need for cache eviction",
+    SOSP 2023.
+    """
+
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self._small_capacity = max(capacity // 10, 1)
+        self._main_capacity = max(capacity - self._small_capacity, 1)
+        self._slots = {}
+        self._freq = {}
+        self._small = deque()
+        self._main = deque()
+        self._ghost = OrderedDict()
+        self._free = list(range(capacity - 1, -1, -1))
+
+    def query(self, key):
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._freq[key] = min(self._freq[key] + 1, 3)
+        return slot
+
+    def _evict_main(self):
+        while self._main:
+            key = self._main.popleft()
+            freq = self._freq[key]
+            if freq > 0:
+                self._freq[key] = freq - 1
+                self._main.append(key)
+            else:
+                del self._freq[key]
+                self._free.append(self._slots.pop(key))
+                return
+
+    def _evict_small(self):
+        while self._small:
+            key = self._small.popleft()
+            if self._freq[key] > 0:
+                self._main.append(key)
+                if len(self._main) > self._main_capacity:
+                    self._evict_main()
+            else:
+                del self._freq[key]
+                self._free.append(self._slots.pop(key))
+                self._ghost[key] = None
+                if len(self._ghost) > self._main_capacity:
+                    self._ghost.popitem(last=False)
+                return
+
+    def insert(self, key):
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._freq[key] = min(self._freq[key] + 1, 3)
+            return slot
+        while not self._free:
+            if len(self._small) >= self._small_capacity or not self._main:
+                self._evict_small()
+            else:
+                self._evict_main()
+        if key in self._ghost:
+            del self._ghost[key]
+            self._main.append(key)
+        else:
+            self._small.append(key)
+        slot = self._free.pop()
+        self._slots[key] = slot
+        self._freq[key] = 0
+        return slot
+
+    def __len__(self):
+        return len(self._slots)
+
+
+_POLICIES = {
+    "set-associative": SetAssociativeCachePolicy,
+    "lru": LRUCachePolicy,
+    "clock": ClockCachePolicy,
+    "s3-fifo": S3FifoCachePolicy,
+}
+
+
+class CPUCache(object):
+    r"""High-level wrapper for a CPU feature cache.
+
+    Keeps up to `cache_shape[0]` rows in a preallocated tensor in host memory.
+    The eviction policy decides which rows stay in the cache. The default
+    set-associative policy looks up and inserts whole batches of keys with
+    tensor operations, while the "lru", "clock" and "s3-fifo" policies keep
+    exact per-key bookkeeping in Python and are much slower on large batches.
+
+    Parameters
+    ----------
+    cache_shape : tuple
+        The shape of the cache storage. The first dimension is the number of
+        rows the cache can hold.
+    dtype : torch.dtype
+        The data type of the cached rows.
+    policy : str or callable, optional
+        The eviction policy, one of "set-associative", "lru", "clock" and
+        "s3-fifo". A callable taking the capacity and returning an object with
+        the same interface as the builtin policies can be passed to plug in a
+        custom policy, the batch methods ``query_batch`` and ``insert_batch``
+        being optional.
+        Default: "set-associative".
+    """
+
+    def __init__(self, cache_shape, dtype, policy="set-associative"):
+        capacity = cache_shape[0]
+        assert capacity > 0, "The capacity of CPUCache must be positive."
+        if isinstance(policy, str):
+            assert policy in _POLICIES, (
+                f"Unknown cache policy {policy}, "
+                f"supported policies are {list(_POLICIES)}."
+            )
+            policy = _POLICIES[policy]
+        self._policy_factory = policy
+        self._policy = policy(capacity)
+        self._cache = torch.empty(cache_shape, dtype=dtype)
+        self.total_miss = 0
+        self.total_queries = 0
+
+    def query(self, keys):
+        """Queries the CPU cache.
+
+        Parameters
+        ----------
+        keys : Tensor
+            The keys to query the CPU cache with.
+
+        Returns
+        -------
+        tuple(Tensor, Tensor, Tensor)
+            A tuple containing (values, missing_indices, missing_keys) where
+            values[missing_indices] corresponds to cache misses that should be
+            filled by quering another source with missing_keys.
+        """
+        query_batch = getattr(self._policy, "query_batch", None)
+        if query_batch is None:
+            slots = _CachePolicy.query_batch(self._policy, keys)
+        else:
+            slots = query_batch(keys)
+        hit = slots >= 0
+        values = torch.empty(
+            (keys.shape[0],) + self._cache.shape[1:], dtype=self._cache.dtype
+        )
+        values[hit] = self._cache[slots[hit]]
+        missing_index = torch.nonzero(~hit).squeeze(1)
+        missing_keys = keys[missing_index]
+        self.total_queries += keys.shape[0]
+        self.total_miss += missing_keys.shape[0]
+        return values, missing_index, missing_keys
+
+    def replace(self, keys, values):
+        """Inserts key-value pairs into the CPU cache, evicting old key-value
+        pairs according to the eviction policy if it is full.
+
+        Parameters
+        ----------
+        keys: Tensor
+            The keys to insert to the CPU cache.
+        values: Tensor
+            The values to insert to the CPU cache.
+        """
+        insert_batch = getattr(self._policy, "insert_batch", None)
+        if insert_batch is None:
+            index, slots = _CachePolicy.insert_batch(self._policy, keys)
+        else:
+            index, slots = insert_batch(keys)
+        if slots.numel() > 0:
+            self._cache[slots] = values[index].to(self._cache.dtype)
+
+    def clear(self):
+        """Removes all the key-value pairs from the CPU cache."""
+        self._policy = self._policy_factory(self._cache.shape[0])
+
+    def __len__(self):
+        return len(self._policy)
+
+    @property
+    def miss_rate(self):
+        """Returns the cache miss rate since creation."""
+        return self.total_miss / self.total_queries
+
+    @property
+    def hit_rate(self):
+        """Returns the cache hit rate since creation."""
+        return 1 - self.miss_rate
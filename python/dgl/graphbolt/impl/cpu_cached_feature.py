@@ -0,0 +1,143 @@
+"""CPU cached feature for GraphBolt."""
+import torch
+
+from ..feature_store import Feature
+
+from .cpu_cache import CPUCache
+
+__all__ = ["CPUCachedFeature"]
+
+
+class CPUCachedFeature(Feature):
+    r"""CPU cached feature wrapping a fallback feature.
+
+    Keeps the most frequently read rows of the fallback feature in host
+    memory. It is the CPU counterpart of :class:`GPUCachedFeature` and is
+    mostly useful when the fallback feature is stored on disk, e.g. a numpy
+    feature loaded with `in_memory: false`.
+
+    Parameters
+    ----------
+    fallback_feature : Feature
+        The fallback feature.
+    cache_size : int
+        The capacity of the CPU cache, the number of features to store.
+    policy : str, optional
+        The eviction policy of the cache, one of "set-associative", "lru",
+        "clock" and "s3-fifo". See :class:`CPUCache`.
+        Default: "set-associative".
+
+    Examples
+    --------
+    >>> import torch
+    >>> from dgl import graphbolt as gb
+    >>> torch_feat = torch.arange(10).reshape(2, -1)
+    >>> cache_size = 5
+    >>> fallback_feature = gb.TorchBasedFeature(torch_feat)
+    >>> feature = gb.CPUCachedFeature(fallback_feature, cache_size)
+    >>> feature.read()
+    tensor([[0, 1, 2, 3, 4],
+            [5, 6, 7, 8, 9]])
+    >>> feature.read(torch.tensor([0]))
+    tensor([[0, 1, 2, 3, 4]])
+    >>> feature.update(torch.tensor([[1 for _ in range(5)]]),
+    ...                torch.tensor([1]))
+    >>> feature.read(torch.tensor([0, 1]))
+    tensor([[0, 1, 2, 3, 4],
+            [1, 1, 1, 1, 1]])
+    >>> feature.size()
+    torch.Size([5])
+    >>> feature.miss_rate
+    0.3333333333333333
+    """
+
+    def __init__(
+        self,
+        fallback_feature: Feature,
+        cache_size: int,
+        policy="set-associative",
+    ):
+        super(CPUCachedFeature, self).__init__()
+        assert isinstance(fallback_feature, Feature), (
+            f"The fallback_feature must be an instance of Feature, but got "
+            f"{type(fallback_feature)}."
+        )
+        self._fallback_feature = fallback_feature
+        self.cache_size = cache_size
+        # Fetching the feature dimension from the underlying feature.
+        feat0 = fallback_feature.read(torch.tensor([0]))
+        self._feature = CPUCache(
+            (cache_size,) + feat0.shape[1:], feat0.dtype, policy
+        )
+
+    def read(self, ids: torch.Tensor = None):
+        """Read the feature by index.
+
+        The returned tensor is always in CPU memory, no matter whether the
+        fallback feature is in memory or on disk.
+
+        Parameters
+        ----------
+        ids : torch.Tensor, optional
+            The index of the feature. If specified, only the specified indices
+            of the feature are read. If None, the entire feature is returned.
+
+        Returns
+        -------
+        torch.Tensor
+            The read feature.
+        """
+        if ids is None:
+            return self._fallback_feature.read()
+        values, missing_index, missing_keys = self._feature.query(ids)
+        if missing_keys.shape[0] > 0:
+            missing_values = self._fallback_feature.read(missing_keys)
+            values[missing_index] = missing_values
+            self._feature.replace(missing_keys, missing_values)
+        return values
+
+    def size(self):
+        """Get the size of the feature.
+
+        Returns
+        -------
+        torch.Size
+            The size of the feature.
+        """
+        return self._fallback_feature.size()
+
+    def update(self, value: torch.Tensor, ids: torch.Tensor = None):
+        """Update the feature.
+
+        Parameters
+        ----------
+        value : torch.Tensor
+            The updated value of the feature.
+        ids : torch.Tensor, optional
+            The indices of the feature to update. If specified, only the
+            specified indices of the feature will be updated. For the feature,
+            the `ids[i]` row is updated to `value[i]`. So the indices and value
+            must have the same length. If None, the entire feature will be
+            updated.
+        """
+        if ids is None:
+            self._fallback_feature.update(value)
+            self._feature.clear()
+        else:
+            self._fallback_feature.update(value, ids)
+            self._feature.replace(ids, value)
+
+    def metadata(self):
+        """Get the metadata of the feature.
+
+        Returns
+        -------
+        Dict
+            The metadata of the feature.
+        """
+        return self._fallback_feature.metadata()
+
+    @property
+    def miss_rate(self):
+        """Returns the cache miss rate since creation."""
+        return self._feature.miss_rate
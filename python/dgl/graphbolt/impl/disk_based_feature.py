@@ -0,0 +1,328 @@
+"""Disk based feature for GraphBolt."""
+
+import os
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+
+import numpy as np
+import torch
+
+from ..feature_store import Feature
+
+__all__ = ["DiskBasedFeature"]
+
+
+def _read_npy_header(path):
+    """Returns the shape, dtype and data offset of a numpy file."""
+    with open(path, "rb") as f:
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            header = np.lib.format.read_array_header_1_0(f)
+        else:
+            header = np.lib.format.read_array_header_2_0(f)
+        shape, fortran_order, dtype = header
+        assert not fortran_order, (
+            f"DiskBasedFeature requires a C-ordered numpy array, but {path} "
+            f"is stored in Fortran order."
+        )
+        return shape, dtype, f.tell()
+
+
+def _pread_into(fd, buffer, offset):
+    """Fills `buffer` with the bytes of `fd` starting at `offset`."""
+    view = memoryview(buffer).cast("B")
+    while len(view) > 0:
+        num_read = os.preadv(fd, [view], offset)
+        if num_read == 0:
+            raise EOFError("Unexpected end of file in DiskBasedFeature.")
+        view = view[num_read:]
+        offset += num_read
+
+
+class DiskBasedFeature(Feature):
+    r"""A feature stored in a numpy file on disk and read with positional IO.
+
+    Compared with a :class:`TorchBasedFeature` wrapping a memory mapped
+    tensor, where every random row access may fault a separate page on the
+    datapipe thread, the requested ids are sorted, deduplicated and coalesced
+    into contiguous ranges that are read by a pool of threads. Neighboring rows
+    are read with a single request so that SSD-resident features are accessed
+    close to sequentially.
+
+    Parameters
+    ----------
+    path : str
+        The path to the numpy file. The array must be stored in C order and
+        have more than one dimension.
+    metadata : Dict, optional
+        The metadata of the feature.
+    num_threads : int, optional
+        The number of threads issuing reads. Default: 8.
+    max_gap : int, optional
+        Two requested rows that are at most `max_gap` rows apart are read in
+        the same request, along with the rows in between. Default: 8.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import torch
+    >>> from dgl import graphbolt as gb
+    >>> np.save("/tmp/arr.npy", np.arange(10).reshape(5, 2))
+    >>> feature = gb.DiskBasedFeature("/tmp/arr.npy")
+    >>> feature.read(torch.tensor([4, 0, 4]))
+    tensor([[8, 9],
+            [0, 1],
+            [8, 9]])
+    >>> future = feature.read_async(torch.tensor([1]))
+    >>> future.result()
+    tensor([[2, 3]])
+    >>> feature.size()
+    torch.Size([2])
+    """
+
+    def __init__(
+        self,
+        path: str,
+        metadata: Dict = None,
+        num_threads: int = 8,
+        max_gap: int = 8,
+    ):
+        super().__init__()
+        self._path = path
+        self._metadata = metadata
+        self._num_threads = num_threads
+        self._max_gap = max_gap
+        self._load_header()
+        self._fd = None
+        self._executor = None
+        self._async_executor = None
+
+    def _load_header(self):
+        shape, dtype, offset = _read_npy_header(self._path)
+        assert len(shape) > 1, (
+            f"dimension of the feature in DiskBasedFeature must be greater "
+            f"than 1, but got {len(shape)} dimension."
+        )
+        self._shape = shape
+        self._np_dtype = dtype
+        self._offset = offset
+        self._row_bytes = int(np.prod(shape[1:])) * dtype.itemsize
+
+    def _get_fd(self):
+        if self._fd is None:
+            self._fd = os.open(self._path, os.O_RDONLY)
+        return self._fd
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._num_threads)
+        return self._executor
+
+    def __getstate__(self):
+        # File descriptors and thread pools can not be shared with other
+        # processes, they are recreated lazily.
+        state = self.__dict__.copy()
+        state["_fd"] = None
+        state["_executor"] = None
+        state["_async_executor"] = None
+        return state
+
+    def __del__(self):
+        if getattr(self, "_fd", None) is not None:
+            os.close(self._fd)
+
+    def _pread(self, buffer, row):
+        """Fills `buffer` with the rows starting from `row`."""
+        offset = self._offset + row * self._row_bytes
+        if hasattr(os, "preadv"):
+            _pread_into(self._get_fd(), buffer, offset)
+        else:
+            # Positional reads are not available on Windows, np.fromfile opens
+            # its own file handle so it is thread safe as well.
+            buffer[...] = np.fromfile(
+                self._path,
+                dtype=self._np_dtype,
+                count=buffer.size,
+                offset=offset,
+            ).reshape(buffer.shape)
+
+    def _read_ranges(self, out, sorted_ids, range_offsets):
+        """Reads the rows of `sorted_ids[range_offsets[i]:range_offsets[i+1]]`
+        into the same positions of `out` with one request per range."""
+        row_shape = self._shape[1:]
+        for lo, hi in zip(range_offsets[:-1], range_offsets[1:]):
+            first, last = sorted_ids[lo], sorted_ids[hi - 1]
+            if hi - lo == last - first + 1:
+                # All the rows of the range are requested.
+                self._pread(out[lo:hi], first)
+                continue
+            buffer = np.empty((last - first + 1,) + row_shape, self._np_dtype)
+            self._pread(buffer, first)
+            out[lo:hi] = buffer[sorted_ids[lo:hi] - first]
+
+    def read(self, ids: torch.Tensor = None):
+        """Read the feature by index.
+
+        The returned tensor is always in CPU memory.
+
+        Parameters
+        ----------
+        ids : torch.Tensor, optional
+            The index of the feature. If specified, only the specified indices
+            of the feature are read. If None, the entire feature is returned.
+
+        Returns
+        -------
+        torch.Tensor
+            The read feature.
+        """
+        if ids is None:
+            return torch.from_numpy(np.load(self._path))
+        unique_ids, inverse = torch.unique(ids, return_inverse=True)
+        sorted_ids = unique_ids.numpy().astype(np.int64)
+        out = np.empty(
+            (len(sorted_ids),) + self._shape[1:], dtype=self._np_dtype
+        )
+        if len(sorted_ids) > 0:
+            assert 0 <= sorted_ids[0] and sorted_ids[-1] < self._shape[0], (
+                f"ids must be in the range [0, {self._shape[0]}), but got "
+                f"[{sorted_ids[0]}, {sorted_ids[-1]}]."
+            )
+            # Coalesce nearby ids into ranges read by a single request.
+            breaks = np.nonzero(np.diff(sorted_ids) > self._max_gap)[0] + 1
+            range_offsets = np.concatenate(([0], breaks, [len(sorted_ids)]))
+            # Split the ranges evenly across the threads, a few tasks per
+            # thread to balance the load.
+            num_tasks = min(self._num_threads * 4, len(range_offsets) - 1)
+            task_offsets = np.linspace(
+                0, len(range_offsets) - 1, num_tasks + 1
+            ).astype(np.int64)
+            if num_tasks <= 1:
+                self._read_ranges(out, sorted_ids, range_offsets)
+            else:
+                futures = [
+                    self._get_executor().submit(
+                        self._read_ranges,
+                        out,
+                        sorted_ids,
+                        range_offsets[begin : end + 1],
+                    )
+                    for begin, end in zip(task_offsets[:-1], task_offsets[1:])
+                    if end > begin
+                ]
+                for future in futures:
+                    future.result()
+        return torch.from_numpy(out)[inverse]
+
+    def read_async(self, ids: torch.Tensor):
+        """Read the feature by index asynchronously.
+
+        Parameters
+        ----------
+        ids : torch.Tensor
+            The index of the feature.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            A future whose result is the read feature.
+        """
+        if self._async_executor is None:
+            self._async_executor = ThreadPoolExecutor(max_workers=1)
+        return self._async_executor.submit(self.read, ids)
+
+    def size(self):
+        """Get the size of the feature.
+
+        Returns
+        -------
+        torch.Size
+            The size of the feature.
+        """
+        return torch.Size(self._shape[1:])
+
+    def update(self, value: torch.Tensor, ids: torch.Tensor = None):
+        """Update the feature on disk.
+
+        Parameters
+        ----------
+        value : torch.Tensor
+            The updated value of the feature.
+        ids : torch.Tensor, optional
+            The indices of the feature to update. If specified, only the
+            specified indices of the feature will be updated. For the feature,
+            the `ids[i]` row is updated to `value[i]`. So the indices and value
+            must have the same length. If None, the entire feature will be
+            updated.
+        """
+        if ids is None:
+            np.save(self._path, value.numpy())
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+            self._load_header()
+            return
+        assert ids.shape[0] == value.shape[0], (
+            f"ids and value must have the same length, "
+            f"but got {ids.shape[0]} and {value.shape[0]}."
+        )
+        assert self.size() == value.size()[1:], (
+            f"The size of the feature is {self.size()}, "
+            f"while the size of the value is {value.size()[1:]}."
+        )
+        ids = ids.numpy().astype(np.int64)
+        order = np.argsort(ids, kind="stable")
+        ids = ids[order]
+        value = np.ascontiguousarray(
+            value.numpy()[order].astype(self._np_dtype, copy=False)
+        )
+        # For duplicated ids the last value wins.
+        keep = np.append(ids[1:] != ids[:-1], True)
+        ids, value = ids[keep], value[keep]
+        breaks = np.nonzero(np.diff(ids) != 1)[0] + 1
+        fd = os.open(self._path, os.O_WRONLY)
+        try:
+            for begin, end in zip(
+                np.concatenate(([0], breaks)),
+                np.concatenate((breaks, [len(ids)])),
+            ):
+                os.pwrite(
+                    fd,
+                    value[begin:end].tobytes(),
+                    self._offset + ids[begin] * self._row_bytes,
+                )
+        finally:
+            os.close(fd)
+
+    def metadata(self):
+        """Get the metadata of the feature.
+
+        Returns
+        -------
+        Dict
+            The metadata of the feature.
+        """
+        return (
+            self._metadata if self._metadata is not None else super().metadata()
+        )
+
+    def __repr__(self) -> str:
+        ret = (
+            "{Classname}(\n"
+            "    path={path},\n"
+            "    shape={shape},\n"
+            "    dtype={dtype},\n"
+            "    metadata={metadata},\n"
+            ")"
+        )
+        metadata_str = textwrap.indent(
+            str(self.metadata()), " " * len("    metadata=")
+        ).strip()
+        return ret.format(
+            Classname=self.__class__.__name__,
+            path=self._path,
+            shape=self._shape,
+            dtype=self._np_dtype,
+            metadata=metadata_str,
+        )
@@ -4,8 +4,11 @@ import bisect
 import json
 import os
 import shutil
+import tempfile
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
+from functools import partial
 from typing import Dict, List, Union
 
 import numpy as np
@@ -18,12 +21,13 @@ from ...data.utils import download, extract_archive
 from ..base import etype_str_to_tuple, ORIGINAL_EDGE_ID
 from ..dataset import Dataset, Task
 from ..internal import (
-    calculate_dir_hash,
+    calculate_dir_manifest,
     check_dataset_change,
     copy_or_convert_data,
     get_attributes,
     read_data,
     read_edges,
+    read_edges_in_chunks,
 )
 from ..itemset import ItemSet, ItemSetDict
 from ..sampling_graph import SamplingGraph
@@ -49,12 +53,192 @@ NAMES_INDICATING_NODE_IDS = [
     "negative_dsts",
 ]
 
+# Approximate peak number of bytes held in memory per edge while the edges are
+# bucketed and sorted by the out-of-core CSC conversion: source, destination,
+# edge id and edge type records plus the sorting permutation and its gather.
+_OUT_OF_CORE_BYTES_PER_EDGE = 96
+
+
+def _smallest_etype_dtype(num_etypes):
+    """Returns the smallest integer dtype holding all the edge type ids."""
+    dtypes = [torch.uint8, torch.int16, torch.int32, torch.int64]
+    dtype_maxes = [torch.iinfo(dtype).max for dtype in dtypes]
+    return dtypes[bisect.bisect_left(dtype_maxes, num_etypes - 1)]
+
+
+def _graph_topology_to_csc_out_of_core(
+    dataset_dir: str,
+    graph_data: Dict,
+    is_homogeneous: bool,
+    auto_cast_to_optimal_dtype: bool,
+    memory_limit_in_bytes: int,
+    work_dir: str,
+):
+    """Convert the raw graph topology into CSC format without holding the
+    whole edge list in memory.
+
+    The edges are streamed from disk twice in chunks. The first pass counts
+    the in-degrees to build ``indptr``. The second pass appends every edge to
+    a bucket file chosen by its destination node, the buckets covering
+    consecutive node ranges with about one chunk of edges each. Finally, each
+    bucket is sorted in memory and written to its slice of the memory mapped
+    ``indices``, edge id and edge type arrays. Only arrays of length
+    ``num_nodes`` and one chunk of edges are held in memory at any time.
+
+    Returns
+    -------
+    tuple
+        ``(indptr, indices, edge_ids, type_per_edge, node_type_offset,
+        edge_type_offset)``, where ``indices``, ``edge_ids`` and
+        ``type_per_edge`` are backed by numpy files in ``work_dir``.
+        ``edge_ids`` are the edge ids within each edge type.
+    """
+    node_type_offset = [0]
+    for node_info in graph_data["nodes"]:
+        node_type_offset.append(node_type_offset[-1] + node_info["num"])
+    total_num_nodes = node_type_offset[-1]
+    node_type_to_id = {
+        node_info.get("type"): ntype_id
+        for ntype_id, node_info in enumerate(graph_data["nodes"])
+    }
+    num_etypes = len(graph_data["edges"])
+    chunk_size = max(memory_limit_in_bytes // _OUT_OF_CORE_BYTES_PER_EDGE, 1)
+
+    def edge_chunks():
+        for etype_id, edge_info in enumerate(graph_data["edges"]):
+            src_offset, dst_offset = 0, 0
+            if not is_homogeneous:
+                src_type, _, dst_type = etype_str_to_tuple(edge_info["type"])
+                src_offset = node_type_offset[node_type_to_id[src_type]]
+                dst_offset = node_type_offset[node_type_to_id[dst_type]]
+            for src, dst in read_edges_in_chunks(
+                dataset_dir, edge_info["format"], edge_info["path"], chunk_size
+            ):
+                yield (
+                    etype_id,
+                    src.astype(np.int64) + src_offset,
+                    dst.astype(np.int64) + dst_offset,
+                )
+
+    # 1. Count the in-degrees and the number of edges of each type.
+    indptr = np.zeros(total_num_nodes + 1, dtype=np.int64)
+    edge_type_offset = np.zeros(num_etypes + 1, dtype=np.int64)
+    for etype_id, _, dst in edge_chunks():
+        indptr[1:] += np.bincount(dst, minlength=total_num_nodes)
+        edge_type_offset[etype_id + 1] += len(dst)
+    np.cumsum(indptr, out=indptr)
+    np.cumsum(edge_type_offset, out=edge_type_offset)
+    total_num_edges = int(indptr[-1])
+
+    indices_dtype, indptr_dtype, etype_dtype = np.int64, np.int64, np.int64
+    if auto_cast_to_optimal_dtype:
+        if total_num_nodes <= torch.iinfo(torch.int32).max:
+            indices_dtype = np.int32
+        if total_num_edges <= torch.iinfo(torch.int32).max:
+            indptr_dtype = np.int32
+        etype_dtype = (
+            torch.empty(0, dtype=_smallest_etype_dtype(num_etypes))
+            .numpy()
+            .dtype
+        )
+
+    # 2. Scatter the edges into buckets of consecutive destination nodes.
+    bucket_offsets = np.unique(
+        np.concatenate(
+            (
+                [0],
+                np.searchsorted(
+                    indptr,
+                    np.arange(0, total_num_edges, chunk_size),
+                    side="right",
+                )
+                - 1,
+                [total_num_nodes],
+            )
+        )
+    )
+    num_buckets = len(bucket_offsets) - 1
+    record_dtype = np.dtype(
+        [("src", np.int64), ("dst", np.int64), ("eid", np.int64)]
+        + [("etype", etype_dtype)]
+    )
+    bucket_dir = tempfile.mkdtemp(dir=work_dir)
+
+    def bucket_path(bucket_id):
+        return os.path.join(bucket_dir, f"{bucket_id}.bin")
+
+    num_edges_read = np.zeros(num_etypes, dtype=np.int64)
+    for etype_id, src, dst in edge_chunks():
+        records = np.empty(len(src), dtype=record_dtype)
+        records["src"] = src
+        records["dst"] = dst
+        records["eid"] = np.arange(
+            num_edges_read[etype_id], num_edges_read[etype_id] + len(src)
+        )
+        records["etype"] = etype_id
+        num_edges_read[etype_id] += len(src)
+        del src, dst
+        bucket_ids = (
+            np.searchsorted(bucket_offsets, records["dst"], "right") - 1
+        )
+        # A stable sort keeps the edges of each bucket in edge id order.
+        order = np.argsort(bucket_ids, kind="stable")
+        records = records[order]
+        splits = np.searchsorted(bucket_ids[order], np.arange(num_buckets + 1))
+        del bucket_ids, order
+        for bucket_id in np.nonzero(np.diff(splits))[0]:
+            with open(bucket_path(bucket_id), "ab") as f:
+                records[splits[bucket_id] : splits[bucket_id + 1]].tofile(f)
+
+    # 3. Sort each bucket by destination and write it to its CSC slice.
+    def open_memmap(name, dtype):
+        return np.lib.format.open_memmap(
+            os.path.join(work_dir, name + ".npy"),
+            mode="w+",
+            dtype=dtype,
+            shape=(total_num_edges,),
+        )
+
+    indices = open_memmap("indices", indices_dtype)
+    edge_ids = open_memmap("edge_ids", indptr_dtype)
+    type_per_edge = (
+        None if is_homogeneous else open_memmap("etype", etype_dtype)
+    )
+    for bucket_id in range(num_buckets):
+        if not os.path.exists(bucket_path(bucket_id)):
+            continue
+        records = np.fromfile(bucket_path(bucket_id), dtype=record_dtype)
+        os.remove(bucket_path(bucket_id))
+        records = records[np.argsort(records["dst"], kind="stable")]
+        start = indptr[bucket_offsets[bucket_id]]
+        end = indptr[bucket_offsets[bucket_id + 1]]
+        indices[start:end] = records["src"]
+        edge_ids[start:end] = records["eid"]
+        if type_per_edge is not None:
+            type_per_edge[start:end] = records["etype"]
+        del records
+    shutil.rmtree(bucket_dir)
+    for array in (indices, edge_ids, type_per_edge):
+        if array is not None:
+            array.flush()
+    return (
+        torch.from_numpy(indptr.astype(indptr_dtype)),
+        torch.as_tensor(indices),
+        torch.as_tensor(edge_ids),
+        None if type_per_edge is None else torch.as_tensor(type_per_edge),
+        node_type_offset,
+        edge_type_offset.tolist(),
+    )
+
 
 def _graph_data_to_fused_csc_sampling_graph(
     dataset_dir: str,
     graph_data: Dict,
     include_original_edge_id: bool,
     auto_cast_to_optimal_dtype: bool,
+    memory_limit_in_bytes: int = None,
+    work_dir: str = None,
+    executor: ProcessPoolExecutor = None,
 ) -> FusedCSCSamplingGraph:
     """Convert the raw graph data into FusedCSCSamplingGraph.
 
@@ -69,6 +253,15 @@ def _graph_data_to_fused_csc_sampling_graph(
     auto_cast_to_optimal_dtype: bool, optional
         Casts the dtypes of tensors in the dataset into smallest possible dtypes
         for reduced storage requirements and potentially increased performance.
+    memory_limit_in_bytes: int, optional
+        If specified, the topology is converted out of core, holding only
+        chunks of edges of about this size in memory.
+    work_dir: str, optional
+        The directory storing the intermediate files of the out-of-core
+        conversion. Required if `memory_limit_in_bytes` is specified.
+    executor: ProcessPoolExecutor, optional
+        If specified, the edges of the different edge types are read
+        concurrently by the worker processes of the executor.
 
     Returns
     -------
@@ -84,7 +277,50 @@ def _graph_data_to_fused_csc_sampling_graph(
         and "type" not in graph_data["edges"][0]
     )
 
-    if is_homogeneous:
+    if not is_homogeneous:
+        # Sort graph_data by ntype/etype lexicographically to ensure ordering.
+        graph_data["nodes"].sort(key=lambda x: x["type"])
+        graph_data["edges"].sort(key=lambda x: x["type"])
+
+    if memory_limit_in_bytes is not None:
+        (
+            indptr,
+            indices,
+            edge_ids,
+            type_per_edge,
+            node_type_offset,
+            edge_type_offset,
+        ) = _graph_topology_to_csc_out_of_core(
+            dataset_dir,
+            graph_data,
+            is_homogeneous,
+            auto_cast_to_optimal_dtype,
+            memory_limit_in_bytes,
+            work_dir,
+        )
+        num_nodes = total_num_nodes = node_type_offset[-1]
+        num_edges = total_num_edges = edge_type_offset[-1]
+        if is_homogeneous:
+            node_type_offset = None
+            node_type_to_id = None
+            edge_type_to_id = None
+        else:
+            node_type_offset = torch.tensor(
+                node_type_offset, dtype=indices.dtype
+            )
+            node_type_to_id = {
+                node_info["type"]: ntype_id
+                for ntype_id, node_info in enumerate(graph_data["nodes"])
+            }
+            edge_type_to_id = {
+                edge_info["type"]: etype_id
+                for etype_id, edge_info in enumerate(graph_data["edges"])
+            }
+        node_attributes = {}
+        edge_attributes = {}
+        if include_original_edge_id:
+            edge_attributes[ORIGINAL_EDGE_ID] = edge_ids
+    elif is_homogeneous:
         # Homogeneous graph.
         edge_fmt = graph_data["edges"][0]["format"]
         edge_path = graph_data["edges"][0]["path"]
@@ -114,9 +350,6 @@ def _graph_data_to_fused_csc_sampling_graph(
             edge_attributes[ORIGINAL_EDGE_ID] = edge_ids
     else:
         # Heterogeneous graph.
-        # Sort graph_data by ntype/etype lexicographically to ensure ordering.
-        graph_data["nodes"].sort(key=lambda x: x["type"])
-        graph_data["edges"].sort(key=lambda x: x["type"])
         # Construct node_type_offset and node_type_to_id.
         node_type_offset = [0]
         node_type_to_id = {}
@@ -130,11 +363,26 @@ def _graph_data_to_fused_csc_sampling_graph(
         coo_src_list = []
         coo_dst_list = []
         coo_etype_list = []
+        edge_futures = None
+        if executor is not None:
+            edge_futures = [
+                executor.submit(
+                    read_edges,
+                    dataset_dir,
+                    edge_info["format"],
+                    edge_info["path"],
+                )
+                for edge_info in graph_data["edges"]
+            ]
         for etype_id, edge_info in enumerate(graph_data["edges"]):
             edge_type_to_id[edge_info["type"]] = etype_id
-            edge_fmt = edge_info["format"]
-            edge_path = edge_info["path"]
-            src, dst = read_edges(dataset_dir, edge_fmt, edge_path)
+            if edge_futures is not None:
+                src, dst = edge_futures[etype_id].result()
+                edge_futures[etype_id] = None
+            else:
+                src, dst = read_edges(
+                    dataset_dir, edge_info["format"], edge_info["path"]
+                )
             edge_type_offset.append(edge_type_offset[-1] + len(src))
             src_type, _, dst_type = etype_str_to_tuple(edge_info["type"])
             src += node_type_offset[node_type_to_id[src_type]]
@@ -149,10 +397,7 @@ def _graph_data_to_fused_csc_sampling_graph(
         coo_dst = torch.cat(coo_dst_list)
         del coo_dst_list
         if auto_cast_to_optimal_dtype:
-            dtypes = [torch.uint8, torch.int16, torch.int32, torch.int64]
-            dtype_maxes = [torch.iinfo(dtype).max for dtype in dtypes]
-            dtype_id = bisect.bisect_left(dtype_maxes, len(edge_type_to_id) - 1)
-            etype_dtype = dtypes[dtype_id]
+            etype_dtype = _smallest_etype_dtype(len(edge_type_to_id))
             coo_etype_list = [
                 tensor.to(etype_dtype) for tensor in coo_etype_list
             ]
@@ -319,11 +564,105 @@ def _graph_data_to_fused_csc_sampling_graph(
     )
 
 
+def _run_jobs(jobs, executor=None):
+    """Run the jobs in the worker processes of the executor if specified,
+    otherwise one after another in the current process."""
+    if executor is None:
+        for job in jobs:
+            job()
+        return
+    futures = [executor.submit(job) for job in jobs]
+    for future in futures:
+        # Raise the exception of the job if any.
+        future.result()
+
+
+def _convert_feature_data(
+    dataset_dir, input_config, output_config, processed_dir_prefix, executor
+):
+    """Copy or convert the feature files to numpy format and update the
+    feature paths in `output_config`. Returns whether any edge feature is
+    stored."""
+    has_edge_feature_data = False
+    jobs = []
+    for feature, out_feature in zip(
+        input_config["feature_data"], output_config["feature_data"]
+    ):
+        # Always save the feature in numpy format.
+        out_feature["format"] = "numpy"
+        out_feature["path"] = os.path.join(
+            processed_dir_prefix, feature["path"].replace("pt", "npy")
+        )
+        in_memory = True if "in_memory" not in feature else feature["in_memory"]
+        if not has_edge_feature_data and feature["domain"] == "edge":
+            has_edge_feature_data = True
+        jobs.append(
+            partial(
+                copy_or_convert_data,
+                os.path.join(dataset_dir, feature["path"]),
+                os.path.join(dataset_dir, out_feature["path"]),
+                feature["format"],
+                output_format=out_feature["format"],
+                in_memory=in_memory,
+                is_feature=True,
+            )
+        )
+    _run_jobs(jobs, executor)
+    return has_edge_feature_data
+
+
+def _convert_tvt_sets(
+    dataset_dir,
+    input_config,
+    output_config,
+    processed_dir_prefix,
+    node_ids_within_int32,
+    executor,
+):
+    """Copy or convert the train/validation/test sets to numpy format and
+    update their paths in `output_config`."""
+    jobs = []
+    for input_task, output_task in zip(
+        input_config["tasks"], output_config["tasks"]
+    ):
+        for set_name in ["train_set", "validation_set", "test_set"]:
+            if set_name not in input_task:
+                continue
+            for input_set_per_type, output_set_per_type in zip(
+                input_task[set_name], output_task[set_name]
+            ):
+                for input_data, output_data in zip(
+                    input_set_per_type["data"], output_set_per_type["data"]
+                ):
+                    # Always save the feature in numpy format.
+                    output_data["format"] = "numpy"
+                    output_data["path"] = os.path.join(
+                        processed_dir_prefix,
+                        input_data["path"].replace("pt", "npy"),
+                    )
+                    name = input_data["name"] if "name" in input_data else None
+                    jobs.append(
+                        partial(
+                            copy_or_convert_data,
+                            os.path.join(dataset_dir, input_data["path"]),
+                            os.path.join(dataset_dir, output_data["path"]),
+                            input_data["format"],
+                            output_data["format"],
+                            within_int32=node_ids_within_int32
+                            and name in NAMES_INDICATING_NODE_IDS,
+                        )
+                    )
+    _run_jobs(jobs, executor)
+
+
 def preprocess_ondisk_dataset(
     dataset_dir: str,
     include_original_edge_id: bool = False,
     force_preprocess: bool = None,
     auto_cast_to_optimal_dtype: bool = True,
+    memory_limit_in_bytes: int = None,
+    num_workers: int = 0,
+    num_sampled_blocks: int = 0,
 ) -> str:
     """Preprocess the on-disk dataset. Parse the input config file,
     load the data, and save the data in the format that GraphBolt supports.
@@ -340,6 +679,23 @@ def preprocess_ondisk_dataset(
         Casts the dtypes of tensors in the dataset into smallest possible dtypes
         for reduced storage requirements and potentially increased performance.
         Default is True.
+    memory_limit_in_bytes: int, optional
+        If specified, the graph topology is converted out of core: the edges
+        are streamed from disk in chunks and sorted through intermediate files
+        in the preprocessed directory, so that graphs whose edge lists do not
+        fit in RAM can be preprocessed. Arrays with one entry per node are
+        still held in memory. Default is None, meaning that all the edges are
+        loaded in memory at once.
+    num_workers: int, optional
+        The number of worker processes. If positive, the edge types, the
+        feature files and the train/validation/test sets are processed
+        concurrently by a pool of worker processes. Default is 0, meaning that
+        everything is processed in the current process.
+    num_sampled_blocks: int, optional
+        If positive, the manifest used to detect changes of the dataset also
+        records the hash value of that many sampled blocks of every file, so
+        that in-place modifications which preserve the size and modification
+        time of a file are detected as well. Default is 0.
 
     Returns
     -------
@@ -372,7 +728,7 @@ def preprocess_ondisk_dataset(
                 == include_original_edge_id
             ):
                 force_preprocess = check_dataset_change(
-                    dataset_dir, processed_dir_prefix
+                    dataset_dir, processed_dir_prefix, num_sampled_blocks
                 )
             else:
                 force_preprocess = True
@@ -405,95 +761,83 @@ def preprocess_ondisk_dataset(
     if "graph" not in input_config:
         raise RuntimeError("Invalid config: does not contain graph field.")
 
-    sampling_graph = _graph_data_to_fused_csc_sampling_graph(
-        dataset_dir,
-        input_config["graph"],
-        include_original_edge_id,
-        auto_cast_to_optimal_dtype,
-    )
+    executor = None
+    if num_workers > 0:
+        executor = ProcessPoolExecutor(max_workers=num_workers)
+    work_dir = None
+    try:
+        if memory_limit_in_bytes is not None:
+            work_dir = tempfile.mkdtemp(
+                dir=os.path.join(dataset_dir, processed_dir_prefix)
+            )
+        sampling_graph = _graph_data_to_fused_csc_sampling_graph(
+            dataset_dir,
+            input_config["graph"],
+            include_original_edge_id,
+            auto_cast_to_optimal_dtype,
+            memory_limit_in_bytes,
+            work_dir,
+            executor,
+        )
 
-    # 3. Record value of include_original_edge_id.
-    output_config["include_original_edge_id"] = include_original_edge_id
+        # 3. Record value of include_original_edge_id.
+        output_config["include_original_edge_id"] = include_original_edge_id
 
-    # 4. Save the FusedCSCSamplingGraph and modify the output_config.
-    output_config["graph_topology"] = {}
-    output_config["graph_topology"]["type"] = "FusedCSCSamplingGraph"
-    output_config["graph_topology"]["path"] = os.path.join(
-        processed_dir_prefix, "fused_csc_sampling_graph.pt"
-    )
+        # 4. Save the FusedCSCSamplingGraph and modify the output_config.
+        output_config["graph_topology"] = {}
+        output_config["graph_topology"]["type"] = "FusedCSCSamplingGraph"
+        output_config["graph_topology"]["path"] = os.path.join(
+            processed_dir_prefix, "fused_csc_sampling_graph.pt"
+        )
 
-    node_ids_within_int32 = (
-        sampling_graph.indices.dtype == torch.int32
-        and auto_cast_to_optimal_dtype
-    )
-    torch.save(
-        sampling_graph,
-        os.path.join(
-            dataset_dir,
-            output_config["graph_topology"]["path"],
-        ),
-    )
-    del sampling_graph
-    del output_config["graph"]
-
-    # 5. Load the node/edge features and do necessary conversion.
-    if input_config.get("feature_data", None):
-        has_edge_feature_data = False
-        for feature, out_feature in zip(
-            input_config["feature_data"], output_config["feature_data"]
-        ):
-            # Always save the feature in numpy format.
-            out_feature["format"] = "numpy"
-            out_feature["path"] = os.path.join(
-                processed_dir_prefix, feature["path"].replace("pt", "npy")
-            )
-            in_memory = (
-                True if "in_memory" not in feature else feature["in_memory"]
+        node_ids_within_int32 = (
+            sampling_graph.indices.dtype == torch.int32
+            and auto_cast_to_optimal_dtype
+        )
+        torch.save(
+            sampling_graph,
+            os.path.join(
+                dataset_dir,
+                output_config["graph_topology"]["path"],
+            ),
+        )
+        del sampling_graph
+        del output_config["graph"]
+        if work_dir is not None:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            work_dir = None
+
+        # 5. Load the node/edge features and do necessary conversion.
+        if input_config.get("feature_data", None):
+            has_edge_feature_data = _convert_feature_data(
+                dataset_dir,
+                input_config,
+                output_config,
+                processed_dir_prefix,
+                executor,
             )
-            if not has_edge_feature_data and feature["domain"] == "edge":
-                has_edge_feature_data = True
-            copy_or_convert_data(
-                os.path.join(dataset_dir, feature["path"]),
-                os.path.join(dataset_dir, out_feature["path"]),
-                feature["format"],
-                output_format=out_feature["format"],
-                in_memory=in_memory,
-                is_feature=True,
+            if has_edge_feature_data and not include_original_edge_id:
+                dgl_warning(
+                    "Edge feature is stored, but edge IDs are not saved."
+                )
+
+        # 6. Save tasks and train/val/test split according to the output_config.
+        if input_config.get("tasks", None):
+            _convert_tvt_sets(
+                dataset_dir,
+                input_config,
+                output_config,
+                processed_dir_prefix,
+                node_ids_within_int32,
+                executor,
             )
-        if has_edge_feature_data and not include_original_edge_id:
-            dgl_warning("Edge feature is stored, but edge IDs are not saved.")
-
-    # 6. Save tasks and train/val/test split according to the output_config.
-    if input_config.get("tasks", None):
-        for input_task, output_task in zip(
-            input_config["tasks"], output_config["tasks"]
-        ):
-            for set_name in ["train_set", "validation_set", "test_set"]:
-                if set_name not in input_task:
-                    continue
-                for input_set_per_type, output_set_per_type in zip(
-                    input_task[set_name], output_task[set_name]
-                ):
-                    for input_data, output_data in zip(
-                        input_set_per_type["data"], output_set_per_type["data"]
-                    ):
-                        # Always save the feature in numpy format.
-                        output_data["format"] = "numpy"
-                        output_data["path"] = os.path.join(
-                            processed_dir_prefix,
-                            input_data["path"].replace("pt", "npy"),
-                        )
-                        name = (
-                            input_data["name"] if "name" in input_data else None
-                        )
-                        copy_or_convert_data(
-                            os.path.join(dataset_dir, input_data["path"]),
-                            os.path.join(dataset_dir, output_data["path"]),
-                            input_data["format"],
-                            output_data["format"],
-                            within_int32=node_ids_within_int32
-                            and name in NAMES_INDICATING_NODE_IDS,
-                        )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        # Remove the spill files of the out-of-core conversion even if it
+        # failed.
+        if work_dir is not None:
+            shutil.rmtree(work_dir, ignore_errors=True)
 
     # 7. Save the output_config.
     output_config_path = os.path.join(dataset_dir, preprocess_metadata_path)
@@ -501,16 +845,18 @@ def preprocess_ondisk_dataset(
         yaml.dump(output_config, f)
     print("Finish preprocessing the on-disk dataset.")
 
-    # 8. Calculate and save the hash value of the dataset directory.
+    # 8. Calculate and save the manifest of the dataset directory.
     hash_value_file = "dataset_hash_value.txt"
     hash_value_file_path = os.path.join(
         dataset_dir, processed_dir_prefix, hash_value_file
     )
     if os.path.exists(hash_value_file_path):
         os.remove(hash_value_file_path)
-    dir_hash = calculate_dir_hash(dataset_dir)
+    dir_manifest = calculate_dir_manifest(
+        dataset_dir, num_sampled_blocks=num_sampled_blocks
+    )
     with open(hash_value_file_path, "w") as f:
-        f.write(json.dumps(dir_hash, indent=4))
+        f.write(json.dumps(dir_manifest, indent=4))
 
     # 9. Return the absolute path of the preprocessing yaml file.
     return output_config_path
@@ -589,6 +935,24 @@ class OnDiskTask:
         )
 
 
+def _tvt_data_to_item_set(tvt_data):
+    """Read the data of a TVT set into an ItemSet."""
+    names = tuple(data.name for data in tvt_data)
+    if all(data.format == "numpy" and not data.in_memory for data in tvt_data):
+        # Let worker processes map the files again instead of receiving a
+        # copy of the items.
+        return ItemSet.from_numpy_files(
+            tuple(data.path for data in tvt_data), names=names
+        )
+    return ItemSet(
+        tuple(
+            read_data(data.path, data.format, data.in_memory)
+            for data in tvt_data
+        ),
+        names=names,
+    )
+
+
 class OnDiskDataset(Dataset):
     """An on-disk dataset which reads graph topology, feature data and
     Train/Validation/Test set from disk.
@@ -674,6 +1038,16 @@ class OnDiskDataset(Dataset):
         Casts the dtypes of tensors in the dataset into smallest possible dtypes
         for reduced storage requirements and potentially increased performance.
         Default is True.
+    memory_limit_in_bytes: int, optional
+        If specified, the graph topology is preprocessed out of core with
+        chunks of edges of about this size. See
+        :func:`preprocess_ondisk_dataset` for details. Default is None.
+    num_workers: int, optional
+        The number of worker processes used for preprocessing. Default is 0.
+    num_sampled_blocks: int, optional
+        The number of sampled blocks of every file hashed to detect changes
+        of the dataset. See :func:`preprocess_ondisk_dataset` for details.
+        Default is 0.
     """
 
     def __init__(
@@ -682,6 +1056,9 @@ class OnDiskDataset(Dataset):
         include_original_edge_id: bool = False,
         force_preprocess: bool = None,
         auto_cast_to_optimal_dtype: bool = True,
+        memory_limit_in_bytes: int = None,
+        num_workers: int = 0,
+        num_sampled_blocks: int = 0,
     ) -> None:
         # Always call the preprocess function first. If already preprocessed,
         # the function will return the original path directly.
@@ -691,6 +1068,9 @@ class OnDiskDataset(Dataset):
             include_original_edge_id,
             force_preprocess,
             auto_cast_to_optimal_dtype,
+            memory_limit_in_bytes,
+            num_workers,
+            num_sampled_blocks,
         )
         with open(yaml_path) as f:
             self._yaml_data = yaml.load(f, Loader=yaml.loader.SafeLoader)
@@ -869,23 +1249,11 @@ class OnDiskDataset(Dataset):
             assert (
                 len(tvt_set) == 1
             ), "Only one TVT set is allowed if type is not specified."
-            ret = ItemSet(
-                tuple(
-                    read_data(data.path, data.format, data.in_memory)
-                    for data in tvt_set[0].data
-                ),
-                names=tuple(data.name for data in tvt_set[0].data),
-            )
+            ret = _tvt_data_to_item_set(tvt_set[0].data)
         else:
             data = {}
             for tvt in tvt_set:
-                data[tvt.type] = ItemSet(
-                    tuple(
-                        read_data(data.path, data.format, data.in_memory)
-                        for data in tvt.data
-                    ),
-                    names=tuple(data.name for data in tvt.data),
-                )
+                data[tvt.type] = _tvt_data_to_item_set(tvt.data)
             ret = ItemSetDict(data)
         return ret
 
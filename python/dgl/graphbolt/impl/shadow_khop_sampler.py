@@ -0,0 +1,137 @@
+"""ShaDow-GNN subgraph sampler for GraphBolt."""
+
+import torch
+from torch.utils.data import functional_datapipe
+
+from ..base import CSCFormatBase, etype_str_to_tuple
+from ..internal import unique_and_compact_csc_formats
+
+from ..subgraph_sampler import SubgraphSampler
+from .sampled_subgraph_impl import SampledSubgraphImpl
+
+
+__all__ = ["ShaDowKHopSampler"]
+
+
+def _keep_inner_edges(csc, num_nodes):
+    """Keeps the edges of a compacted csc format whose source node is one of
+    the first ``num_nodes`` nodes. Returns the csc format and the mask of the
+    kept edges."""
+    mask = csc.indices < num_nodes
+    kept = torch.cat([mask.new_zeros(1, dtype=torch.int64), mask.cumsum(0)])
+    return (
+        CSCFormatBase(indptr=kept[csc.indptr], indices=csc.indices[mask]),
+        mask,
+    )
+
+
+@functional_datapipe("sample_shadow_khop")
+class ShaDowKHopSampler(SubgraphSampler):
+    """Sample the subgraph induced by the k-hop neighborhood of the given
+    nodes, following `Deep Graph Neural Networks with Shallow Subgraph
+    Samplers <https://arxiv.org/abs/2012.01380>`__.
+
+    Functional name: :obj:`sample_shadow_khop`.
+
+    The neighbors of all the nodes gathered so far are sampled hop by hop,
+    and the subgraph induced by all the gathered nodes is returned. The seed
+    nodes come first in the nodes of the subgraph, which is the only sampled
+    subgraph of the minibatch, shared by all the layers of a ShaDow-GNN.
+
+    Every hop only deduplicates the newly sampled nodes against the gathered
+    ones, and the induced edges are taken from the inbound edges of the
+    gathered nodes without building intermediate blocks.
+
+    Parameters
+    ----------
+    datapipe : DataPipe
+        The datapipe.
+    graph : FusedCSCSamplingGraph
+        The graph on which to perform subgraph sampling.
+    fanouts: list[torch.Tensor] or list[int]
+        The number of edges to be sampled for each node with or without
+        considering edge types, from the outermost hop to the innermost hop.
+    replace: bool
+        Boolean indicating whether the sample is preformed with or
+        without replacement.
+    prob_name: str, optional
+        The name of an edge attribute used as the weights of sampling for
+        each node.
+
+    Examples
+    -------
+    >>> import dgl.graphbolt as gb
+    >>> import torch
+    >>> indptr = torch.LongTensor([0, 2, 4, 5, 6, 7, 8])
+    >>> indices = torch.LongTensor([1, 2, 0, 3, 5, 4, 3, 5])
+    >>> graph = gb.fused_csc_sampling_graph(indptr, indices)
+    >>> item_set = gb.ItemSet(len(indptr) - 1, names="seed_nodes")
+    >>> item_sampler = gb.ItemSampler(item_set, batch_size=2)
+    >>> datapipe = item_sampler.sample_shadow_khop(graph, [1, 1])
+    >>> minibatch = next(iter(datapipe))
+    >>> print(minibatch.input_nodes[:2])
+    tensor([0, 1])
+    """
+
+    def __init__(
+        self,
+        datapipe,
+        graph,
+        fanouts,
+        replace=False,
+        prob_name=None,
+    ):
+        super().__init__(datapipe)
+        self.graph = graph
+        self.fanouts = [
+            fanout
+            if isinstance(fanout, torch.Tensor)
+            else torch.LongTensor([int(fanout)])
+            for fanout in fanouts
+        ]
+        self.replace = replace
+        self.prob_name = prob_name
+
+    def _induced_subgraph(self, nodes):
+        subgraph = self.graph.in_subgraph(nodes)
+        _, compacted = unique_and_compact_csc_formats(
+            subgraph.sampled_csc, nodes
+        )
+        original_edge_ids = subgraph.original_edge_ids
+        if not isinstance(compacted, dict):
+            sampled_csc, mask = _keep_inner_edges(compacted, len(nodes))
+            if original_edge_ids is not None:
+                original_edge_ids = original_edge_ids[mask]
+        else:
+            sampled_csc = {}
+            edge_ids = {}
+            for etype, csc in compacted.items():
+                src_type, _, _ = etype_str_to_tuple(etype)
+                sampled_csc[etype], mask = _keep_inner_edges(
+                    csc, len(nodes.get(src_type, []))
+                )
+                if isinstance(original_edge_ids, dict):
+                    edge_ids[etype] = original_edge_ids[etype][mask]
+            original_edge_ids = edge_ids or None
+        return SampledSubgraphImpl(
+            sampled_csc=sampled_csc,
+            original_column_node_ids=nodes,
+            original_row_node_ids=nodes,
+            original_edge_ids=original_edge_ids,
+        )
+
+    def sample_subgraphs(self, seeds, seeds_timestamp):
+        nodes = seeds
+        for fanout in reversed(self.fanouts):
+            subgraph = self.graph.sample_neighbors(
+                nodes, fanout, self.replace, self.prob_name
+            )
+            # The gathered nodes come first, followed by the new ones.
+            unique_nodes, _ = unique_and_compact_csc_formats(
+                subgraph.sampled_csc, nodes
+            )
+            if isinstance(nodes, dict):
+                nodes = {**nodes, **unique_nodes}
+            else:
+                nodes = unique_nodes
+        return nodes, [self._induced_subgraph(nodes)]
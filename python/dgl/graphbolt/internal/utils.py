@@ -4,7 +4,7 @@ import hashlib
 import json
 import os
 import shutil
-from typing import List, Union
+from typing import Dict, List, Union
 
 import numpy as np
 import pandas as pd
@@ -164,6 +164,33 @@ def read_edges(dataset_dir, edge_fmt, edge_path):
     return (src, dst)
 
 
+def read_edges_in_chunks(dataset_dir, edge_fmt, edge_path, chunk_size):
+    """Read edge data from numpy or csv in chunks of at most `chunk_size`
+    edges, so that the whole edge list never needs to reside in memory."""
+    assert edge_fmt in [
+        "numpy",
+        "csv",
+    ], f"`numpy` or `csv` is expected when reading edges but got `{edge_fmt}`."
+    if edge_fmt == "numpy":
+        edge_data = np.load(os.path.join(dataset_dir, edge_path), mmap_mode="r")
+        assert (
+            edge_data.shape[0] == 2 and len(edge_data.shape) == 2
+        ), f"The shape of edges should be (2, N), but got {edge_data.shape}."
+        for start in range(0, edge_data.shape[1], chunk_size):
+            end = min(start + chunk_size, edge_data.shape[1])
+            yield (
+                np.array(edge_data[0, start:end]),
+                np.array(edge_data[1, start:end]),
+            )
+    else:
+        for edge_data in pd.read_csv(
+            os.path.join(dataset_dir, edge_path),
+            names=["src", "dst"],
+            chunksize=chunk_size,
+        ):
+            yield edge_data["src"].to_numpy(), edge_data["dst"].to_numpy()
+
+
 def calculate_file_hash(file_path, hash_algo="md5"):
     """Calculate the hash value of a file."""
     hash_algos = ["md5", "sha1", "sha224", "sha256", "sha384", "sha512"]
@@ -194,8 +221,85 @@ def calculate_dir_hash(
     return hashes
 
 
-def check_dataset_change(dataset_dir, processed_dir):
-    """Check whether dataset has been changed by checking its hash value."""
+def calculate_file_sampled_hash(
+    file_path, num_blocks, block_size=4096, hash_algo="md5"
+):
+    """Calculate the hash value of the size and `num_blocks` evenly spaced
+    blocks of a file. Much cheaper than hashing the whole file while still
+    catching most in-place modifications."""
+    hash_obj = getattr(hashlib, hash_algo)()
+    size = os.path.getsize(file_path)
+    hash_obj.update(str(size).encode())
+    with open(file_path, "rb") as file:
+        for offset in np.linspace(
+            0, max(size - block_size, 0), num_blocks, dtype=np.int64
+        ):
+            file.seek(offset)
+            hash_obj.update(file.read(block_size))
+    return hash_obj.hexdigest()
+
+
+def calculate_dir_manifest(
+    dir_path,
+    hash_algo="md5",
+    ignore: Union[str, List[str]] = None,
+    previous_manifest: Dict = None,
+    num_sampled_blocks: int = 0,
+):
+    """Calculate the manifest of all files under the directory.
+
+    The manifest records the size, modification time, inode and hash value of
+    every file. The hash value of a file is reused from `previous_manifest` if
+    its other entries are unchanged, so only modified files are hashed again.
+    If `num_sampled_blocks` is positive, the hash value of that many sampled
+    blocks of each file is recorded and compared as well, to detect in-place
+    modifications which preserve the modification time.
+    """
+    previous_manifest = previous_manifest or {}
+    manifest = {}
+    for dirpath, _, filenames in os.walk(dir_path):
+        for filename in filenames:
+            if ignore and filename in ignore:
+                continue
+            filepath = os.path.join(dirpath, filename)
+            stat = os.stat(filepath)
+            entry = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "inode": stat.st_ino,
+            }
+            if num_sampled_blocks > 0:
+                entry["sampled_hash"] = calculate_file_sampled_hash(
+                    filepath, num_sampled_blocks, hash_algo=hash_algo
+                )
+            previous_entry = previous_manifest.get(filepath)
+            if (
+                isinstance(previous_entry, dict)
+                and "hash" in previous_entry
+                and all(previous_entry.get(k) == v for k, v in entry.items())
+            ):
+                entry["hash"] = previous_entry["hash"]
+            else:
+                entry["hash"] = calculate_file_hash(filepath, hash_algo)
+            manifest[filepath] = entry
+    return manifest
+
+
+def _manifest_to_hashes(manifest):
+    # Hash files written by older versions map file paths to hash values.
+    return {
+        filepath: entry["hash"] if isinstance(entry, dict) else entry
+        for filepath, entry in manifest.items()
+    }
+
+
+def check_dataset_change(dataset_dir, processed_dir, num_sampled_blocks=0):
+    """Check whether dataset has been changed by checking its manifest.
+
+    Only the files whose size, modification time or inode differ from the
+    recorded manifest are hashed again. If the content is unchanged, the
+    manifest is refreshed so that the next check is fast again.
+    """
     hash_value_file = "dataset_hash_value.txt"
     hash_value_file_path = os.path.join(
         dataset_dir, processed_dir, hash_value_file
@@ -203,10 +307,18 @@ def check_dataset_change(dataset_dir, processed_dir):
     if not os.path.exists(hash_value_file_path):
         return True
     with open(hash_value_file_path, "r") as f:
-        oringinal_hash_value = json.load(f)
-    present_hash_value = calculate_dir_hash(dataset_dir, ignore=hash_value_file)
-    if oringinal_hash_value == present_hash_value:
-        force_preprocess = False
-    else:
-        force_preprocess = True
-    return force_preprocess
+        original_manifest = json.load(f)
+    present_manifest = calculate_dir_manifest(
+        dataset_dir,
+        ignore=hash_value_file,
+        previous_manifest=original_manifest,
+        num_sampled_blocks=num_sampled_blocks,
+    )
+    if _manifest_to_hashes(original_manifest) != _manifest_to_hashes(
+        present_manifest
+    ):
+        return True
+    if original_manifest != present_manifest:
+        with open(hash_value_file_path, "w") as f:
+            f.write(json.dumps(present_manifest, indent=4))
+    return False
@@ -166,14 +166,21 @@ class ItemShufflerAndBatcher:
             # `buffer` is a dict of tensors/lists/tuples.
             keys = list(buffer.keys())
             key_indices = torch.searchsorted(offsets, indices, right=True) - 1
+            # Group the indices by key with a single stable sort instead of
+            # scanning the whole batch once per key. The stable sort keeps the
+            # shuffled order within each key.
+            key_indices, order = torch.sort(key_indices, stable=True)
+            local_indices = indices[order] - offsets[key_indices]
+            counts = torch.bincount(key_indices, minlength=len(keys))
             batch = {}
-            for j, key in enumerate(keys):
-                mask = (key_indices == j).nonzero().squeeze(1)
-                if len(mask) == 0:
+            for key, count, key_local_indices in zip(
+                keys,
+                counts.tolist(),
+                torch.split(local_indices, counts.tolist()),
+            ):
+                if count == 0:
                     continue
-                batch[key] = self._collate_batch(
-                    buffer[key], indices[mask] - offsets[j]
-                )
+                batch[key] = self._collate_batch(buffer[key], key_local_indices)
             return batch
         raise TypeError(f"Unsupported buffer type {type(buffer).__name__}.")
 
@@ -3,6 +3,7 @@
 import textwrap
 from typing import Dict, Iterable, Iterator, Sized, Tuple, Union
 
+import numpy as np
 import torch
 
 __all__ = ["ItemSet", "ItemSetDict"]
@@ -137,6 +138,109 @@ class ItemSet:
             )
         else:
             self._names = None
+        # If set, the items live in the named shared memory or in the numpy
+        # files at these paths, and are attached to instead of being copied
+        # when the itemset is pickled to worker processes.
+        self._shared_memory_name = None
+        self._mmap_paths = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self._shared_memory_name is not None or self._mmap_paths is not None:
+            state["_items"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._shared_memory_name is not None:
+            self._items = tuple(
+                torch.ops.graphbolt.load_tensors_from_shared_memory(
+                    self._shared_memory_name
+                )
+            )
+        elif self._mmap_paths is not None:
+            self._items = tuple(
+                torch.as_tensor(np.load(path, mmap_mode="r+"))
+                for path in self._mmap_paths
+            )
+
+    @classmethod
+    def from_numpy_files(
+        cls, paths: Tuple[str], names: Union[str, Tuple[str]] = None
+    ) -> "ItemSet":
+        """Create an itemset of the items memory-mapped from numpy files.
+
+        When the returned itemset is sent to other processes, e.g. the workers
+        of :class:`dgl.graphbolt.DataLoader`, they map the files again instead
+        of receiving a copy of the items.
+
+        Parameters
+        ----------
+        paths : Tuple[str]
+            Paths to the ``.npy`` files, one for each item.
+        names : Union[str, Tuple[str]], optional
+            The names of the items.
+
+        Returns
+        -------
+        ItemSet
+            The itemset of the memory-mapped items.
+        """
+        paths = tuple(paths)
+        item_set = cls(
+            tuple(
+                torch.as_tensor(np.load(path, mmap_mode="r+")) for path in paths
+            ),
+            names=names,
+        )
+        item_set._mmap_paths = paths
+        return item_set
+
+    def copy_to_shared_memory(self, shared_memory_name: str) -> "ItemSet":
+        """Copy the items to shared memory.
+
+        When the returned itemset is sent to other processes, e.g. the workers
+        of :class:`dgl.graphbolt.DataLoader`, they attach to the shared memory
+        instead of receiving a copy of the items. The shared memory is released
+        once the returned itemset and the itemsets attached to it are
+        destroyed, so it has to outlive the worker processes.
+
+        Parameters
+        ----------
+        shared_memory_name : str
+            Name of the shared memory.
+
+        Returns
+        -------
+        ItemSet
+            The copied itemset on shared memory.
+
+        Examples
+        --------
+        >>> import torch
+        >>> from dgl import graphbolt as gb
+        >>> item_set = gb.ItemSet(torch.arange(0, 5), names="seed_nodes")
+        >>> shm_item_set = item_set.copy_to_shared_memory("train_set")
+        >>> shm_item_set[:]
+        tensor([0, 1, 2, 3, 4])
+        """
+        if is_scalar(self._items):
+            # There is nothing worth sharing.
+            return self
+        assert all(isinstance(item, torch.Tensor) for item in self._items), (
+            f"Only the items of torch.Tensor type can be copied to shared "
+            f"memory, but got {[type(item) for item in self._items]}."
+        )
+        item_set = ItemSet(
+            tuple(
+                torch.ops.graphbolt.copy_tensors_to_shared_memory(
+                    shared_memory_name, list(self._items)
+                )
+            ),
+            names=self._names,
+        )
+        item_set._shared_memory_name = shared_memory_name
+        return item_set
 
     def __iter__(self) -> Iterator:
         if is_scalar(self._items):
@@ -367,6 +471,29 @@ class ItemSetDict:
 
         raise TypeError(f"{type(self).__name__} indices must be int or slice.")
 
+    def copy_to_shared_memory(self, shared_memory_name: str) -> "ItemSetDict":
+        """Copy the items of all the itemsets to shared memory.
+
+        See :meth:`ItemSet.copy_to_shared_memory` for details.
+
+        Parameters
+        ----------
+        shared_memory_name : str
+            Name of the shared memory. The itemset of each key is copied to
+            its own shared memory named by appending the index of the key.
+
+        Returns
+        -------
+        ItemSetDict
+            The copied itemset dict on shared memory.
+        """
+        return ItemSetDict(
+            {
+                key: itemset.copy_to_shared_memory(f"{shared_memory_name}_{i}")
+                for i, (key, itemset) in enumerate(self._itemsets.items())
+            }
+        )
+
     @property
     def names(self) -> Tuple[str]:
         """Return the names of the items."""
@@ -160,11 +160,17 @@ def get_shared_mem_array(name, shape, dtype):
     F.tensor
         The tensor got from shared memory.
     """
+    is_bf16 = dtype == F.data_type_dict.get("bfloat16")
     new_arr = empty_shared_mem(
-        name, False, shape, F.reverse_data_type_dict[dtype]
+        name,
+        False,
+        shape,
+        "int16" if is_bf16 else F.reverse_data_type_dict[dtype],
     )
     dlpack = new_arr.to_dlpack()
-    return F.zerocopy_from_dlpack(dlpack)
+    arr = F.zerocopy_from_dlpack(dlpack)
+    # DGL NDArray has no bfloat16 type, so its bits are stored as int16.
+    return arr.view(dtype) if is_bf16 else arr
 
 
 def create_shared_mem_array(name, shape, dtype):
@@ -184,11 +190,17 @@ def create_shared_mem_array(name, shape, dtype):
     F.tensor
         The created tensor.
     """
+    is_bf16 = dtype == F.data_type_dict.get("bfloat16")
     new_arr = empty_shared_mem(
-        name, True, shape, F.reverse_data_type_dict[dtype]
+        name,
+        True,
+        shape,
+        "int16" if is_bf16 else F.reverse_data_type_dict[dtype],
     )
     dlpack = new_arr.to_dlpack()
-    return F.zerocopy_from_dlpack(dlpack)
+    arr = F.zerocopy_from_dlpack(dlpack)
+    # DGL NDArray has no bfloat16 type, so its bits are stored as int16.
+    return arr.view(dtype) if is_bf16 else arr
 
 
 def exist_shared_mem_array(name):
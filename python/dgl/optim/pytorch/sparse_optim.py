@@ -1,6 +1,7 @@
 """Node embedding optimizers"""
 import abc
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 import torch as th
 
@@ -15,6 +16,11 @@ from ...utils import (
     scatter_pinned_tensor_rows,
 )
 
+# The number of elements of the gradients updated together by one task of
+# the fused CPU update, small enough for the rows of a task to stay in cache.
+_FUSED_CHUNK_ELEMS = 1 << 16
+_STATE_DTYPES = [th.float16, th.bfloat16, th.float32]
+
 
 class SparseGradOptimizer(abc.ABC):
     r"""The abstract sparse optimizer.
@@ -40,6 +46,7 @@ class SparseGradOptimizer(abc.ABC):
         self._comm = None
         self._first_step = True
         self._device = None
+        self._executor = None
         # hold released shared memory to let other process to munmap it first
         # otherwise it will crash the training
         self.shmem_buffer_holder = []
@@ -448,6 +455,58 @@ class SparseGradOptimizer(abc.ABC):
             Sparse node embedding to update.
         """
 
+    def _fused_update(self, idx, grad, kernel):
+        """Update the rows of an embedding on the CPU in place.
+
+        The gradients are sorted by row once, then the unique rows are split
+        into chunks updated by parallel threads. Every chunk averages the
+        gradients of its rows and calls ``kernel(rows, grad_rows)``, which
+        reads, updates and writes back these rows of the weight and the states,
+        so that a chunk stays in cache during the whole update.
+
+        Parameters
+        ----------
+        idx : tensor
+            Index of the embeddings to be updated.
+        grad : tensor
+            Gradient of each embedding.
+        kernel : callable
+            The update of the given unique rows with their averaged gradients.
+        """
+        sorted_idx, perm = th.sort(idx)
+        rows, cnt = th.unique_consecutive(sorted_idx, return_counts=True)
+        # the update is non-linear so the gradients of a row are averaged
+        has_dup = rows.shape[0] != idx.shape[0]
+        offsets = th.cumsum(cnt, 0)
+        chunk_size = max(1, _FUSED_CHUNK_ELEMS // max(1, grad.shape[1]))
+
+        def _update_chunk(start):
+            end = min(start + chunk_size, rows.shape[0])
+            if not has_dup:
+                kernel(rows[start:end], grad[perm[start:end]])
+                return
+            lo = int(offsets[start - 1]) if start > 0 else 0
+            hi = int(offsets[end - 1])
+            chunk_cnt = cnt[start:end]
+            seg = th.repeat_interleave(
+                th.arange(end - start, device=grad.device), chunk_cnt
+            )
+            grad_rows = grad.new_zeros((end - start, grad.shape[1]))
+            grad_rows.index_add_(0, seg, grad[perm[lo:hi]])
+            kernel(rows[start:end], grad_rows.div_(chunk_cnt.unsqueeze(1)))
+
+        starts = range(0, rows.shape[0], chunk_size)
+        if len(starts) <= 1:
+            for start in starts:
+                _update_chunk(start)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=th.get_num_threads()
+            )
+        # the rows are unique so the chunks write to disjoint rows
+        list(self._executor.map(_update_chunk, starts))
+
     def zero_grad(self):
         """clean grad cache"""
         self._clean_grad = True
@@ -529,6 +588,9 @@ class SparseAdagrad(SparseGradOptimizer):
     eps : float, Optional
         The term added to the denominator to improve numerical stability
         Default: 1e-10
+    dtype : torch.dtype, Optional
+        The type to store optimizer state with, one of th.float32, th.float16
+        and th.bfloat16. Default: th.float32.
 
     Examples
     --------
@@ -545,9 +607,14 @@ class SparseAdagrad(SparseGradOptimizer):
     ...     optimizer.step()
     """
 
-    def __init__(self, params, lr, eps=1e-10):
+    def __init__(self, params, lr, eps=1e-10, dtype=th.float32):
         super(SparseAdagrad, self).__init__(params, lr)
         self._eps = eps
+        assert dtype in _STATE_DTYPES, (
+            "Unsupported dtype {}. Valid choices are th.float32, th.float16 "
+            "and th.bfloat16".format(dtype)
+        )
+        self._dtype = dtype
 
         # setup tensors for optimizer states
         self.setup(self._params)
@@ -565,12 +632,12 @@ class SparseAdagrad(SparseGradOptimizer):
                 if self._rank < 0:
                     state = th.empty(
                         emb.weight.shape,
-                        dtype=th.float32,
+                        dtype=self._dtype,
                         device=th.device("cpu"),
                     ).zero_()
                 elif self._rank == 0:
                     state = create_shared_mem_array(
-                        emb_name + "_state", emb.weight.shape, th.float32
+                        emb_name + "_state", emb.weight.shape, self._dtype
                     ).zero_()
 
                     if self._world_size > 1:
@@ -579,13 +646,13 @@ class SparseAdagrad(SparseGradOptimizer):
                     # receive
                     emb.store.wait([emb_name + "_opt"])
                     state = get_shared_mem_array(
-                        emb_name + "_state", emb.weight.shape, th.float32
+                        emb_name + "_state", emb.weight.shape, self._dtype
                     )
             else:
                 # distributed state on on gpu
                 state = th.empty(
                     emb.weight.shape,
-                    dtype=th.float32,
+                    dtype=self._dtype,
                     device=emb.weight.device,
                 ).zero_()
             emb.set_optm_state((state,))
@@ -606,6 +673,20 @@ class SparseAdagrad(SparseGradOptimizer):
         """
         eps = self._eps
         clr = self._lr
+        (state,) = emb.optm_state
+        state_dev = state.device
+
+        if state_dev.type == "cpu" and grad.device.type == "cpu":
+
+            def _update_rows(rows, grad_rows):
+                grad_state = state[rows].to(grad_rows.dtype)
+                grad_state.addcmul_(grad_rows, grad_rows)
+                state[rows] = grad_state.to(state.dtype)
+                grad_rows.div_(grad_state.add_(eps).sqrt_())
+                emb.weight.index_add_(0, rows, grad_rows, alpha=-clr)
+
+            self._fused_update(idx, grad, _update_rows)
+            return
 
         # the update is non-linear so indices must be unique
         grad_indices, inverse, cnt = th.unique(
@@ -618,12 +699,10 @@ class SparseAdagrad(SparseGradOptimizer):
         grad_values = grad_values / cnt.unsqueeze(1)
 
         grad_sum = grad_values * grad_values
-        (state,) = emb.optm_state
-        state_dev = state.device
         state_idx = grad_indices.to(state_dev)
-        grad_state = state[state_idx].to(grad.device)
+        grad_state = state[state_idx].to(grad.device, grad_values.dtype)
         grad_state += grad_sum
-        state[state_idx] = grad_state.to(state_dev)
+        state[state_idx] = grad_state.to(state_dev, state.dtype)
 
         std_values = grad_state.add_(eps).sqrt_()
         tmp = clr * grad_values / std_values
@@ -683,7 +762,8 @@ class SparseAdam(SparseGradOptimizer):
         Default: True if the gradients are generated on the GPU, and False
         if the gradients are on the CPU.
     dtype : torch.dtype, Optional
-        The type to store optimizer state with. Default: th.float32.
+        The type to store optimizer state with, one of th.float32, th.float16
+        and th.bfloat16. Default: th.float32.
 
     Examples
     --------
@@ -717,9 +797,9 @@ class SparseAdam(SparseGradOptimizer):
         self._use_uva = use_uva
         self._nd_handle = {}
         self._is_using_uva = {}
-        assert dtype in [th.float16, th.float32], (
-            "Unsupported dtype {}. Valid choices are th.float32 "
-            "and th.float32".format(dtype)
+        assert dtype in _STATE_DTYPES, (
+            "Unsupported dtype {}. Valid choices are th.float32, th.float16 "
+            "and th.bfloat16".format(dtype)
         )
         self._dtype = dtype
 
@@ -854,6 +934,28 @@ class SparseAdam(SparseGradOptimizer):
             eps = self._eps
 
             clr = self._lr
+            if state_dev.type == "cpu" and exec_dev.type == "cpu":
+
+                def _update_rows(rows, grad_rows):
+                    step = state_step[rows] + 1
+                    state_step[rows] = step
+                    mem = state_mem[rows].to(grad_rows.dtype)
+                    power = state_power[rows].to(grad_rows.dtype)
+                    mem.mul_(beta1).add_(grad_rows, alpha=1.0 - beta1)
+                    power.mul_(beta2).addcmul_(
+                        grad_rows, grad_rows, value=1.0 - beta2
+                    )
+                    state_mem[rows] = mem.to(self._dtype)
+                    state_power[rows] = power.to(self._dtype)
+                    # bias corrections
+                    mem.div_((1.0 - th.pow(beta1, step)).unsqueeze(1))
+                    power.div_((1.0 - th.pow(beta2, step)).unsqueeze(1))
+                    mem.div_(power.sqrt_().add_(eps))
+                    emb.weight.index_add_(0, rows, mem, alpha=-clr)
+
+                self._fused_update(idx, grad, _update_rows)
+                return
+
             # There can be duplicated indices due to sampling.
             # Thus unique them here and average the gradient here.
             grad_indices, inverse, cnt = th.unique(
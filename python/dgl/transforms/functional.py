@@ -18,13 +18,12 @@
 
 import copy
 from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import scipy.sparse as sparse
 import scipy.sparse.linalg
 
-from ..utils import version
-
 try:
     import torch as th
 except ImportError:
@@ -53,6 +52,7 @@ from ..partition import (
     partition_graph_with_halo,
 )
 from ..sampling.neighbor import sample_neighbors
+from ..sampling.randomwalks import random_walk
 
 __all__ = [
     "line_graph",
@@ -3550,7 +3550,32 @@ def radius_graph(
     return g
 
 
-def random_walk_pe(g, k, eweight_name=None):
+def _return_probs(P, nodes, k):
+    r"""Return the probabilities of landing back on each of :attr:`nodes`
+    after 1 to k steps of random walk with transition matrix :attr:`P`.
+
+    The walks are propagated as a sparse matrix with a row per node, which
+    only holds the nodes reachable so far."""
+    rows = np.arange(len(nodes))
+    X = sparse.csr_matrix(
+        (np.ones(len(nodes)), (rows, nodes)), shape=(len(nodes), P.shape[0])
+    )
+    probs = np.zeros((len(nodes), k))
+    for t in range(k):
+        X = X @ P
+        probs[:, t] = np.asarray(X[rows, nodes]).ravel()
+    return probs
+
+
+def random_walk_pe(
+    g,
+    k,
+    eweight_name=None,
+    mode="exact",
+    batch_size=1024,
+    num_workers=1,
+    num_walks=100,
+):
     r"""Random Walk Positional Encoding, as introduced in
     `Graph Neural Networks with Learnable Structural and Positional Representations
     <https://arxiv.org/abs/2110.07875>`__
@@ -3567,6 +3592,24 @@ def random_walk_pe(g, k, eweight_name=None):
         for two experiments.
     eweight_name : str, optional
         The name to retrieve the edge weights. Default: None, not using the edge weights.
+    mode : str, optional
+        How to compute the landing probabilities. Default: ``"exact"``.
+
+        * ``"exact"``: propagate the walks from :attr:`batch_size` nodes at a
+          time with sparse matrix products. The memory is bounded by
+          :attr:`batch_size` times the number of nodes within k hops.
+        * ``"monte_carlo"``: estimate the probabilities with
+          :attr:`num_walks` random walks from every node, which scales to
+          very large graphs.
+    batch_size : int, optional
+        The number of starting nodes whose walks are computed at once.
+        Default: 1024.
+    num_workers : int, optional
+        The number of threads computing the batches in the ``"exact"`` mode.
+        Default: 1.
+    num_walks : int, optional
+        The number of random walks per node in the ``"monte_carlo"`` mode.
+        Default: 100.
 
     Returns
     -------
@@ -3583,32 +3626,52 @@ def random_walk_pe(g, k, eweight_name=None):
             [0.5000, 0.7500]])
     """
     N = g.num_nodes()  # number of nodes
-    M = g.num_edges()  # number of edges
-    A = g.adj_external(scipy_fmt="csr")  # adjacency matrix
+    if mode == "monte_carlo":
+        PE = np.zeros((N, k))
+        for start in range(0, N, batch_size):
+            nodes = np.arange(start, min(start + batch_size, N))
+            seeds = np.repeat(nodes, num_walks)
+            traces, _ = random_walk(
+                g,
+                F.copy_to(F.tensor(seeds, dtype=g.idtype), g.device),
+                length=k,
+                prob=eweight_name,
+            )
+            hits = F.asnumpy(traces)[:, 1:] == seeds[:, None]
+            PE[nodes] = hits.reshape(len(nodes), num_walks, k).mean(1)
+        return F.astype(F.tensor(PE), F.float32)
+    if mode != "exact":
+        raise DGLError(
+            "Expect mode to be 'exact' or 'monte_carlo', got {}".format(mode)
+        )
+
+    src, dst = g.edges()
+    src, dst = F.asnumpy(src), F.asnumpy(dst)
     if eweight_name is not None:
         # add edge weights if required
-        W = sparse.csr_matrix(
-            (g.edata[eweight_name].squeeze(), g.find_edges(list(range(M)))),
-            shape=(N, N),
-        )
-        A = A.multiply(W)
+        weight = F.asnumpy(g.edata[eweight_name]).reshape(-1)
+    else:
+        weight = np.ones(len(src))
+    A = sparse.csr_matrix((weight.astype(np.float64), (src, dst)), shape=(N, N))
     # 1-step transition probability
-    if version.parse(scipy.__version__) < version.parse("1.11.0"):
-        RW = np.array(A / (A.sum(1) + 1e-30))
+    out_weight = np.asarray(A.sum(1)).ravel()
+    RW = sparse.diags(1.0 / (out_weight + 1e-30)) @ A
+    RW = RW.tocsr()
+
+    batches = [
+        np.arange(start, min(start + batch_size, N))
+        for start in range(0, N, batch_size)
+    ]
+    if num_workers > 1:
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            probs = list(
+                executor.map(lambda nodes: _return_probs(RW, nodes, k), batches)
+            )
     else:
-        # Sparse matrix divided by a dense array returns a sparse matrix in
-        # scipy since 1.11.0.
-        RW = (A / (A.sum(1) + 1e-30)).toarray()
-
-    # Iterate for k steps
-    PE = [F.astype(F.tensor(np.array(RW.diagonal())), F.float32)]
-    RW_power = RW
-    for _ in range(k - 1):
-        RW_power = RW_power @ RW
-        PE.append(F.astype(F.tensor(np.array(RW_power.diagonal())), F.float32))
-    PE = F.stack(PE, dim=-1)
+        probs = [_return_probs(RW, nodes, k) for nodes in batches]
+    PE = np.concatenate(probs) if probs else np.zeros((0, k))
 
-    return PE
+    return F.astype(F.tensor(PE), F.float32)
 
 
 def lap_pe(g, k, padding=False, return_eigval=False):
@@ -3868,7 +3931,9 @@ def double_radius_node_labeling(g, src, dst):
     return F.tensor(z, F.int64)
 
 
-def shortest_dist(g, root=None, return_paths=False):
+def shortest_dist(
+    g, root=None, return_paths=False, max_dist=None, path_format="dense"
+):
     r"""Compute shortest distance and paths on the given graph.
 
     Only unweighted cases are supported. Only directed paths (in which the
@@ -3885,6 +3950,14 @@ def shortest_dist(g, root=None, return_paths=False):
     return_paths : bool, optional
         If True, it returns the shortest paths corresponding to the shortest
         distances. Default: False.
+    max_dist : int, optional
+        If given, the search from every source node stops at this distance,
+        and the node pairs farther apart are treated as unreachable. It bounds
+        both the cost of the search and the length of the paths, e.g., to the
+        maximum distance encoded by a spatial encoder. Default: None.
+    path_format : str, optional
+        The format of the returned paths, either ``"dense"`` or ``"ragged"``.
+        Default: ``"dense"``.
 
     Returns
     -------
@@ -3897,10 +3970,12 @@ def shortest_dist(g, root=None, return_paths=False):
         * Otherwise, it is a tensor of shape :math:`(N, N)`. :attr:`dist[i][j]`
           gives the shortest distance from node :attr:`i` to node :attr:`j`.
         * The distance values of unreachable node pairs are filled with -1.
-    paths : Tensor, optional
-        The shortest path tensor. It is only returned when :attr:`return_paths`
+    paths : Tensor or (Tensor, Tensor), optional
+        The shortest paths. It is only returned when :attr:`return_paths`
         is True.
 
+        If :attr:`path_format` is ``"dense"``, it is a tensor of edge IDs:
+
         * If :attr:`root` is a node ID, it is a tensor of shape :math:`(N, L)`,
           where :math:`L` is the length of the longest path. :attr:`path[j]` is
           the shortest path from node :attr:`root` to node :attr:`j`.
@@ -3911,6 +3986,12 @@ def shortest_dist(g, root=None, return_paths=False):
           at the end.
         * Shortest path between a node and itself is a vector filled with -1's.
 
+        If :attr:`path_format` is ``"ragged"``, it is a pair of tensors
+        ``(offsets, edge_ids)`` without any padding. The path of the
+        :math:`k`-th node pair, i.e., to node :attr:`k` from :attr:`root` or
+        from node :math:`k // N` to node :math:`k \% N` for all pairs, is
+        ``edge_ids[offsets[k]:offsets[k + 1]]``.
+
     Example
     -------
     >>> import dgl
@@ -3944,8 +4025,18 @@ def shortest_dist(g, root=None, return_paths=False):
              [-1, -1],
              [-1, -1],
              [-1, -1]]])
+    >>> offsets, edge_ids = dgl.shortest_dist(
+    ...     g, root=0, return_paths=True, path_format="ragged")[1]
+    >>> print(offsets, edge_ids)
+    tensor([0, 0, 0, 1, 3]) tensor([0, 0, 3])
     """
-    if root is None:
+    if path_format not in ["dense", "ragged"]:
+        raise DGLError(
+            "Expect path_format to be 'dense' or 'ragged', got {}".format(
+                path_format
+            )
+        )
+    if root is None and max_dist is None:
         dist, pred = sparse.csgraph.shortest_path(
             g.adj_external(scipy_fmt="csr"),
             return_predecessors=True,
@@ -3953,60 +4044,62 @@ def shortest_dist(g, root=None, return_paths=False):
             directed=True,
         )
     else:
+        # Dijkstra on an unweighted graph is a BFS, which can stop early.
         dist, pred = sparse.csgraph.dijkstra(
             g.adj_external(scipy_fmt="csr"),
             directed=True,
             indices=root,
             return_predecessors=True,
             unweighted=True,
+            limit=np.inf if max_dist is None else max_dist,
         )
     dist[np.isinf(dist)] = -1
 
     if not return_paths:
         return F.copy_to(F.tensor(dist, dtype=F.int64), g.device)
 
-    def _get_nodes(pred, i, j):
-        r"""return node IDs of a path from i to j given predecessors"""
-        if i == j:
-            return []
-        prev = pred[j]
-        nodes = [j, prev]
-        while prev != i:
-            prev = pred[prev]
-            nodes.append(prev)
-        nodes.reverse()
-
-        return nodes
-
-    # construct paths with given predecessors
-    max_len = int(dist[~np.isinf(dist)].max())
+    # Walk the predecessors of all the paths at once, from their last edge
+    # to their first one.
     N = g.num_nodes()
-    roots = list(range(N)) if root is None else [root]
-    paths = np.ones([len(roots), N, max_len], dtype=np.int64) * -1
-    masks, u, v = [], [], []
-    for i in roots:
-        pred_ = pred[i] if root is None else pred
-        masks_i = np.zeros([N, max_len], dtype=bool)
-        for j in range(N):
-            if pred_[j] < 0:
-                continue
-            nodes = _get_nodes(pred_, i, j)
-            u.extend(nodes[:-1])
-            v.extend(nodes[1:])
-            if nodes:
-                masks_i[j, : len(nodes) - 1] = True
-        masks.append(masks_i)
-    masks = np.stack(masks, axis=0)
-
-    u, v = np.array(u), np.array(v)
-    edge_ids = g.edge_ids(u, v)
-    paths[masks] = F.asnumpy(edge_ids)
-    if root is not None:
-        paths = paths[0]
-
-    return F.copy_to(F.tensor(dist, dtype=F.int64), g.device), F.copy_to(
-        F.tensor(paths, dtype=F.int64), g.device
-    )
+    lengths = np.maximum(dist, 0).astype(np.int64).ravel()
+    pred = pred.reshape(-1, N)
+    pair = np.nonzero(lengths)[0]
+    src, cur, pos = pair // N, pair % N, lengths[pair]
+    pairs, positions, u, v = [], [], [], []
+    while len(pair) > 0:
+        prev = pred[src, cur]
+        pos = pos - 1
+        pairs.append(pair)
+        positions.append(pos)
+        u.append(prev)
+        v.append(cur)
+        keep = pos > 0
+        pair, src, cur, pos = pair[keep], src[keep], prev[keep], pos[keep]
+    if pairs:
+        pairs, positions = np.concatenate(pairs), np.concatenate(positions)
+        edge_ids = F.asnumpy(
+            g.edge_ids(np.concatenate(u), np.concatenate(v))
+        ).astype(np.int64)
+    else:
+        pairs = positions = edge_ids = np.zeros(0, dtype=np.int64)
+
+    if path_format == "ragged":
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        path_eids = np.empty(offsets[-1], dtype=np.int64)
+        path_eids[offsets[pairs] + positions] = edge_ids
+        paths = (
+            F.copy_to(F.tensor(offsets, dtype=F.int64), g.device),
+            F.copy_to(F.tensor(path_eids, dtype=F.int64), g.device),
+        )
+    else:
+        max_len = int(lengths.max()) if len(lengths) > 0 else 0
+        paths = np.full((len(lengths), max_len), -1, dtype=np.int64)
+        paths[pairs, positions] = edge_ids
+        paths = paths.reshape(dist.shape + (max_len,))
+        paths = F.copy_to(F.tensor(paths, dtype=F.int64), g.device)
+
+    return F.copy_to(F.tensor(dist, dtype=F.int64), g.device), paths
 
 
 def svd_pe(g, k, padding=False, random_flip=True):
@@ -610,6 +610,14 @@ def make_invmap(array, use_numpy=True):
     return uniques, invmap, remapped
 
 
+def concat_ranges(starts, counts):
+    """Return the concatenation of the ranges
+    ``[starts[i], starts[i] + counts[i])`` as a numpy array."""
+    ends = np.cumsum(counts)
+    total = int(ends[-1]) if len(ends) > 0 else 0
+    return np.arange(total) + np.repeat(starts - (ends - counts), counts)
+
+
 def expand_as_pair(input_, g=None):
     """Return a pair of same element if the input is not a pair.
 
@@ -119,6 +119,51 @@ def test_partition_policy():
     assert edge_policy.get_part_size() == len(local_eid)
 
 
+@unittest.skipIf(
+    os.name == "nt" or os.getenv("DGLBACKEND") != "pytorch",
+    reason="Only support PyTorch on Linux",
+)
+def test_remote_row_cache():
+    # Nodes [0, 3) are local, nodes [3, 6) are owned by the other machine.
+    two_part_gpb = dgl.distributed.graph_partition_book.RangePartitionBook(
+        part_id=0,
+        num_parts=2,
+        node_map={"_N": F.tensor([[0, 3], [3, 6]], F.int64)},
+        edge_map={("_N", "_E", "_N"): F.tensor([[0, 4], [4, 7]], F.int64)},
+        ntypes={"_N": 0},
+        etypes={("_N", "_E", "_N"): 0},
+    )
+    policy = dgl.distributed.PartitionPolicy(
+        policy_str="node~_N", partition_book=two_part_gpb
+    )
+    data = F.tensor(np.arange(12).reshape(6, 2), F.float32)
+    pulled = []
+
+    def pull_func(id_tensor):
+        pulled.append(F.asnumpy(id_tensor).tolist())
+        return data[id_tensor]
+
+    cache = dgl.distributed.remote_row_cache.RemoteRowCache(
+        policy, 8, (2,), F.float32, max_staleness=2
+    )
+    id_tensor = F.tensor([0, 4, 5, 4], F.int64)
+    for _ in range(2):
+        res = cache.pull(id_tensor, pull_func)
+        assert_array_equal(F.asnumpy(res), F.asnumpy(data[id_tensor]))
+    # Local rows are never cached.
+    assert pulled == [[0, 4, 5, 4], [0]]
+    assert cache.num_queries == 6
+    assert cache.num_hits == 3
+    # Pushed rows are invalidated right away.
+    cache.invalidate(F.tensor([5], F.int64))
+    cache.pull(id_tensor, pull_func)
+    assert pulled[-1] == [0, 5]
+    # The other rows expire after max_staleness pushes.
+    cache.invalidate(F.tensor([0], F.int64))
+    cache.pull(id_tensor, pull_func)
+    assert pulled[-1] == [0, 4, 4]
+
+
 def start_server(server_id, num_clients, num_servers):
     # Init kvserver
     print("Sleep 5 seconds to test client re-connect.")
@@ -263,6 +308,22 @@ def start_client(num_clients, num_servers):
     assert_array_equal(F.asnumpy(res), F.asnumpy(data_tensor))
     res = kvclient.pull(name="data_2", id_tensor=id_tensor)
     assert_array_equal(F.asnumpy(res), F.asnumpy(data_tensor))
+    # Test async pull, coalescing pulls of different data
+    future_0 = kvclient.pull_async(
+        name="data_0", id_tensor=id_tensor, flush=False
+    )
+    future_1 = kvclient.pull_async(
+        name="data_1", id_tensor=id_tensor, flush=False
+    )
+    future_2 = kvclient.pull_async(name="data_2", id_tensor=id_tensor)
+    res = kvclient.pull(name="data_0", id_tensor=id_tensor)
+    assert_array_equal(F.asnumpy(res), F.asnumpy(data_tensor))
+    for future in [future_2, future_0, future_1]:
+        assert_array_equal(F.asnumpy(future.wait()), F.asnumpy(data_tensor))
+    res = kvclient.pull_async(
+        name="data_0", id_tensor=F.tensor([], F.int64)
+    ).wait()
+    assert F.shape(res) == (0, 2)
     # Register new push handler
     kvclient.register_push_handler("data_0", udf_push)
     kvclient.register_push_handler("data_1", udf_push)
@@ -327,6 +388,101 @@ def start_client_mul_role(i):
     dgl.distributed.exit_client()
 
 
+def two_machine_policy(part_id):
+    # Nodes [0, 3) are on machine 0, nodes [3, 6) are on machine 1.
+    two_part_gpb = dgl.distributed.graph_partition_book.RangePartitionBook(
+        part_id=part_id,
+        num_parts=2,
+        node_map={"_N": F.tensor([[0, 3], [3, 6]], F.int64)},
+        edge_map={("_N", "_E", "_N"): F.tensor([[0, 4], [4, 7]], F.int64)},
+        ntypes={"_N": 0},
+        etypes={("_N", "_E", "_N"): 0},
+    )
+    return dgl.distributed.PartitionPolicy(
+        policy_str="node~_N", partition_book=two_part_gpb
+    )
+
+
+# Both machines run on this host and thus share the shared memory of the data,
+# so they hold the same rows. machine_pull tells the machines apart.
+part_data_a = F.tensor(np.arange(6).reshape(3, 2), F.float32)
+part_data_b = F.tensor(np.arange(9).reshape(3, 3), F.float32)
+
+
+def machine_pull(target, name, id_tensor):
+    return target[name][id_tensor] + 100 * dgl.distributed.rpc.get_machine_id()
+
+
+def expected_pull(part_data, id_tensor):
+    ids = F.asnumpy(id_tensor)
+    return F.asnumpy(part_data)[ids % 3] + 100 * (ids // 3)[:, None]
+
+
+def start_server_two_machines(server_id, num_clients, num_servers):
+    kvserver = dgl.distributed.KVServer(
+        server_id=server_id,
+        ip_config="kv_ip_2m_config.txt",
+        num_servers=num_servers,
+        num_clients=num_clients,
+    )
+    kvserver.add_part_policy(two_machine_policy(kvserver.part_id))
+    kvserver.init_data("data_a", "node~_N", part_data_a)
+    kvserver.init_data("data_b", "node~_N", part_data_b)
+    server_state = dgl.distributed.ServerState(
+        kv_store=kvserver, local_g=None, partition_book=None
+    )
+    dgl.distributed.start_server(
+        server_id=server_id,
+        ip_config="kv_ip_2m_config.txt",
+        num_servers=num_servers,
+        num_clients=num_clients,
+        server_state=server_state,
+    )
+
+
+def start_client_two_machines(num_servers):
+    os.environ["DGL_DIST_MODE"] = "distributed"
+    dgl.distributed.initialize(ip_config="kv_ip_2m_config.txt")
+    kvclient = dgl.distributed.KVClient(
+        ip_config="kv_ip_2m_config.txt", num_servers=num_servers
+    )
+    policy = two_machine_policy(0)
+    kvclient.map_shared_data(partition_book=policy.partition_book)
+    assert kvclient.machine_id == 0
+    kvclient.register_pull_handler("data_a", machine_pull)
+    kvclient.register_pull_handler("data_b", machine_pull)
+    id_a = F.tensor([4, 0, 5, 1, 3], F.int64)
+    id_b = F.tensor([2, 3, 3, 0, 5, 4], F.int64)
+    id_remote = F.tensor([5, 3], F.int64)
+    # Coalesce the pulls of both tensors into one request to machine 1.
+    future_a = kvclient.pull_async(name="data_a", id_tensor=id_a, flush=False)
+    future_b = kvclient.pull_async(name="data_b", id_tensor=id_b, flush=False)
+    future_remote = kvclient.pull_async(name="data_a", id_tensor=id_remote)
+    # A blocking pull receives the batched response in the meantime.
+    res = kvclient.pull(name="data_b", id_tensor=id_a)
+    assert_array_equal(F.asnumpy(res), expected_pull(part_data_b, id_a))
+    assert_array_equal(
+        F.asnumpy(future_b.wait()), expected_pull(part_data_b, id_b)
+    )
+    assert_array_equal(
+        F.asnumpy(future_remote.wait()), expected_pull(part_data_a, id_remote)
+    )
+    assert_array_equal(
+        F.asnumpy(future_a.wait()), expected_pull(part_data_a, id_a)
+    )
+    # Pulls which are waited for before being flushed.
+    future_b = kvclient.pull_async(name="data_b", id_tensor=id_a, flush=False)
+    future_a = kvclient.pull_async(name="data_a", id_tensor=id_b, flush=False)
+    assert_array_equal(
+        F.asnumpy(future_a.wait()), expected_pull(part_data_a, id_b)
+    )
+    assert_array_equal(
+        F.asnumpy(future_b.wait()), expected_pull(part_data_b, id_a)
+    )
+    kvclient.barrier()
+    dgl.distributed.exit_client()
+
+
 @unittest.skipIf(
     os.name == "nt" or os.getenv("DGLBACKEND") == "tensorflow",
     reason="Do not support windows and TF yet",
@@ -391,7 +547,36 @@ def test_kv_multi_role():
         pserver_list[i].join()
 
 
+@unittest.skipIf(
+    os.name == "nt" or os.getenv("DGLBACKEND") != "pytorch",
+    reason="Only support PyTorch on Linux",
+)
+def test_kv_store_pull_async_two_machines():
+    reset_envs()
+    num_servers = 1
+    num_clients = 1
+    generate_ip_config("kv_ip_2m_config.txt", 2, num_servers)
+    ctx = mp.get_context("spawn")
+    pserver_list = []
+    os.environ["DGL_NUM_SERVER"] = str(num_servers)
+    for i in range(2 * num_servers):
+        pserver = ctx.Process(
+            target=start_server_two_machines,
+            args=(i, num_clients, num_servers),
+        )
+        pserver.start()
+        pserver_list.append(pserver)
+    pclient = ctx.Process(target=start_client_two_machines, args=(num_servers,))
+    pclient.start()
+    pclient.join()
+    assert pclient.exitcode == 0
+    for pserver in pserver_list:
+        pserver.join()
+        assert pserver.exitcode == 0
+
+
 if __name__ == "__main__":
     test_partition_policy()
     test_kv_store()
     test_kv_multi_role()
+    test_kv_store_pull_async_two_machines()
@@ -289,6 +289,75 @@ def test_serialize():
     assert res.x == res1.x
 
 
+class MyStructRequest(dgl.distributed.Request):
+    def __init__(self, seed, name, fanout, prob, replace, label=None):
+        self.seed = seed
+        self.name = name
+        self.fanout = fanout
+        self.prob = prob
+        self.replace = replace
+        self.label = label
+
+    def __getstate__(self):
+        return (
+            self.seed,
+            self.name,
+            self.fanout,
+            self.prob,
+            self.replace,
+            self.label,
+        )
+
+    def __setstate__(self, state):
+        (
+            self.seed,
+            self.name,
+            self.fanout,
+            self.prob,
+            self.replace,
+            self.label,
+        ) = state
+
+    def process_request(self, server_state):
+        pass
+
+
+def test_serialize_struct_codec():
+    reset_envs()
+    os.environ["DGL_DIST_MODE"] = "distributed"
+    from dgl.distributed.rpc import (
+        deserialize_from_payload,
+        serialize_to_payload,
+    )
+
+    dgl.distributed.register_struct_codec(
+        MyStructRequest, ("tensor", "str", "int", "float", "bool", "opt_str")
+    )
+    seed = F.tensor([1, 2, 3])
+    for label in [None, "löss"]:
+        req = MyStructRequest(seed, "prob", -1, 0.5, True, label)
+        data, tensors = serialize_to_payload(req)
+        assert data[0] == 0x01
+        assert len(tensors) == 1
+        req1 = deserialize_from_payload(MyStructRequest, data, tensors)
+        assert F.array_equal(req1.seed, seed)
+        assert req1.name == "prob"
+        assert req1.fanout == -1
+        assert req1.prob == 0.5
+        assert req1.replace is True
+        assert req1.label == label
+
+    # States which do not fit the schema fall back to pickle.
+    req = MyStructRequest(seed, None, [1, 2], 0.5, False)
+    data, tensors = serialize_to_payload(req)
+    assert data[0] != 0x01
+    req1 = deserialize_from_payload(MyStructRequest, data, tensors)
+    assert F.array_equal(req1.seed, seed)
+    assert req1.name is None
+    assert req1.fanout == [1, 2]
+    assert req1.replace is False
+
+
 def test_rpc_msg():
     reset_envs()
     os.environ["DGL_DIST_MODE"] = "distributed"
@@ -418,6 +487,7 @@ def test_multi_client_connect():
 
 if __name__ == "__main__":
     test_serialize()
+    test_serialize_struct_codec()
     test_rpc_msg()
     test_multi_client("socket")
     test_multi_client("tesnsorpipe")
@@ -1787,6 +1787,35 @@ def test_as_linkpred():
     assert 4000 < ds.test_edges[1][0].shape[0] <= 4224
 
 
+@unittest.skipIf(
+    F._default_context_str == "gpu",
+    reason="Datasets don't need to be tested on GPU.",
+)
+def test_negative_sample():
+    from dgl.data.adapter import negative_sample
+
+    g = dgl.rand_graph(30, 200)
+    src, dst = F.asnumpy(g.edges()[0]), F.asnumpy(g.edges()[1])
+    edges = set(zip(src.tolist(), dst.tolist()))
+    for num_workers, batch_size in [(1, 1 << 20), (3, 50)]:
+        neg_src, neg_dst = negative_sample(
+            g, 500, batch_size=batch_size, num_workers=num_workers, seed=1
+        )
+        pairs = list(zip(neg_src.tolist(), neg_dst.tolist()))
+        assert len(set(pairs)) == len(pairs) == 500
+        assert all(u != v and (u, v) not in edges for u, v in pairs)
+        # Reproducible with a seed.
+        neg_src2, neg_dst2 = negative_sample(
+            g, 500, batch_size=batch_size, num_workers=num_workers, seed=1
+        )
+        assert np.array_equal(neg_src, neg_src2)
+        assert np.array_equal(neg_dst, neg_dst2)
+    # All the negative edges are returned if fewer than requested exist.
+    num_negatives = 30 * 29 - len({(u, v) for u, v in edges if u != v})
+    neg_src, _ = negative_sample(g, 10000, batch_size=64, seed=2)
+    assert len(neg_src) == num_negatives
+
+
 @unittest.skipIf(
     F._default_context_str == "gpu",
     reason="Datasets don't need to be tested on GPU.",
@@ -440,3 +440,95 @@ def test_deserialize_old_graph():
     assert "csc" in g.formats()["not created"]
     assert num_nodes == g.num_nodes()
     assert num_edges == g.num_edges()
+
+
+@unittest.skipIf(F._default_context_str == "gpu", reason="GPU not implemented")
+def test_graph_archive():
+    num_graphs = 20
+    g_list = construct_graph(num_graphs)
+    labels = {"label": F.arange(0, num_graphs), "w": F.randn((num_graphs, 3))}
+    with tempfile.TemporaryDirectory() as path:
+        # The graphs can be streamed from a generator.
+        dgl.data.utils.save_graph_archive(path, (g for g in g_list), labels)
+        dataset = dgl.data.utils.GraphArchiveDataset(path)
+        assert len(dataset) == num_graphs
+        for idx in [0, 7, num_graphs - 1, -1]:
+            load_g, load_labels = dataset[idx]
+            g = g_list[idx]
+            assert load_g.num_nodes() == g.num_nodes()
+            load_edges = load_g.edges()
+            g_edges = g.edges()
+            assert F.array_equal(load_edges[0], g_edges[0])
+            assert F.array_equal(load_edges[1], g_edges[1])
+            assert F.allclose(load_g.edata["e1"], g.edata["e1"])
+            assert F.allclose(load_g.edata["e2"], g.edata["e2"])
+            assert F.allclose(load_g.ndata["n1"], g.ndata["n1"])
+            assert F.asnumpy(load_labels["label"]) == idx % num_graphs
+            assert F.allclose(load_labels["w"], labels["w"][idx])
+        with pytest.raises(IndexError):
+            dataset[num_graphs]
+
+        # A batch is built directly from the archive.
+        idx = [3, 0, 15, 3]
+        bg, batch_labels = dataset.batch(idx)
+        expected = dgl.batch([g_list[i] for i in idx])
+        assert F.array_equal(bg.batch_num_nodes(), expected.batch_num_nodes())
+        assert F.array_equal(bg.batch_num_edges(), expected.batch_num_edges())
+        assert F.array_equal(bg.edges()[0], expected.edges()[0])
+        assert F.array_equal(bg.edges()[1], expected.edges()[1])
+        assert F.allclose(bg.ndata["n1"], expected.ndata["n1"])
+        assert F.allclose(bg.edata["e1"], expected.edata["e1"])
+        assert np.array_equal(F.asnumpy(batch_labels["label"]), idx)
+
+        # The dataset can be sent to the DataLoader workers.
+        import pickle
+
+        dataset = pickle.loads(pickle.dumps(dataset))
+        assert F.allclose(dataset[3][0].ndata["n1"], g_list[3].ndata["n1"])
+
+
+@unittest.skipIf(F._default_context_str == "gpu", reason="GPU not implemented")
+def test_graph_archive_heterograph():
+    g_list0 = create_heterographs2(F.int32)[:1] * 2
+    g_list0.append(
+        dgl.heterograph(
+            {
+                ("user", "follows", "user"): ([0], [1]),
+                ("user", "knows", "user"): ([], []),
+                ("user", "knows", "knowledge"): ([1], [0]),
+            },
+            idtype=F.int32,
+        )
+    )
+    with tempfile.TemporaryDirectory() as path:
+        # The graphs must have the same features.
+        with pytest.raises(dgl.DGLError):
+            dgl.data.utils.save_graph_archive(path, g_list0)
+        g_list0[-1].nodes["user"].data["h"] = F.randn((2, 3))
+        g_list0[-1].nodes["user"].data["hh"] = F.ones((2, 5))
+        g_list0[-1].edges["follows"].data["w"] = F.randn((1, 2))
+        g_list0[-1].edges[("user", "knows", "user")].data["ww"] = F.randn(
+            (0, 10)
+        )
+        dgl.data.utils.save_graph_archive(path, g_list0)
+
+        dataset = dgl.data.utils.GraphArchiveDataset(path)
+        for g0, (g, labels) in zip(g_list0, dataset):
+            assert labels == {}
+            assert g.idtype == F.int32
+            assert g.canonical_etypes == g0.canonical_etypes
+            for ntype in g0.ntypes:
+                assert g.num_nodes(ntype) == g0.num_nodes(ntype)
+            for etype in g0.canonical_etypes:
+                assert F.array_equal(
+                    g.edges(etype=etype)[0], g0.edges(etype=etype)[0]
+                )
+                assert F.array_equal(
+                    g.edges(etype=etype)[1], g0.edges(etype=etype)[1]
+                )
+            assert F.allclose(
+                g.nodes["user"].data["h"], g0.nodes["user"].data["h"]
+            )
+            assert F.allclose(
+                g.edges["follows"].data["w"], g0.edges["follows"].data["w"]
+            )
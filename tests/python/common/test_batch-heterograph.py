@@ -452,6 +452,10 @@ def test_unbatch2(idtype):
     check_graph_equal(g2, gg2)
     check_graph_equal(g3, gg3)
 
+    # the edges cannot connect nodes of different graphs
+    with pytest.raises(dgl.DGLError):
+        dgl.unbatch(bg, F.tensor([2, 6, 4]), F.tensor([3, 3, 3]))
+
 
 @parametrize_idtype
 def test_slice_batch(idtype):
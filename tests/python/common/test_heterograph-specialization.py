@@ -371,6 +371,42 @@ def test_spmv_3d_feat(idtype):
     assert F.allclose(g.ndata["h"], ans)
 
 
+@parametrize_idtype
+def test_update_all_udf_degree_padding(idtype):
+    g = dgl.rand_graph(100, 1000).astype(idtype).to(F.ctx())
+    g.ndata["h"] = F.randn((100, D))
+    g.edata["w"] = F.randn((1000, 1))
+
+    def message_func(edges):
+        return {"m": edges.src["h"] * edges.data["w"]}
+
+    def sum_reduce(nodes):
+        return {"s": F.sum(nodes.mailbox["m"], 1)}
+
+    def max_reduce(nodes):
+        return {"x": F.max(nodes.mailbox["m"], 1)}
+
+    def first_reduce(nodes):
+        # the messages are ordered by edge ID
+        return {"f": nodes.mailbox["m"][:, 0]}
+
+    g.update_all(fn.u_mul_e("h", "w", "m"), fn.sum("m", "s_ref"))
+    g.update_all(fn.u_mul_e("h", "w", "m"), fn.max("m", "x_ref"))
+    g.update_all(message_func, first_reduce)
+    f_ref = g.ndata.pop("f")
+    try:
+        dgl.use_udf_degree_padding(2.0)
+        g.update_all(message_func, sum_reduce)
+        g.update_all(message_func, first_reduce)
+        dgl.use_udf_degree_padding(2.0, fill_value=-float("inf"))
+        g.update_all(message_func, max_reduce)
+    finally:
+        dgl.use_udf_degree_padding(None)
+    assert F.allclose(g.ndata["s"], g.ndata["s_ref"])
+    assert F.allclose(g.ndata["x"], g.ndata["x_ref"])
+    assert F.allclose(g.ndata["f"], f_ref)
+
+
 if __name__ == "__main__":
     test_v2v_update_all()
     test_v2v_snr()
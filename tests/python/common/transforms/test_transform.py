@@ -3075,6 +3075,25 @@ def test_module_random_walk_pe(idtype):
     assert F.allclose(new_g.ndata["rwpe"], tgt)
 
 
+@parametrize_idtype
+def test_random_walk_pe(idtype):
+    g = dgl.graph(([0, 1, 1], [1, 1, 0]), idtype=idtype, device=F.ctx())
+    tgt = F.tensor([[0.0, 0.5], [0.5, 0.75]])
+    pe = dgl.random_walk_pe(g, 2, batch_size=1, num_workers=2)
+    assert F.allclose(pe, tgt)
+
+    g.edata["w"] = F.copy_to(F.tensor([1.0, 1.0, 3.0]), g.device)
+    tgt = F.tensor([[0.0, 0.75], [0.25, 0.8125]])
+    pe = dgl.random_walk_pe(g, 2, eweight_name="w")
+    assert F.allclose(pe, tgt)
+
+    # The walks on a directed cycle are deterministic.
+    g = dgl.graph(([0, 1, 2], [1, 2, 0]), idtype=idtype, device=F.ctx())
+    pe = dgl.random_walk_pe(g, 4, mode="monte_carlo", num_walks=10)
+    tgt = F.tensor([[0.0, 0.0, 1.0, 0.0]] * 3)
+    assert F.allclose(pe, tgt)
+
+
 @parametrize_idtype
 def test_module_lap_pe(idtype):
     g = dgl.graph(
@@ -3362,6 +3381,48 @@ def test_shortest_dist(idtype):
     assert F.array_equal(dist, tgt_dist)
     assert F.array_equal(paths, tgt_paths)
 
+    # case 3: ragged paths
+    dist, (offsets, edge_ids) = dgl.shortest_dist(
+        g, root=None, return_paths=True, path_format="ragged"
+    )
+    assert F.array_equal(dist, tgt_dist)
+    tgt_offsets = F.copy_to(
+        F.tensor(
+            [0, 0, 0, 1, 3, 4, 4, 6, 7, 7, 7, 7, 8, 8, 8, 8, 8],
+            dtype=F.int64,
+        ),
+        g.device,
+    )
+    tgt_edge_ids = F.copy_to(
+        F.tensor([0, 0, 3, 1, 1, 0, 2, 3], dtype=F.int64), g.device
+    )
+    assert F.array_equal(offsets, tgt_offsets)
+    assert F.array_equal(edge_ids, tgt_edge_ids)
+
+    # case 4: maximum distance
+    dist, paths = dgl.shortest_dist(g, root=None, return_paths=True, max_dist=1)
+    tgt_dist = F.copy_to(
+        F.tensor(
+            [[0, -1, 1, -1], [1, 0, -1, 1], [-1, -1, 0, 1], [-1, -1, -1, 0]],
+            dtype=F.int64,
+        ),
+        g.device,
+    )
+    tgt_paths = F.copy_to(
+        F.tensor(
+            [
+                [[-1], [-1], [0], [-1]],
+                [[1], [-1], [-1], [2]],
+                [[-1], [-1], [-1], [3]],
+                [[-1], [-1], [-1], [-1]],
+            ],
+            dtype=F.int64,
+        ),
+        g.device,
+    )
+    assert F.array_equal(dist, tgt_dist)
+    assert F.array_equal(paths, tgt_paths)
+
 
 @parametrize_idtype
 def test_module_to_levi(idtype):
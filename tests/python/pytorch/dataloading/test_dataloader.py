@@ -34,6 +34,33 @@ def test_graph_dataloader(batch_size):
             assert F.asnumpy(label).ndim == 0
 
 
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_graph_dataloader_graph_archive(num_workers, tmpdir):
+    minigc_dataset = dgl.data.MiniGCDataset(32, 10, 20)
+    graphs, labels = zip(*minigc_dataset)
+    dgl.data.utils.save_graph_archive(
+        str(tmpdir), graphs, {"label": torch.stack(labels)}
+    )
+    dataset = dgl.data.utils.GraphArchiveDataset(str(tmpdir))
+    data_loader = dgl.dataloading.GraphDataLoader(
+        dataset, batch_size=8, num_workers=num_workers
+    )
+    for i, (graph, label) in enumerate(data_loader):
+        expected = dgl.batch(graphs[i * 8 : (i + 1) * 8])
+        assert graph.batch_size == 8
+        assert F.array_equal(
+            graph.batch_num_nodes(), expected.batch_num_nodes()
+        )
+        assert F.array_equal(
+            graph.batch_num_edges(), expected.batch_num_edges()
+        )
+        assert F.array_equal(graph.edges()[0], expected.edges()[0])
+        assert F.array_equal(graph.edges()[1], expected.edges()[1])
+        assert F.array_equal(
+            label["label"], torch.stack(labels[i * 8 : (i + 1) * 8])
+        )
+
+
 @unittest.skipIf(os.name == "nt", reason="Do not support windows yet")
 @pytest.mark.parametrize("num_workers", [0, 4])
 def test_cluster_gcn(num_workers):
@@ -48,6 +75,46 @@ def test_cluster_gcn(num_workers):
         pass
 
 
+@unittest.skipIf(os.name == "nt", reason="Do not support windows yet")
+def test_cluster_gcn_cache(tmpdir):
+    g = dgl.rand_graph(200, 2000)
+    g.ndata["feat"] = torch.randn(200, 4)
+    g.edata["w"] = torch.randn(2000)
+    cache_path = os.path.join(str(tmpdir), "cluster_gcn")
+    sampler = dgl.dataloading.ClusterGCNSampler(
+        g, 10, cache_path=cache_path, cache_ndata=["feat"]
+    )
+    # The partitions are read back from the cache.
+    sampler2 = dgl.dataloading.ClusterGCNSampler(
+        g, 10, cache_path=cache_path, cache_ndata=["feat"]
+    )
+    assert torch.equal(sampler.partition_offset, sampler2.partition_offset)
+    with pytest.raises(dgl.DGLError):
+        dgl.dataloading.ClusterGCNSampler(g, 20, cache_path=cache_path)
+
+    offset, node_ids = sampler.partition_offset, sampler.partition_node_ids
+    for partition_ids in [torch.tensor([3]), torch.tensor([7, 0, 4])]:
+        sg = sampler2.sample(g, partition_ids)
+        expected = g.subgraph(
+            torch.cat(
+                [node_ids[offset[i] : offset[i + 1]] for i in partition_ids]
+            )
+        )
+        assert torch.equal(sg.ndata[dgl.NID], expected.ndata[dgl.NID])
+        assert torch.equal(sg.ndata["feat"], expected.ndata["feat"])
+        # The edges may be in a different order.
+        eids, order = torch.sort(sg.edata[dgl.EID])
+        expected_eids, expected_order = torch.sort(expected.edata[dgl.EID])
+        assert torch.equal(eids, expected_eids)
+        assert torch.equal(
+            sg.edata["w"][order], expected.edata["w"][expected_order]
+        )
+        src, dst = sg.edges()
+        expected_src, expected_dst = expected.edges()
+        assert torch.equal(src[order], expected_src[expected_order])
+        assert torch.equal(dst[order], expected_dst[expected_order])
+
+
 @pytest.mark.parametrize("num_workers", [0, 4])
 def test_shadow(num_workers):
     g = dgl.data.CoraFullDataset()[0]
@@ -93,6 +160,56 @@ def test_saint(num_workers, mode):
         pass
 
 
+@pytest.mark.parametrize("mode", ["node", "edge", "walk"])
+def test_saint_norm(mode, tmpdir):
+    g = dgl.rand_graph(100, 1000)
+    budget = (10, 2) if mode == "walk" else 50
+
+    cache_path = os.path.join(str(tmpdir), "saint.pkl")
+    sampler = dgl.dataloading.SAINTSampler(
+        mode, budget, num_norm_subgraphs=20, cache_path=cache_path
+    )
+    sampler.prepare(g)
+    assert sampler.loss_norm.shape == (g.num_nodes(),)
+    assert sampler.aggr_norm.shape == (g.num_edges(),)
+    sg = sampler.sample(g, None)
+    assert torch.equal(
+        sg.ndata["loss_norm"], sampler.loss_norm[sg.ndata[dgl.NID]]
+    )
+    assert torch.equal(
+        sg.edata["aggr_norm"], sampler.aggr_norm[sg.edata[dgl.EID]]
+    )
+
+    # The alias table and the coefficients are loaded from the cache.
+    sampler2 = dgl.dataloading.SAINTSampler(
+        mode, budget, num_norm_subgraphs=20, cache_path=cache_path
+    )
+    sampler2.prepare(g)
+    assert torch.equal(sampler2.loss_norm, sampler.loss_norm)
+    assert torch.equal(sampler2.aggr_norm, sampler.aggr_norm)
+
+    sampler3 = dgl.dataloading.SAINTSampler(
+        mode, budget, num_norm_subgraphs=10, cache_path=cache_path
+    )
+    with pytest.raises(dgl.DGLError):
+        sampler3.prepare(g)
+
+
+def test_saint_norm_unprepared_workers(tmpdir):
+    g = dgl.rand_graph(100, 1000)
+    cache_path = os.path.join(str(tmpdir), "saint.pkl")
+    sampler = dgl.dataloading.SAINTSampler(
+        "node", 50, num_norm_subgraphs=20, cache_path=cache_path
+    )
+    # The workers prepare the graph at the same time.
+    dataloader = dgl.dataloading.DataLoader(
+        g, torch.arange(100), sampler, num_workers=4
+    )
+    for sg in dataloader:
+        assert sg.ndata["loss_norm"].shape == (sg.num_nodes(),)
+    assert os.listdir(str(tmpdir)) == ["saint.pkl"]
+
+
 @parametrize_idtype
 @pytest.mark.parametrize(
     "mode", ["cpu", "uva_cuda_indices", "uva_cpu_indices", "pure_gpu"]
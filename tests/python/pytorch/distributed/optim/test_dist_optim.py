@@ -13,6 +13,7 @@ import backend as F
 
 import dgl
 import numpy as np
+import pytest
 import torch as th
 from dgl import function as fn
 from dgl.distributed import (
@@ -188,6 +189,97 @@ def check_sparse_adam(num_trainer=1, shared_mem=True):
         p.join()
 
 
+def run_multi_trainer_client(
+    graph_name, rank, num_trainers, server_count, init_method, async_step
+):
+    time.sleep(5)
+    os.environ["DGL_NUM_SERVER"] = str(server_count)
+    dgl.distributed.initialize("optim_ip_config.txt")
+    th.distributed.init_process_group(
+        "gloo", init_method=init_method, rank=rank, world_size=num_trainers
+    )
+    gpb, graph_name, _, _ = load_partition_book(
+        "/tmp/dist_graph/{}.json".format(graph_name), 0
+    )
+    g = DistGraph(graph_name, gpb=gpb)
+    policy = dgl.distributed.PartitionPolicy("node", g.get_partition_book())
+    num_nodes = g.num_nodes()
+    emb_dim = 4
+    lr = 0.01
+    emb = DistEmbedding(
+        num_nodes,
+        emb_dim,
+        name="optim_multi_{}".format(async_step),
+        init_func=initializer,
+        part_policy=policy,
+    )
+    optimizer = SparseAdagrad([emb], lr=lr, async_step=async_step)
+    assert optimizer._world_size == num_trainers
+
+    # Every trainer sees all the gradients to build the reference. The ids
+    # repeat within a trainer and across trainers, and the two trainers own
+    # the even and the odd ids respectively.
+    ref = initializer((num_nodes, emb_dim), th.float32)
+    ref_state = th.zeros_like(ref)
+    for step in range(3):
+        th.manual_seed(step)
+        idx = th.randint(0, 50, (num_trainers, 20))
+        coef = th.randn(num_trainers, 20, emb_dim)
+        with th.enable_grad():
+            value = emb(idx[rank])
+            optimizer.zero_grad()
+            loss = (value * coef[rank]).sum()
+        loss.backward()
+        optimizer.step()
+
+        uniq, inverse, cnt = th.unique(
+            idx.flatten(), return_inverse=True, return_counts=True
+        )
+        grad = th.zeros(len(uniq), emb_dim).index_add_(
+            0, inverse, coef.reshape(-1, emb_dim)
+        ) / cnt.unsqueeze(1)
+        ref_state[uniq] += grad * grad
+        ref[uniq] -= lr * grad / (ref_state[uniq].sqrt() + 1e-10)
+    optimizer.flush()
+    th.distributed.barrier()
+
+    ids = th.arange(num_nodes)
+    assert F.allclose(emb.weight[ids], ref)
+    th.distributed.destroy_process_group()
+
+
+def check_sparse_adagrad_multi_trainer(async_step, num_trainers=2):
+    prepare_dist()
+    g = create_random_graph(2000)
+    graph_name = "dist_graph_test"
+    partition_graph(g, graph_name, 1, "/tmp/dist_graph")
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    init_method = "tcp://127.0.0.1:{}".format(sock.getsockname()[1])
+    sock.close()
+
+    # A single server shared by all the trainers, each trainer updating the
+    # ids equal to its rank modulo the number of trainers.
+    ctx = mp.get_context("spawn")
+    serv_p = ctx.Process(
+        target=run_server, args=(graph_name, 0, 1, num_trainers, True)
+    )
+    serv_p.start()
+    cli_ps = []
+    for rank in range(num_trainers):
+        p = ctx.Process(
+            target=run_multi_trainer_client,
+            args=(graph_name, rank, num_trainers, 1, init_method, async_step),
+        )
+        p.start()
+        cli_ps.append(p)
+
+    for p in cli_ps:
+        p.join()
+        assert p.exitcode == 0
+    serv_p.join()
+
+
 @unittest.skipIf(os.name == "nt", reason="Do not support windows yet")
 def test_sparse_opt():
     os.environ["DGL_DIST_MODE"] = "distributed"
@@ -195,6 +287,13 @@ def test_sparse_opt():
     check_sparse_adam(1, False)
 
 
+@unittest.skipIf(os.name == "nt", reason="Do not support windows yet")
+@pytest.mark.parametrize("async_step", [False, True])
+def test_sparse_opt_multi_trainer(async_step):
+    os.environ["DGL_DIST_MODE"] = "distributed"
+    check_sparse_adagrad_multi_trainer(async_step)
+
+
 if __name__ == "__main__":
     os.makedirs("/tmp/dist_graph", exist_ok=True)
     test_sparse_opt()
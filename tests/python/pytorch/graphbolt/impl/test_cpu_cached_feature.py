@@ -0,0 +1,148 @@
+import pytest
+import torch
+
+from dgl import graphbolt as gb
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        torch.bool,
+        torch.uint8,
+        torch.int8,
+        torch.int16,
+        torch.int32,
+        torch.int64,
+        torch.float16,
+        torch.bfloat16,
+        torch.float32,
+        torch.float64,
+    ],
+)
+@pytest.mark.parametrize(
+    "policy", ["set-associative", "lru", "clock", "s3-fifo"]
+)
+@pytest.mark.parametrize("cache_size_a", [1, 1024])
+@pytest.mark.parametrize("cache_size_b", [1, 1024])
+def test_cpu_cached_feature(dtype, policy, cache_size_a, cache_size_b):
+    a = torch.tensor([[1, 2, 3], [4, 5, 6]], dtype=dtype)
+    b = torch.tensor([[[1, 2], [3, 4]], [[4, 5], [6, 7]]], dtype=dtype)
+
+    feat_store_a = gb.CPUCachedFeature(
+        gb.TorchBasedFeature(a), cache_size_a, policy
+    )
+    feat_store_b = gb.CPUCachedFeature(
+        gb.TorchBasedFeature(b), cache_size_b, policy
+    )
+
+    # Test read the entire feature.
+    assert torch.equal(feat_store_a.read(), a)
+    assert torch.equal(feat_store_b.read(), b)
+
+    # Test read with ids.
+    assert torch.equal(
+        feat_store_a.read(torch.tensor([0])),
+        torch.tensor([[1, 2, 3]], dtype=dtype),
+    )
+    assert torch.equal(
+        feat_store_b.read(torch.tensor([1, 1])),
+        torch.tensor([[[4, 5], [6, 7]], [[4, 5], [6, 7]]], dtype=dtype),
+    )
+    assert torch.equal(
+        feat_store_a.read(torch.tensor([1, 1])),
+        torch.tensor([[4, 5, 6], [4, 5, 6]], dtype=dtype),
+    )
+    assert torch.equal(
+        feat_store_b.read(torch.tensor([0])),
+        torch.tensor([[[1, 2], [3, 4]]], dtype=dtype),
+    )
+    # The cache should be full now for the large cache sizes, %100 hit expected.
+    if cache_size_a >= 1024:
+        total_miss = feat_store_a._feature.total_miss
+        feat_store_a.read(torch.tensor([0, 1]))
+        assert total_miss == feat_store_a._feature.total_miss
+    if cache_size_b >= 1024:
+        total_miss = feat_store_b._feature.total_miss
+        feat_store_b.read(torch.tensor([0, 1]))
+        assert total_miss == feat_store_b._feature.total_miss
+    assert 0 <= feat_store_a.miss_rate <= 1
+
+    # Test get the size of the entire feature with ids.
+    assert feat_store_a.size() == torch.Size([3])
+    assert feat_store_b.size() == torch.Size([2, 2])
+
+    # Test update the entire feature.
+    feat_store_a.update(torch.tensor([[0, 1, 2], [3, 5, 2]], dtype=dtype))
+    assert torch.equal(
+        feat_store_a.read(),
+        torch.tensor([[0, 1, 2], [3, 5, 2]], dtype=dtype),
+    )
+    assert torch.equal(
+        feat_store_a.read(torch.tensor([1, 0])),
+        torch.tensor([[3, 5, 2], [0, 1, 2]], dtype=dtype),
+    )
+
+    # Test update with ids.
+    feat_store_a.update(
+        torch.tensor([[2, 0, 1]], dtype=dtype),
+        torch.tensor([0]),
+    )
+    assert torch.equal(
+        feat_store_a.read(),
+        torch.tensor([[2, 0, 1], [3, 5, 2]], dtype=dtype),
+    )
+    assert torch.equal(
+        feat_store_a.read(torch.tensor([0, 1])),
+        torch.tensor([[2, 0, 1], [3, 5, 2]], dtype=dtype),
+    )
+
+
+@pytest.mark.parametrize(
+    "policy", ["set-associative", "lru", "clock", "s3-fifo"]
+)
+def test_cpu_cache_eviction(policy):
+    cache = gb.CPUCache((4, 2), torch.float32, policy)
+    values = torch.arange(40, dtype=torch.float32).reshape(20, 2)
+    for _ in range(3):
+        for start in range(0, 20, 3):
+            keys = torch.arange(start, min(start + 6, 20))
+            result, missing_index, missing_keys = cache.query(keys)
+            result[missing_index] = values[missing_keys]
+            cache.replace(missing_keys, values[missing_keys])
+            assert torch.equal(result, values[keys])
+            assert len(cache) <= 4
+    assert cache.total_queries > cache.total_miss > 0
+
+
+def test_cpu_cache_set_associative_batch():
+    cache = gb.CPUCache((16, 1), torch.float32, "set-associative")
+    # Keys colliding in the same set beyond its ways are not all admitted,
+    # and a key repeated in a batch keeps its last value.
+    keys = torch.tensor([0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 4])
+    values = keys.float().unsqueeze(1)
+    values[-1] = -4
+    cache.replace(keys, values)
+    assert len(cache) == 8
+    result, missing_index, missing_keys = cache.query(keys)
+    hit = torch.ones(keys.shape[0], dtype=torch.bool)
+    hit[missing_index] = False
+    assert torch.equal(keys[~hit], missing_keys)
+    expected = values.clone()
+    expected[keys == 4] = -4
+    assert torch.equal(result[hit], expected[hit])
+    assert result[2].item() == -4
+
+
+@pytest.mark.parametrize("capacity", [13, 16, 20])
+def test_cpu_cache_set_associative_capacity(capacity):
+    # A capacity which is not a multiple of the ways is fully used.
+    cache = gb.CPUCache((capacity, 1), torch.float32, "set-associative")
+    keys = torch.arange(100)
+    values = keys.float().unsqueeze(1)
+    cache.replace(keys, values)
+    assert len(cache) == capacity
+    result, missing_index, _ = cache.query(keys)
+    hit = torch.ones(keys.shape[0], dtype=torch.bool)
+    hit[missing_index] = False
+    assert hit.sum() == capacity
+    assert torch.equal(result[hit], values[hit])
@@ -0,0 +1,75 @@
+import os
+import pickle
+import tempfile
+
+import numpy as np
+import pytest
+import torch
+
+from dgl import graphbolt as gb
+
+
+@pytest.mark.parametrize("dtype", [np.int32, np.int64, np.float16, np.float32])
+@pytest.mark.parametrize("max_gap", [0, 1, 16])
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_disk_based_feature(dtype, max_gap, num_threads):
+    with tempfile.TemporaryDirectory() as test_dir:
+        path = os.path.join(test_dir, "a.npy")
+        a = np.arange(1000 * 6, dtype=dtype).reshape(1000, 2, 3)
+        np.save(path, a)
+        metadata = {"max_value": 3}
+        feature = gb.DiskBasedFeature(
+            path, metadata, num_threads=num_threads, max_gap=max_gap
+        )
+
+        # Read the entire feature.
+        assert torch.equal(feature.read(), torch.from_numpy(a))
+
+        # Read the feature with ids, including duplicated and empty ids.
+        for ids in [
+            torch.tensor([0]),
+            torch.tensor([999, 0, 999, 3]),
+            torch.arange(1000),
+            torch.randint(0, 1000, (300,)),
+            torch.tensor([], dtype=torch.int64),
+        ]:
+            assert torch.equal(feature.read(ids), torch.from_numpy(a)[ids])
+        ids = torch.randint(0, 1000, (100,))
+        assert torch.equal(
+            feature.read_async(ids).result(), torch.from_numpy(a)[ids]
+        )
+
+        # Size and metadata.
+        assert feature.size() == torch.Size([2, 3])
+        assert feature.metadata() == metadata
+
+        # Update with ids, the last value wins for duplicated ids.
+        ids = torch.tensor([10, 11, 500, 10])
+        value = torch.from_numpy(
+            np.arange(4 * 6, dtype=dtype).reshape(4, 2, 3) * -1
+        )
+        feature.update(value, ids)
+        assert torch.equal(
+            feature.read(torch.tensor([10, 11, 500])), value[[3, 1, 2]]
+        )
+
+        # The feature can be pickled to be sent to other processes.
+        feature2 = pickle.loads(pickle.dumps(feature))
+        assert torch.equal(feature2.read(ids), feature.read(ids))
+
+        # Update the entire feature.
+        value = torch.from_numpy(np.zeros((5, 2, 3), dtype=dtype))
+        feature.update(value)
+        assert torch.equal(feature.read(torch.arange(5)), value)
+        with pytest.raises(AssertionError):
+            feature.read(torch.tensor([5]))
+        feature = None
+        feature2 = None
+
+
+def test_disk_based_feature_1d():
+    with tempfile.TemporaryDirectory() as test_dir:
+        path = os.path.join(test_dir, "a.npy")
+        np.save(path, np.arange(10))
+        with pytest.raises(AssertionError):
+            gb.DiskBasedFeature(path)
@@ -1099,7 +1099,11 @@ def test_OnDiskDataset_Metadata():
 
 
 @pytest.mark.parametrize("edge_fmt", ["csv", "numpy"])
-def test_OnDiskDataset_preprocess_homogeneous(edge_fmt):
+@pytest.mark.parametrize("memory_limit_in_bytes", [None, 4096])
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_OnDiskDataset_preprocess_homogeneous(
+    edge_fmt, memory_limit_in_bytes, num_workers
+):
     """Test preprocess of OnDiskDataset."""
     with tempfile.TemporaryDirectory() as test_dir:
         # All metadata fields are specified.
@@ -1121,7 +1125,10 @@ def test_OnDiskDataset_preprocess_homogeneous(edge_fmt):
         with open(yaml_file, "w") as f:
             f.write(yaml_content)
         output_file = gb.ondisk_dataset.preprocess_ondisk_dataset(
-            test_dir, include_original_edge_id=False
+            test_dir,
+            include_original_edge_id=False,
+            memory_limit_in_bytes=memory_limit_in_bytes,
+            num_workers=num_workers,
         )
 
         with open(output_file, "rb") as f:
@@ -1195,9 +1202,33 @@ def test_OnDiskDataset_preprocess_homogeneous(edge_fmt):
         fused_csc_sampling_graph = None
 
 
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_OnDiskDataset_preprocess_out_of_core_failure(num_workers):
+    """Test that a failed out-of-core preprocess removes its spill files."""
+    with tempfile.TemporaryDirectory() as test_dir:
+        yaml_content = gbt.random_homo_graphbolt_graph(
+            test_dir, "graphbolt_test", 4000, 20000, 10, edge_fmt="numpy"
+        )
+        yaml_file = os.path.join(test_dir, "metadata.yaml")
+        with open(yaml_file, "w") as f:
+            f.write(yaml_content)
+        # Fail the topology conversion by removing the edges.
+        edges_path = yaml.safe_load(yaml_content)["graph"]["edges"][0]["path"]
+        os.remove(os.path.join(test_dir, edges_path))
+        with pytest.raises(Exception):
+            gb.ondisk_dataset.preprocess_ondisk_dataset(
+                test_dir,
+                include_original_edge_id=False,
+                memory_limit_in_bytes=4096,
+                num_workers=num_workers,
+            )
+        assert os.listdir(os.path.join(test_dir, "preprocessed")) == []
+
+
 @pytest.mark.parametrize("auto_cast", [False, True])
+@pytest.mark.parametrize("memory_limit_in_bytes", [None, 256])
 def test_OnDiskDataset_preprocess_homogeneous_hardcode(
-    auto_cast, edge_fmt="numpy"
+    auto_cast, memory_limit_in_bytes, edge_fmt="numpy"
 ):
     """Test preprocess of OnDiskDataset."""
     with tempfile.TemporaryDirectory() as test_dir:
@@ -1320,6 +1351,7 @@ def test_OnDiskDataset_preprocess_homogeneous_hardcode(
             test_dir,
             include_original_edge_id=True,
             auto_cast_to_optimal_dtype=auto_cast,
+            memory_limit_in_bytes=memory_limit_in_bytes,
         )
 
         with open(output_file, "rb") as f:
@@ -1381,8 +1413,10 @@ def test_OnDiskDataset_preprocess_homogeneous_hardcode(
 
 
 @pytest.mark.parametrize("auto_cast", [False, True])
+@pytest.mark.parametrize("memory_limit_in_bytes", [None, 256])
+@pytest.mark.parametrize("num_workers", [0, 2])
 def test_OnDiskDataset_preprocess_heterogeneous_hardcode(
-    auto_cast, edge_fmt="numpy"
+    auto_cast, memory_limit_in_bytes, num_workers, edge_fmt="numpy"
 ):
     """Test preprocess of OnDiskDataset."""
     with tempfile.TemporaryDirectory() as test_dir:
@@ -1531,6 +1565,8 @@ def test_OnDiskDataset_preprocess_heterogeneous_hardcode(
             test_dir,
             include_original_edge_id=True,
             auto_cast_to_optimal_dtype=auto_cast,
+            memory_limit_in_bytes=memory_limit_in_bytes,
+            num_workers=num_workers,
         )
 
         with open(output_file, "rb") as f:
@@ -1969,6 +2005,47 @@ def test_OnDiskDataset_preprocess_auto_force_preprocess(capsys):
         assert captured == ["The dataset is already preprocessed.", ""]
 
 
+def test_OnDiskDataset_preprocess_sampled_blocks(capsys):
+    """Test that sampled blocks detect in-place changes of the dataset."""
+    with tempfile.TemporaryDirectory() as test_dir:
+        yaml_content = gbt.random_homo_graphbolt_graph(
+            test_dir, "graphbolt_test", 4000, 20000, 10
+        )
+        yaml_file = os.path.join(test_dir, "metadata.yaml")
+        with open(yaml_file, "w") as f:
+            f.write(yaml_content)
+        gb.ondisk_dataset.preprocess_ondisk_dataset(
+            test_dir, include_original_edge_id=False, num_sampled_blocks=4
+        )
+        capsys.readouterr()
+
+        # Change the end of the edge feature in place, keeping its size,
+        # modification time and inode.
+        edge_feat_path = os.path.join(test_dir, "data", "edge-feat.npy")
+        stat = os.stat(edge_feat_path)
+        with open(edge_feat_path, "r+b") as f:
+            f.seek(-8, os.SEEK_END)
+            tail = f.read(8)
+            f.seek(-8, os.SEEK_END)
+            f.write(bytes(255 - b for b in tail))
+        os.utime(edge_feat_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        gb.ondisk_dataset.preprocess_ondisk_dataset(
+            test_dir, include_original_edge_id=False, num_sampled_blocks=4
+        )
+        captured = capsys.readouterr().out.split("\n")
+        assert captured[0] == (
+            "The on-disk dataset is re-preprocessing, so the existing "
+            + "preprocessed dataset has been removed."
+        )
+
+        # Change nothing.
+        gb.ondisk_dataset.preprocess_ondisk_dataset(
+            test_dir, include_original_edge_id=False, num_sampled_blocks=4
+        )
+        captured = capsys.readouterr().out.split("\n")
+        assert captured == ["The dataset is already preprocessed.", ""]
+
+
 def test_OnDiskDataset_preprocess_not_include_eids():
     with tempfile.TemporaryDirectory() as test_dir:
         # All metadata fields are specified.
@@ -3084,3 +3161,25 @@ def test_OnDiskDataset_preprocess_graph_with_single_type():
         )
         assert graph.edge_type_to_id == {"author:collab:author": 0}
         assert graph.node_type_to_id == {"author": 0}
+
+
+def test_OnDiskDataset_ItemSet_mmap_pickle():
+    with tempfile.TemporaryDirectory() as test_dir:
+        seed_nodes_path = os.path.join(test_dir, "seed_nodes.npy")
+        np.save(seed_nodes_path, np.arange(0, 10))
+        tvt_data = [
+            gb.OnDiskTVTSetData(
+                name="seed_nodes",
+                format="numpy",
+                in_memory=False,
+                path=seed_nodes_path,
+            )
+        ]
+        item_set = gb.impl.ondisk_dataset._tvt_data_to_item_set(tvt_data)
+        state = item_set.__getstate__()
+        # Only the paths are pickled, not the items.
+        assert state["_items"] is None
+        attached_item_set = pickle.loads(pickle.dumps(item_set))
+        assert torch.equal(attached_item_set[:], torch.arange(0, 10))
+        assert attached_item_set.names == ("seed_nodes",)
+        del item_set, attached_item_set
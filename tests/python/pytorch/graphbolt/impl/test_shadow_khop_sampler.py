@@ -0,0 +1,103 @@
+import backend as F
+import dgl.graphbolt as gb
+import pytest
+import torch
+
+
+def _induced_edges(subgraph, etype=None):
+    csc = subgraph.sampled_csc
+    row_ids = subgraph.original_row_node_ids
+    column_ids = subgraph.original_column_node_ids
+    if etype is not None:
+        src_type, _, dst_type = gb.etype_str_to_tuple(etype)
+        csc = csc[etype]
+        row_ids = row_ids[src_type]
+        column_ids = column_ids[dst_type]
+    src = row_ids[csc.indices]
+    dst = torch.repeat_interleave(column_ids, csc.indptr.diff())
+    return set(zip(src.tolist(), dst.tolist()))
+
+
+@pytest.mark.parametrize("fanouts", [[-1], [-1, -1]])
+def test_ShaDowKHopSampler_homo(fanouts):
+    """Original graph in COO:
+    1   0   1   0   1   0
+    1   0   0   1   0   1
+    0   1   0   1   0   0
+    0   1   0   0   1   0
+    1   0   0   0   0   1
+    0   0   1   0   1   0
+    """
+    indptr = torch.LongTensor([0, 3, 5, 7, 9, 12, 14])
+    indices = torch.LongTensor([0, 1, 4, 2, 3, 0, 5, 1, 2, 0, 3, 5, 1, 4])
+    graph = gb.fused_csc_sampling_graph(indptr, indices).to(F.ctx())
+    item_set = gb.ItemSet(torch.LongTensor([3]), names="seed_nodes")
+    item_sampler = gb.ItemSampler(item_set, batch_size=1).copy_to(F.ctx())
+    sampler = gb.ShaDowKHopSampler(item_sampler, graph, fanouts)
+
+    minibatch = next(iter(sampler))
+    expected_nodes = {1: [3, 1, 2], 2: [3, 1, 2, 0, 5]}[len(fanouts)]
+    assert minibatch.input_nodes[0].item() == 3
+    assert sorted(minibatch.input_nodes.tolist()) == sorted(expected_nodes)
+    assert len(minibatch.sampled_subgraphs) == 1
+    subgraph = minibatch.sampled_subgraphs[0]
+    assert torch.equal(
+        subgraph.original_row_node_ids, subgraph.original_column_node_ids
+    )
+    src = indices.tolist()
+    dst = torch.repeat_interleave(torch.arange(6), indptr.diff()).tolist()
+    expected_edges = {
+        (u, v)
+        for u, v in zip(src, dst)
+        if u in expected_nodes and v in expected_nodes
+    }
+    assert _induced_edges(subgraph) == expected_edges
+
+
+def test_ShaDowKHopSampler_hetero():
+    """Original graph in COO:
+    1   0   1   0   1   0
+    1   0   0   1   0   1
+    0   1   0   1   0   0
+    0   1   0   0   1   0
+    1   0   0   0   0   1
+    0   0   1   0   1   0
+    node_type_0: [0, 1, 2]
+    node_type_1: [3, 4, 5]
+    edge_type_0: node_type_0 -> node_type_0
+    edge_type_1: node_type_0 -> node_type_1
+    edge_type_2: node_type_1 -> node_type_0
+    edge_type_3: node_type_1 -> node_type_1
+    """
+    ntypes = {"N0": 0, "N1": 1}
+    etypes = {"N0:R0:N0": 0, "N0:R1:N1": 1, "N1:R2:N0": 2, "N1:R3:N1": 3}
+    indptr = torch.LongTensor([0, 3, 5, 7, 9, 12, 14])
+    indices = torch.LongTensor([0, 1, 4, 2, 3, 0, 5, 1, 2, 0, 3, 5, 1, 4])
+    node_type_offset = torch.LongTensor([0, 3, 6])
+    type_per_edge = torch.LongTensor([0, 0, 2, 0, 2, 0, 2, 1, 1, 1, 3, 3, 1, 3])
+    graph = gb.fused_csc_sampling_graph(
+        csc_indptr=indptr,
+        indices=indices,
+        node_type_offset=node_type_offset,
+        type_per_edge=type_per_edge,
+        node_type_to_id=ntypes,
+        edge_type_to_id=etypes,
+    ).to(F.ctx())
+    item_set = gb.ItemSetDict(
+        {"N0": gb.ItemSet(torch.LongTensor([1]), names="seed_nodes")}
+    )
+    item_sampler = gb.ItemSampler(item_set, batch_size=1).copy_to(F.ctx())
+    sampler = gb.ShaDowKHopSampler(item_sampler, graph, [-1])
+
+    minibatch = next(iter(sampler))
+    assert minibatch.input_nodes["N0"].tolist() == [1, 2]
+    assert minibatch.input_nodes["N1"].tolist() == [0]
+    subgraph = minibatch.sampled_subgraphs[0]
+    expected_edges = {
+        "N0:R0:N0": {(2, 1)},
+        "N0:R1:N1": {(1, 0), (2, 0)},
+        "N1:R2:N0": {(0, 1)},
+        "N1:R3:N1": set(),
+    }
+    for etype, edges in expected_edges.items():
+        assert _induced_edges(subgraph, etype) == edges
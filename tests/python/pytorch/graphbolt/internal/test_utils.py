@@ -2,6 +2,7 @@ import json
 import os
 import re
 import tempfile
+import unittest.mock
 
 import dgl.graphbolt.internal as internal
 import numpy as np
@@ -266,3 +267,71 @@ def test_check_dataset_change():
             file.write("test contents of directory changed")
 
         assert internal.check_dataset_change(test_dir, "preprocessed")
+
+
+@pytest.mark.parametrize("num_sampled_blocks", [0, 4])
+def test_check_dataset_change_manifest(num_sampled_blocks):
+    with tempfile.TemporaryDirectory() as test_dir:
+        test_file_path_1 = os.path.join(test_dir, "test_1.txt")
+        test_file_path_2 = os.path.join(test_dir, "test_2.txt")
+        with open(test_file_path_1, "w") as file:
+            file.write("test content")
+        with open(test_file_path_2, "w") as file:
+            file.write("test contents of directory")
+        manifest = internal.calculate_dir_manifest(
+            test_dir, num_sampled_blocks=num_sampled_blocks
+        )
+        assert manifest[test_file_path_1]["hash"] == (
+            "9473fdd0d880a43c21b7778d34872157"
+        )
+        assert manifest[test_file_path_1]["size"] == len("test content")
+        hash_value_file_path = os.path.join(
+            test_dir, "preprocessed", "dataset_hash_value.txt"
+        )
+        os.makedirs(os.path.join(test_dir, "preprocessed"), exist_ok=True)
+        with open(hash_value_file_path, "w") as file:
+            file.write(json.dumps(manifest, indent=4))
+
+        # Unchanged files are not hashed again.
+        with unittest.mock.patch.object(
+            internal.utils, "calculate_file_hash"
+        ) as mock_hash:
+            assert not internal.check_dataset_change(
+                test_dir, "preprocessed", num_sampled_blocks
+            )
+            mock_hash.assert_not_called()
+
+        # Touching a file without changing its content refreshes the manifest.
+        stat = os.stat(test_file_path_1)
+        os.utime(
+            test_file_path_1, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9)
+        )
+        assert not internal.check_dataset_change(
+            test_dir, "preprocessed", num_sampled_blocks
+        )
+        with open(hash_value_file_path, "r") as file:
+            refreshed_manifest = json.load(file)
+        assert (
+            refreshed_manifest[test_file_path_1]["mtime_ns"]
+            == stat.st_mtime_ns + 10**9
+        )
+
+        # Modify the content of a file.
+        with open(test_file_path_2, "w") as file:
+            file.write("test contents of directory changed")
+        assert internal.check_dataset_change(
+            test_dir, "preprocessed", num_sampled_blocks
+        )
+
+        # Add a file.
+        with open(hash_value_file_path, "w") as file:
+            file.write(
+                json.dumps(
+                    internal.calculate_dir_manifest(
+                        test_dir, ignore="dataset_hash_value.txt"
+                    )
+                )
+            )
+        with open(os.path.join(test_dir, "test_3.txt"), "w") as file:
+            file.write("new file")
+        assert internal.check_dataset_change(test_dir, "preprocessed")
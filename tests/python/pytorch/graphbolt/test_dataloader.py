@@ -43,6 +43,38 @@ def test_DataLoader():
     assert len(list(dataloader)) == N // B
 
 
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_DataLoader_overlap_disk_feature_fetch(num_workers):
+    N = 40
+    B = 4
+    itemset = dgl.graphbolt.ItemSet(torch.arange(N), names="seed_nodes")
+    graph = gb_test_utils.rand_csc_graph(200, 0.15, bidirection_edge=True)
+    a = torch.randn(200, 4)
+    features = {("node", None, "a"): dgl.graphbolt.TorchBasedFeature(a)}
+    feature_store = dgl.graphbolt.BasicFeatureStore(features)
+
+    datapipe = dgl.graphbolt.ItemSampler(itemset, batch_size=B)
+    datapipe = datapipe.sample_neighbor(
+        graph, [torch.LongTensor([2]) for _ in range(2)]
+    )
+    datapipe = datapipe.fetch_feature(feature_store, ["a"])
+
+    dataloader = dgl.graphbolt.DataLoader(
+        datapipe,
+        num_workers=num_workers,
+        overlap_feature_fetch=False,
+        overlap_disk_feature_fetch=True,
+    )
+    datapipe_graph = dp_utils.traverse_dps(dataloader.dataset)
+    assert len(dp_utils.find_dps(datapipe_graph, dgl.graphbolt.Waiter)) == 1
+    minibatches = list(dataloader)
+    assert len(minibatches) == N // B
+    for minibatch in minibatches:
+        assert torch.equal(
+            minibatch.node_features["a"], a[minibatch.input_nodes]
+        )
+
+
 @unittest.skipIf(
     F._default_context_str != "gpu",
     reason="This test requires the GPU.",
@@ -1,6 +1,10 @@
+import os
+import pickle
 import re
+import tempfile
 
 import dgl
+import numpy as np
 import pytest
 import torch
 from dgl import graphbolt as gb
@@ -611,3 +615,65 @@ def test_ItemSetDict_repr():
         ")"
     )
     assert str(item_set) == expected_str, item_set
+
+
+def test_ItemSet_copy_to_shared_memory():
+    node_pairs = torch.arange(0, 20).reshape(-1, 2)
+    labels = torch.arange(10, 20)
+    item_set = gb.ItemSet((node_pairs, labels), names=("node_pairs", "labels"))
+    shm_item_set = item_set.copy_to_shared_memory("test_item_set")
+    assert shm_item_set.names == ("node_pairs", "labels")
+    assert torch.equal(shm_item_set[:][0], node_pairs)
+    assert torch.equal(shm_item_set[:][1], labels)
+
+    # The unpickled itemset attaches to the same shared memory.
+    attached_item_set = pickle.loads(pickle.dumps(shm_item_set))
+    assert attached_item_set.names == ("node_pairs", "labels")
+    for shm_item, attached_item in zip(shm_item_set[:], attached_item_set[:]):
+        assert shm_item.data_ptr() != attached_item.data_ptr()
+        shm_item[0] = 100
+        assert torch.equal(shm_item, attached_item)
+
+    # Scalar items are not copied.
+    item_set = gb.ItemSet(10, names="seed_nodes")
+    assert item_set.copy_to_shared_memory("test_item_set_scalar") is item_set
+
+
+def test_ItemSet_from_numpy_files():
+    with tempfile.TemporaryDirectory() as test_dir:
+        paths = (
+            os.path.join(test_dir, "node_pairs.npy"),
+            os.path.join(test_dir, "labels.npy"),
+        )
+        np.save(paths[0], np.arange(0, 20).reshape(-1, 2))
+        np.save(paths[1], np.arange(10, 20))
+        item_set = gb.ItemSet.from_numpy_files(
+            paths, names=("node_pairs", "labels")
+        )
+        assert item_set.names == ("node_pairs", "labels")
+        assert torch.equal(item_set[:][0], torch.arange(0, 20).reshape(-1, 2))
+        assert torch.equal(item_set[:][1], torch.arange(10, 20))
+
+        # Only the paths are pickled, and the files are mapped again.
+        assert item_set.__getstate__()["_items"] is None
+        attached_item_set = pickle.loads(pickle.dumps(item_set))
+        assert attached_item_set.names == ("node_pairs", "labels")
+        for item, attached_item in zip(item_set[:], attached_item_set[:]):
+            assert torch.equal(item, attached_item)
+        del item_set, attached_item_set
+
+
+def test_ItemSetDict_copy_to_shared_memory():
+    item_set = gb.ItemSetDict(
+        {
+            "user": gb.ItemSet(torch.arange(0, 5), names="seed_nodes"),
+            "item": gb.ItemSet(torch.arange(5, 10), names="seed_nodes"),
+        }
+    )
+    shm_item_set = item_set.copy_to_shared_memory("test_item_set_dict")
+    attached_item_set = pickle.loads(pickle.dumps(shm_item_set))
+    for key in ["user", "item"]:
+        expected = item_set[:][key]
+        assert torch.equal(shm_item_set[:][key], expected)
+        assert torch.equal(attached_item_set[:][key], expected)
+    assert len(attached_item_set) == 10
@@ -92,7 +92,7 @@ def test_sparse_adam_uva(use_uva, emb_dim):
 
 
 @unittest.skipIf(os.name == "nt", reason="Do not support windows yet")
-@pytest.mark.parametrize("dtype", [th.float32, th.float16])
+@pytest.mark.parametrize("dtype", [th.float32, th.float16, th.bfloat16])
 @pytest.mark.parametrize("emb_dim", [1, 4, 101, 1024])
 def test_sparse_adam_dtype(dtype, emb_dim):
     num_embs = 10
@@ -129,6 +129,42 @@ def test_sparse_adam_dtype(dtype, emb_dim):
     # DGL sparseAdam use a per embedding step
 
 
+@unittest.skipIf(os.name == "nt", reason="Do not support windows yet")
+@pytest.mark.parametrize("dtype", [th.float32, th.float16, th.bfloat16])
+@pytest.mark.parametrize("emb_dim", [1, 4, 101, 1024])
+def test_sparse_adagrad_dtype(dtype, emb_dim):
+    num_embs = 10
+    device = F.ctx()
+    dgl_emb = NodeEmbedding(num_embs, emb_dim, "test_adagrad{}".format(dtype))
+    torch_emb = th.nn.Embedding(num_embs, emb_dim, sparse=True)
+    th.manual_seed(0)
+    th.nn.init.uniform_(torch_emb.weight, 0, 1.0)
+    th.manual_seed(0)
+    th.nn.init.uniform_(dgl_emb.weight, 0, 1.0)
+
+    dgl_adagrad = SparseAdagrad(params=[dgl_emb], lr=0.01, dtype=dtype)
+    torch_adagrad = th.optim.Adagrad(list(torch_emb.parameters()), lr=0.01)
+
+    # first step, Pytorch sums up the gradients of duplicated indices while
+    # DGL averages them, so use unique indices
+    idx = th.randperm(num_embs)[:4]
+    dgl_value = dgl_emb(idx, device).to(th.device("cpu"))
+    torch_value = torch_emb(idx)
+    labels = th.zeros((4,)).long()
+
+    dgl_adagrad.zero_grad()
+    torch_adagrad.zero_grad()
+    dgl_loss = th.nn.functional.cross_entropy(dgl_value, labels)
+    torch_loss = th.nn.functional.cross_entropy(torch_value, labels)
+    dgl_loss.backward()
+    torch_loss.backward()
+
+    dgl_adagrad.step()
+    torch_adagrad.step()
+    assert F.allclose(dgl_emb.weight, torch_emb.weight)
+    assert dgl_emb.optm_state[0].dtype == dtype
+
+
 @unittest.skipIf(os.name == "nt", reason="Do not support windows yet")
 def test_sparse_adam_zero_step():
     num_embs = 10
@@ -23,3 +23,61 @@ def test_array_readwriter(format, shape):
 
         assert original_array.shape == array.shape
         assert np.array_equal(original_array, array)
+
+
+@pytest.mark.parametrize("shape", [[500], [300, 10], [200, 5, 5]])
+@pytest.mark.parametrize("format", ["numpy", "parquet"])
+def test_array_readwriter_iter_read(format, shape):
+    original_array = np.random.rand(*shape)
+    fmt_meta = {"name": format}
+
+    with tempfile.TemporaryDirectory() as test_dir:
+        path = os.path.join(test_dir, f"nodes.{format}")
+        parser = array_readwriter.get_array_parser(**fmt_meta)
+        parser.write(path, original_array)
+        batches = list(parser.iter_read(path, batch_size=64))
+
+        assert all(len(batch) <= 64 for batch in batches)
+        array = np.concatenate(batches)
+        assert original_array.shape == array.shape
+        assert np.array_equal(original_array, array)
+
+
+@pytest.mark.parametrize("vector_rows", [False, True])
+def test_parquet_streaming_writer(vector_rows):
+    from distpartitioning.array_readwriter import parquet
+
+    original_array = np.random.rand(2 * parquet.ROW_GROUP_SIZE + 7, 4)
+    parser = array_readwriter.get_array_parser(name="parquet")
+
+    with tempfile.TemporaryDirectory() as test_dir:
+        path = os.path.join(test_dir, "nodes.parquet")
+        with parquet.ParquetArrayWriter(
+            path, (4,), original_array.dtype, vector_rows
+        ) as writer:
+            for start in range(0, len(original_array), 1000):
+                writer.write(original_array[start : start + 1000])
+        array = parser.read(path)
+
+        assert original_array.shape == array.shape
+        assert np.array_equal(original_array, array)
+
+
+def test_parquet_read_list_vectors():
+    import pyarrow
+    import pyarrow.parquet
+
+    # Spark ML writes variable-length list columns even if all the vectors
+    # have the same length.
+    original_array = np.random.rand(100, 8)
+    table = pyarrow.table(
+        [pyarrow.array(list(original_array))], names=["vector"]
+    )
+
+    with tempfile.TemporaryDirectory() as test_dir:
+        path = os.path.join(test_dir, "nodes.parquet")
+        pyarrow.parquet.write_table(table, path, row_group_size=30)
+        array = array_readwriter.get_array_parser(name="parquet").read(path)
+
+        assert original_array.shape == array.shape
+        assert np.array_equal(original_array, array)
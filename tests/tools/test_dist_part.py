@@ -18,6 +18,7 @@ from dgl.distributed.partition import (
 )
 
 from distpartitioning import array_readwriter
+from distpartitioning.dataset_utils import _read_feature_files
 from distpartitioning.utils import generate_read_list
 from pytest_utils import create_chunked_dataset
 
@@ -213,6 +214,7 @@ def _test_pipeline(
     num_chunks_node_data=None,
     num_chunks_edge_data=None,
     use_verify_partitions=False,
+    feature_exchange_chunk_mb=None,
 ):
 
     if num_parts % world_size != 0:
@@ -263,6 +265,11 @@ def _test_pipeline(
         cmd += " --save-orig-nids"
         cmd += " --save-orig-eids"
         cmd += f" --graph-formats {graph_formats}" if graph_formats else ""
+        cmd += (
+            f" --feature-exchange-chunk-mb {feature_exchange_chunk_mb}"
+            if feature_exchange_chunk_mb
+            else ""
+        )
         os.system(cmd)
 
         # check if verify_partitions.py is used for validation.
@@ -321,6 +328,47 @@ def test_pipeline_formats(graph_formats):
     _test_pipeline(4, 4, 4, graph_formats)
 
 
+@pytest.mark.parametrize(
+    "num_chunks, num_parts, world_size", [[4, 4, 4], [8, 4, 2]]
+)
+@pytest.mark.parametrize("data_fmt", ["numpy", "parquet"])
+def test_pipeline_feature_exchange_in_rounds(
+    num_chunks, num_parts, world_size, data_fmt
+):
+    # Small enough for the features to be exchanged in several rounds.
+    _test_pipeline(
+        num_chunks,
+        num_parts,
+        world_size,
+        data_fmt=data_fmt,
+        feature_exchange_chunk_mb=0.001,
+    )
+
+
+@pytest.mark.parametrize("data_fmt", ["numpy", "parquet"])
+def test_read_feature_files_spill(data_fmt):
+    parser = array_readwriter.get_array_parser(name=data_fmt)
+    arrays = [
+        np.random.rand(100, 4),
+        np.random.rand(0, 4),
+        np.random.rand(7, 4),
+    ]
+    with tempfile.TemporaryDirectory() as test_dir:
+        data_files = []
+        for idx, array in enumerate(arrays):
+            data_files.append(os.path.join(test_dir, f"feat-{idx}.{data_fmt}"))
+            parser.write(data_files[-1], array)
+        spill_path = os.path.join(test_dir, "spill")
+        feats = _read_feature_files({"name": data_fmt}, data_files, spill_path)
+        assert isinstance(feats, np.memmap)
+        assert np.array_equal(feats, np.concatenate(arrays))
+        assert np.array_equal(
+            _read_feature_files({"name": data_fmt}, data_files),
+            np.concatenate(arrays),
+        )
+        del feats
+
+
 @pytest.mark.parametrize(
     "num_chunks, "
     "num_parts, "
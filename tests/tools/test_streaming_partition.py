@@ -0,0 +1,61 @@
+import json
+import os
+import tempfile
+
+import numpy as np
+import pytest
+from distpartitioning import array_readwriter
+from partition_algo.base import load_partition_meta
+
+from pytest_utils import create_chunked_dataset
+
+
+@pytest.mark.parametrize("num_parts", [2, 4])
+@pytest.mark.parametrize("batch_size", [1000, 65536])
+def test_streaming_partition(num_parts, batch_size):
+    with tempfile.TemporaryDirectory() as root_dir:
+        g = create_chunked_dataset(root_dir, 4)
+        in_dir = os.path.join(root_dir, "chunked-data")
+        out_dir = os.path.join(root_dir, "parted_data")
+        os.system(
+            "python3 tools/partition_algo/streaming_partition.py "
+            "--in_dir {} --out_dir {} --num_partitions {} "
+            "--num_workers 2 --batch_size {}".format(
+                in_dir, out_dir, num_parts, batch_size
+            )
+        )
+
+        part_meta = load_partition_meta(
+            os.path.join(out_dir, "partition_meta.json")
+        )
+        assert part_meta.num_parts == num_parts
+        assert part_meta.algo_name == "ldg"
+
+        parts = {}
+        for ntype in g.ntypes:
+            parts[ntype] = array_readwriter.get_array_parser(name="csv").read(
+                os.path.join(out_dir, f"{ntype}.txt")
+            )[:, 0]
+            assert len(parts[ntype]) == g.num_nodes(ntype)
+            assert np.all((parts[ntype] >= 0) & (parts[ntype] < num_parts))
+
+        # The reported metrics match the partitions.
+        with open(os.path.join(out_dir, "partition_stats.json")) as f:
+            stats = json.load(f)
+        num_cut_edges = 0
+        for src_ntype, etype, dst_ntype in g.canonical_etypes:
+            src, dst = g.edges(etype=(src_ntype, etype, dst_ntype))
+            num_cut_edges += np.count_nonzero(
+                parts[src_ntype][src.numpy()] != parts[dst_ntype][dst.numpy()]
+            )
+        assert stats["num_edges"] == g.num_edges()
+        assert stats["num_cut_edges"] == num_cut_edges
+        assert sum(stats["part_num_nodes"]) == g.num_nodes()
+        assert stats["node_balance"] <= 1.1
+        # No partition exceeds the capacity, even when a whole batch of
+        # edges is assigned at once.
+        capacity = max(
+            int(1.05 * g.num_nodes() / num_parts),
+            -(-g.num_nodes() // num_parts),
+        )
+        assert max(stats["part_num_nodes"]) <= capacity
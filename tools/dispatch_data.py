@@ -78,6 +78,11 @@ def submit_jobs(args) -> str:
     argslist += (
         f"--graph-formats {args.graph_formats} " if args.graph_formats else ""
     )
+    argslist += (
+        f"--feature-exchange-chunk-mb {args.feature_exchange_chunk_mb} "
+        if args.feature_exchange_chunk_mb
+        else ""
+    )
 
     # (BarclayII) Is it safe to assume all the workers have the Python executable at the same path?
     pipeline_cmd = os.path.join(INSTALL_DIR, PIPELINE_SCRIPT)
@@ -168,6 +173,14 @@ def main():
         "what format is available. If multiple formats are available, selection priority "
         "from high to low is ``coo``, ``csc``, ``csr``.",
     )
+    parser.add_argument(
+        "--feature-exchange-chunk-mb",
+        type=float,
+        default=None,
+        help="Exchange node and edge features in rounds which send at most "
+        "this many MB from each process to bound the peak memory usage. By "
+        "default, all the features of a type are exchanged at once.",
+    )
 
     args, _ = parser.parse_known_args()
 
@@ -17,6 +17,15 @@ class NumpyArrayParser(object):
         logging.debug("Done reading from %s" % path)
         return arr
 
+    def iter_read(self, path, batch_size=None):
+        """Reads the array batch by batch from a memory map. The whole array
+        is yielded at once if ``batch_size`` is None."""
+        logging.debug("Iterating over %s using numpy format" % path)
+        arr = np.load(path, mmap_mode="r")
+        batch_size = batch_size or max(len(arr), 1)
+        for start in range(0, len(arr), batch_size):
+            yield arr[start : start + batch_size]
+
     def write(self, path, arr):
         logging.debug("Writing to %s using numpy format" % path)
         # np.save would load the entire memmap array up into CPU.  So we manually open
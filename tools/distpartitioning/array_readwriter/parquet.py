@@ -1,12 +1,161 @@
 import logging
 
 import numpy as np
-import pandas as pd
 import pyarrow
+import pyarrow.compute
 import pyarrow.parquet
 
 from .registry import register_array_parser
 
+# Number of rows of a row group written by ParquetArrayParser.write.
+ROW_GROUP_SIZE = 65536
+
+
+def _is_list_type(data_type):
+    return (
+        pyarrow.types.is_list(data_type)
+        or pyarrow.types.is_large_list(data_type)
+        or pyarrow.types.is_fixed_size_list(data_type)
+    )
+
+
+def _list_array_to_numpy(array):
+    """Converts an arrow array of vectors to a 2 dim ndarray without
+    creating a Python object per element."""
+    # `flatten` takes the slice offset of the array into account, unlike
+    # `values`.
+    values = array.flatten().to_numpy(zero_copy_only=False)
+    if pyarrow.types.is_fixed_size_list(array.type):
+        dim = array.type.list_size
+    else:
+        lengths = pyarrow.compute.list_value_length(array).to_numpy(
+            zero_copy_only=False
+        )
+        dim = int(lengths[0]) if len(lengths) > 0 else 0
+        assert np.all(lengths == dim), (
+            "All the vectors of a parquet vector column must have the same "
+            "length."
+        )
+    return values.reshape(len(array), dim)
+
+
+def _column_to_numpy(column):
+    """Converts an arrow column, chunked or not, to an ndarray. Vector columns
+    are converted to 2 dim ndarrays."""
+    if isinstance(column, pyarrow.ChunkedArray):
+        chunks = column.chunks
+    else:
+        chunks = [column]
+    if _is_list_type(column.type):
+        arrays = [_list_array_to_numpy(chunk) for chunk in chunks]
+    else:
+        arrays = [chunk.to_numpy(zero_copy_only=False) for chunk in chunks]
+    if len(arrays) == 1:
+        return arrays[0]
+    if len(arrays) == 0:
+        if _is_list_type(column.type):
+            dtype = column.type.value_type.to_pandas_dtype()
+            return np.empty((0, 0), dtype=dtype)
+        return np.empty((0,), dtype=column.type.to_pandas_dtype())
+    return np.concatenate(arrays)
+
+
+def _table_to_numpy(table):
+    """Converts an arrow table or record batch to a 2 dim ndarray."""
+    columns = table.columns
+    # Spark ML feature processing produces single-column parquet files where
+    # each row is a vector object.
+    if len(columns) == 1 and _is_list_type(columns[0].type):
+        return _column_to_numpy(columns[0])
+    return np.stack([_column_to_numpy(column) for column in columns], axis=1)
+
+
+def _read_shape(parquet_file):
+    """Returns the shape stored in the metadata of the file, or None."""
+    # As parquet data are tabularized, we assume the dim of ndarray is 2.
+    # If not, it should be explictly specified in the file as metadata.
+    metadata = parquet_file.schema_arrow.metadata
+    shape = metadata.get(b"shape", None) if metadata else None
+    if not shape:
+        logging.debug(
+            "Shape information not found in the metadata, read the data as "
+            "a 2 dim array."
+        )
+        return None
+    return tuple(eval(shape.decode()))
+
+
+class ParquetArrayWriter(object):
+    """Writes an array to a parquet file batch by batch, so that the whole
+    array never needs to be in memory.
+
+    Every batch is converted to arrow without copying its columns into Python
+    objects, and is written as one or more row groups.
+
+    Parameters
+    ----------
+    path : str
+        The path of the parquet file.
+    row_shape : tuple of int
+        The shape of a row of the array.
+    dtype : numpy.dtype
+        The data type of the array.
+    vector_rows : bool, optional
+        Write the array as a single column with one vector per row, like
+        the files produced by Spark, instead of one column per element.
+    num_rows : int, optional
+        The number of rows of the array, stored in the shape metadata. The
+        number of rows is inferred when reading if it is -1.
+    """
+
+    def __init__(self, path, row_shape, dtype, vector_rows=False, num_rows=-1):
+        self._dtype = np.dtype(dtype)
+        self._dim = int(np.prod(row_shape))
+        self._vector_rows = vector_rows
+        value_type = pyarrow.from_numpy_dtype(self._dtype)
+        if vector_rows:
+            schema = pyarrow.schema(
+                [("vector", pyarrow.list_(value_type, self._dim))]
+            )
+            logging.debug("Writing to %s using single-vector rows..." % path)
+        else:
+            schema = pyarrow.schema(
+                [(str(i), value_type) for i in range(self._dim)]
+            )
+            schema = schema.with_metadata(
+                {"shape": str((num_rows,) + tuple(row_shape))}
+            )
+        self._schema = schema
+        self._writer = pyarrow.parquet.ParquetWriter(path, schema)
+
+    def write(self, array):
+        """Appends the rows of ``array`` to the file."""
+        array = np.ascontiguousarray(array, dtype=self._dtype)
+        array = array.reshape(len(array), self._dim)
+        if self._vector_rows:
+            values = pyarrow.array(array.reshape(-1))
+            columns = [
+                pyarrow.FixedSizeListArray.from_arrays(values, self._dim)
+            ]
+        else:
+            columns = [
+                pyarrow.array(np.ascontiguousarray(array[:, i]))
+                for i in range(self._dim)
+            ]
+        self._writer.write_table(
+            pyarrow.Table.from_arrays(columns, schema=self._schema),
+            row_group_size=ROW_GROUP_SIZE,
+        )
+
+    def close(self):
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
 
 @register_array_parser("parquet")
 class ParquetArrayParser(object):
@@ -15,48 +164,61 @@ class ParquetArrayParser(object):
 
     def read(self, path):
         logging.debug("Reading from %s using parquet format" % path)
-        metadata = pyarrow.parquet.read_metadata(path)
-        metadata = metadata.schema.to_arrow_schema().metadata
+        parquet_file = pyarrow.parquet.ParquetFile(path, memory_map=True)
+        shape = _read_shape(parquet_file)
+        # Convert the row groups one by one into the output array rather than
+        # converting the whole table, which would hold two copies of the data.
+        arr = None
+        offset = 0
+        for i in range(parquet_file.num_row_groups):
+            chunk = _table_to_numpy(parquet_file.read_row_group(i))
+            if arr is None:
+                arr = np.empty(
+                    (parquet_file.metadata.num_rows,) + chunk.shape[1:],
+                    dtype=chunk.dtype,
+                )
+            arr[offset : offset + len(chunk)] = chunk
+            offset += len(chunk)
+        if arr is None:
+            arr = _table_to_numpy(parquet_file.read())
+        logging.debug("Done reading from %s" % path)
+        return arr.reshape(shape) if shape else arr
 
-        # As parquet data are tabularized, we assume the dim of ndarray is 2.
-        # If not, it should be explictly specified in the file as metadata.
-        if metadata:
-            shape = metadata.get(b"shape", None)
-        else:
-            shape = None
-        table = pyarrow.parquet.read_table(path, memory_map=True)
-
-        data_types = table.schema.types
-        # Spark ML feature processing produces single-column parquet files where each row is a vector object
-        if len(data_types) == 1 and isinstance(data_types[0], pyarrow.ListType):
-            arr = np.array(table.to_pandas().iloc[:, 0].to_list())
-            logging.debug(
-                f"Parquet data under {path} converted from single vector per row to ndarray"
+    def iter_read(self, path, batch_size=None):
+        """Reads the array batch by batch.
+
+        Parameters
+        ----------
+        path : str
+            The path of the parquet file.
+        batch_size : int, optional
+            The maximum number of rows of a batch. If None, one batch is
+            yielded per row group.
+
+        Yields
+        ------
+        numpy.ndarray
+            The rows of the next batch.
+        """
+        logging.debug("Iterating over %s using parquet format" % path)
+        parquet_file = pyarrow.parquet.ParquetFile(path, memory_map=True)
+        shape = _read_shape(parquet_file)
+        if batch_size is None:
+            batches = (
+                parquet_file.read_row_group(i)
+                for i in range(parquet_file.num_row_groups)
             )
         else:
-            arr = table.to_pandas().to_numpy()
-        if not shape:
-            logging.debug(
-                "Shape information not found in the metadata, read the data as "
-                "a 2 dim array."
-            )
-        logging.debug("Done reading from %s" % path)
-        shape = tuple(eval(shape.decode())) if shape else arr.shape
-        return arr.reshape(shape)
+            batches = parquet_file.iter_batches(batch_size=batch_size)
+        for batch in batches:
+            arr = _table_to_numpy(batch)
+            yield arr.reshape((len(arr),) + shape[1:]) if shape else arr
 
     def write(self, path, array, vector_rows=False):
         logging.debug("Writing to %s using parquet format" % path)
-        shape = array.shape
-        if len(shape) > 2:
-            array = array.reshape(shape[0], -1)
-        if vector_rows:
-            table = pyarrow.table(
-                [pyarrow.array(array.tolist())], names=["vector"]
-            )
-            logging.debug("Writing to %s using single-vector rows..." % path)
-        else:
-            table = pyarrow.Table.from_pandas(pd.DataFrame(array))
-            table = table.replace_schema_metadata({"shape": str(shape)})
-
-        pyarrow.parquet.write_table(table, path)
+        with ParquetArrayWriter(
+            path, array.shape[1:], array.dtype, vector_rows, len(array)
+        ) as writer:
+            for start in range(0, len(array), ROW_GROUP_SIZE):
+                writer.write(array[start : start + ROW_GROUP_SIZE])
         logging.debug("Done writing to %s" % path)
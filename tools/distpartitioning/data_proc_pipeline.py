@@ -100,6 +100,15 @@ if __name__ == "__main__":
         type=str,
         help="Save partitions in specified formats.",
     )
+    parser.add_argument(
+        "--feature-exchange-chunk-mb",
+        default=None,
+        type=float,
+        help="Exchange node and edge features in rounds which send at most "
+        "this many MB from each process, and spill the received features to "
+        "the output directory. By default, all the features of a type are "
+        "exchanged at once.",
+    )
     params = parser.parse_args()
 
     # invoke the pipeline function
@@ -2,6 +2,7 @@ import gc
 import logging
 import math
 import os
+import shutil
 import sys
 from datetime import timedelta
 from timeit import default_timer as timer
@@ -328,6 +329,170 @@ def exchange_edge_data(rank, world_size, num_parts, edge_data, id_lookup):
     return edge_data
 
 
+def _feature_spill_path(spill_dir, feat_type, local_feat_key):
+    """Returns the file to which the received features of a feature key are
+    appended by ``_exchange_feature_in_rounds``."""
+    return os.path.join(
+        spill_dir, f"{feat_type}-{local_feat_key}".replace("/", "-")
+    )
+
+
+def _exchange_feature_in_rounds(
+    rank,
+    world_size,
+    num_parts,
+    featdata_key,
+    local_idx_per_rank,
+    gids_per_rank,
+    row_shape,
+    dtype,
+    local_feat_key,
+    feature_chunk_bytes,
+    spill_path,
+    cur_features,
+    cur_global_ids,
+):
+    """Sends the features of one feature key to their owner processes in
+    rounds, each of which sends at most ``feature_chunk_bytes`` bytes from
+    each process.
+
+    The features received in a round are appended to ``spill_path`` right
+    away and are memory mapped from it once all the rounds are done. Hence
+    neither the features sent nor the features received by a process are
+    held in memory more than one round at a time.
+
+    Parameters:
+    -----------
+    rank : int
+        integer, unique id assigned to the current process
+    world_size : int
+        total number of processes created
+    num_parts : int
+        total number of partitions
+    featdata_key : tensor
+        features read by the current process, or None
+    local_idx_per_rank : list of numpy arrays
+        indices into ``featdata_key`` of the features to send to each process
+    gids_per_rank : list of numpy arrays
+        global ids of the features to send to each process
+    row_shape : tuple of int
+        shape of the feature of one node or edge
+    dtype : torch.dtype
+        data type of the features
+    local_feat_key : string
+        key used to store the received features in ``cur_features``
+    feature_chunk_bytes : int
+        maximum number of bytes sent by a process in one round
+    spill_path : string
+        file to which the received features are appended
+    cur_features : dictionary
+        dictionary to store the feature data which belongs to the current
+        process
+    cur_global_ids : dictionary
+        dictionary to store global ids, of either nodes or edges, for which
+        the features stored in the cur_features dictionary
+
+    Returns:
+    -------
+    dictionary :
+        a dictionary is returned where keys are type names and
+        feature data are the values
+    list :
+        a dictionary of global_ids either nodes or edges whose features are
+        received during the data shuffle process
+    """
+    MB = 1024 * 1024
+    row_bytes = (
+        int(np.prod(row_shape)) * torch.empty((), dtype=dtype).element_size()
+    )
+    # The messages to all the processes are padded to the same length.
+    rows_per_round = max(1, feature_chunk_bytes // (row_bytes * world_size))
+    all_max_rows = allgather_sizes(
+        [max(len(local_idx) for local_idx in local_idx_per_rank)],
+        world_size,
+        num_parts,
+        return_sizes=True,
+    )
+    num_rounds = math.ceil(np.amax(all_max_rows) / rows_per_round)
+
+    rcvd_ids = []
+    with open(spill_path, "ab") as spill_file:
+        for round_idx in range(num_rounds):
+            start = timer()
+            lo = round_idx * rows_per_round
+            hi = lo + rows_per_round
+            feats_per_rank = []
+            ids_per_rank = []
+            for local_idx, gids in zip(local_idx_per_rank, gids_per_rank):
+                if len(local_idx[lo:hi]) > 0:
+                    feats_per_rank.append(featdata_key[local_idx[lo:hi]])
+                else:
+                    feats_per_rank.append(
+                        torch.empty((0,) + row_shape, dtype=dtype)
+                    )
+                ids_per_rank.append(
+                    torch.from_numpy(gids[lo:hi]).type(torch.int64)
+                )
+            output_feat_list = alltoallv_cpu(
+                rank, world_size, feats_per_rank, retain_nones=False
+            )
+            output_id_list = alltoallv_cpu(
+                rank, world_size, ids_per_rank, retain_nones=False
+            )
+            assert len(output_feat_list) == len(output_id_list), (
+                "Length of feature list and id list are expected to be equal "
+                f"while got {len(output_feat_list)} and {len(output_id_list)}."
+            )
+            num_bytes = sum(
+                feats.numel() * feats.element_size() for feats in feats_per_rank
+            )
+            for feats in output_feat_list:
+                spill_file.write(feats.contiguous().numpy().data)
+                num_bytes += feats.numel() * feats.element_size()
+            rcvd_ids.extend(output_id_list)
+            feats_per_rank = None
+            output_feat_list = None
+
+            elapsed = timer() - start
+            logging.info(
+                f"[Rank: {rank}] {local_feat_key} round "
+                f"{round_idx + 1}/{num_rounds}: {num_bytes / MB:.2f} MB sent "
+                f"and received in {elapsed:.3f} s, "
+                f"{num_bytes / MB / max(elapsed, 1e-9):.2f} MB/s"
+            )
+            memory_snapshot(
+                f"FeatureExchangeRound {local_feat_key} "
+                f"{round_idx + 1}/{num_rounds}: ",
+                rank,
+            )
+
+    if len(rcvd_ids) > 0:
+        num_rows = os.path.getsize(spill_path) // row_bytes
+        if num_rows == 0:
+            # An empty file cannot be memory mapped.
+            cur_features[local_feat_key] = torch.empty(
+                (0,) + row_shape, dtype=dtype
+            )
+        else:
+            # Copy-on-write mapping, so that the features can be modified in
+            # memory without touching the file.
+            spilled_feats = np.memmap(
+                spill_path,
+                dtype=torch.empty((0,), dtype=dtype).numpy().dtype,
+                mode="c",
+                shape=(num_rows,) + row_shape,
+            )
+            cur_features[local_feat_key] = torch.from_numpy(spilled_feats)
+        rcvd_ids = torch.cat(rcvd_ids)
+        if local_feat_key in cur_global_ids:
+            temp = cur_global_ids[local_feat_key]
+            cur_global_ids[local_feat_key] = torch.cat([temp, rcvd_ids])
+        else:
+            cur_global_ids[local_feat_key] = rcvd_ids
+
+    return cur_features, cur_global_ids
+
+
 def exchange_feature(
     rank,
     data,
@@ -344,6 +509,8 @@ def exchange_feature(
     num_parts,
     cur_features,
     cur_global_ids,
+    feature_chunk_bytes=None,
+    spill_dir=None,
 ):
     """This function is used to send/receive one feature for either nodes or
     edges of the input graph dataset.
@@ -390,6 +557,13 @@ def exchange_feature(
     cur_global_ids : dictionary
         dictionary to store global ids, of either nodes or edges, for which
         the features stored in the cur_features dictionary
+    feature_chunk_bytes : int, optional
+        if specified, the features are exchanged in rounds which send at most
+        this many bytes from each process, and the received features are
+        appended to files in ``spill_dir`` instead of being kept in memory
+    spill_dir : string, optional
+        directory in which the received features are stored when
+        ``feature_chunk_bytes`` is specified
 
     Returns:
     -------
@@ -485,6 +659,35 @@ def exchange_feature(
         feat_dims_dtype, world_size, num_parts, return_sizes=True
     )
 
+    if feature_chunk_bytes is not None:
+        # Take the shape of a row and the dtype from a process with data.
+        dim_len = rank0_shape_len + 1
+        src_rank = int(np.nonzero(all_lens)[0][0])
+        dims_dtype = all_dims_dtype[
+            src_rank * dim_len : (src_rank + 1) * dim_len
+        ]
+        local_idx_per_rank = []
+        gids_per_rank = []
+        for idx in range(world_size):
+            cond = partid_slice == (idx + local_part_id * world_size)
+            local_idx_per_rank.append(local_idx[cond])
+            gids_per_rank.append(gids_feat[cond])
+        return _exchange_feature_in_rounds(
+            rank,
+            world_size,
+            num_parts,
+            featdata_key,
+            local_idx_per_rank,
+            gids_per_rank,
+            tuple(int(dim) for dim in dims_dtype[1:-1]),
+            REV_DATA_TYPE_ID[dims_dtype[-1]],
+            local_feat_key,
+            feature_chunk_bytes,
+            _feature_spill_path(spill_dir, feat_type, local_feat_key),
+            cur_features,
+            cur_global_ids,
+        )
+
     for idx in range(world_size):
         cond = partid_slice == (idx + local_part_id * world_size)
         gids_per_partid = gids_feat[cond]
@@ -553,6 +756,8 @@ def exchange_features(
     feature_data,
     feat_type,
     data,
+    feature_chunk_bytes=None,
+    spill_dir=None,
 ):
     """
     This function is used to shuffle node features so that each process will receive
@@ -600,6 +805,12 @@ def exchange_features(
         dictionry in which node or edge features are stored and this information
         is read from the appropriate node features file which belongs to the
         current process
+    feature_chunk_bytes : int, optional
+        if specified, the features are exchanged in rounds which send at most
+        this many bytes from each process, see ``exchange_feature``
+    spill_dir : string, optional
+        directory in which the received features are stored when
+        ``feature_chunk_bytes`` is specified
 
     Returns:
     --------
@@ -611,6 +822,20 @@ def exchange_features(
         received during the data shuffle process
     """
     start = timer()
+    if feature_chunk_bytes is not None:
+        os.makedirs(spill_dir, exist_ok=True)
+        # The received features are appended to the spill files, so remove
+        # the files left over from an earlier run.
+        for feat_key in feature_tids:
+            type_name, feat_name, _ = feat_key.split("/")
+            for local_part_id in range(num_parts // world_size):
+                spill_path = _feature_spill_path(
+                    spill_dir,
+                    feat_type,
+                    f"{type_name}/{feat_name}/{local_part_id}",
+                )
+                if os.path.exists(spill_path):
+                    os.remove(spill_path)
     own_features = {}
     own_global_ids = {}
 
@@ -678,6 +903,8 @@ def exchange_features(
                     num_parts,
                     own_features,
                     own_global_ids,
+                    feature_chunk_bytes,
+                    spill_dir,
                 )
 
     end = timer()
@@ -704,6 +931,8 @@ def exchange_graph_data(
     etypes_geid_range_map,
     ntid_ntype_map,
     schema_map,
+    feature_chunk_bytes=None,
+    spill_dir=None,
 ):
     """
     Wrapper function which is used to shuffle graph data on all the processes.
@@ -748,6 +977,12 @@ def exchange_graph_data(
         mapping between node type id and no of nodes which belong to each node_type_id
     schema_map : dictionary
         is the data structure read from the metadata json file for the input graph
+    feature_chunk_bytes : int, optional
+        if specified, node and edge features are exchanged in rounds which send at most
+        this many bytes from each process, see ``exchange_feature``
+    spill_dir : string, optional
+        directory in which the received features are stored when ``feature_chunk_bytes``
+        is specified
 
     Returns:
     --------
@@ -782,6 +1017,8 @@ def exchange_graph_data(
         node_features,
         constants.STR_NODE_FEATURES,
         None,
+        feature_chunk_bytes,
+        spill_dir,
     )
     dist.barrier()
     memory_snapshot("ShuffleNodeFeaturesComplete: ", rank)
@@ -797,6 +1034,8 @@ def exchange_graph_data(
         edge_features,
         constants.STR_EDGE_FEATURES,
         edge_data,
+        feature_chunk_bytes,
+        spill_dir,
     )
     dist.barrier()
     logging.debug(f"[Rank: {rank}] Done with edge features exchange.")
@@ -822,7 +1061,15 @@ def exchange_graph_data(
     )
 
 
-def read_dataset(rank, world_size, id_lookup, params, schema_map, ntype_counts):
+def read_dataset(
+    rank,
+    world_size,
+    id_lookup,
+    params,
+    schema_map,
+    ntype_counts,
+    spill_dir=None,
+):
     """
     This function gets the dataset and performs post-processing on the data which is read from files.
     Additional information(columns) are added to nodes metadata like owner_process, global_nid which
@@ -843,6 +1090,9 @@ def read_dataset(rank, world_size, id_lookup, params, schema_map, ntype_counts):
         argument parser object to access command line arguments
     schema_map : dictionary
         dictionary created by reading the input graph metadata json file
+    spill_dir : string, optional
+        directory into which the feature files are streamed, see
+        ``get_dataset``
 
     Returns :
     ---------
@@ -887,6 +1137,7 @@ def read_dataset(rank, world_size, id_lookup, params, schema_map, ntype_counts):
         params.num_parts,
         schema_map,
         ntype_counts,
+        spill_dir,
     )
     # Synchronize so that everybody completes reading dataset from disk
     dist.barrier()
@@ -1108,6 +1359,14 @@ def gen_dist_partitions(rank, world_size, params):
     id_map = dgl.distributed.id_map.IdMap(global_nid_ranges)
     id_lookup.set_idMap(id_map)
 
+    feature_chunk_bytes = None
+    spill_dir = None
+    if params.feature_exchange_chunk_mb is not None:
+        feature_chunk_bytes = int(params.feature_exchange_chunk_mb * 1024**2)
+        spill_dir = os.path.join(params.output, f"feature_spill_rank{rank}")
+        # Remove the leftovers of a failed run, the features are appended.
+        shutil.rmtree(spill_dir, ignore_errors=True)
+
     # read input graph files and augment these datastructures with
     # appropriate information (global_nid and owner process) for node and edge data
     (
@@ -1127,6 +1386,7 @@ def gen_dist_partitions(rank, world_size, params):
             schema_map[constants.STR_NODE_TYPE],
             schema_map[constants.STR_NUM_NODES_PER_TYPE],
         ),
+        spill_dir,
     )
     logging.info(
         f"[Rank: {rank}] Done augmenting file input data with auxilary columns"
@@ -1171,6 +1431,8 @@ def gen_dist_partitions(rank, world_size, params):
         etypes_geid_range_map,
         ntypeid_ntypes_map,
         schema_map,
+        feature_chunk_bytes,
+        spill_dir,
     )
     gc.collect()
     logging.debug(f"[Rank: {rank}] Done with data shuffling...")
@@ -1375,6 +1637,9 @@ def gen_dist_partitions(rank, world_size, params):
     else:
         # send meta-data to Rank-0 process
         gather_metadata_json(output_meta_json, rank, world_size)
+    if spill_dir is not None:
+        # The features received in rounds are written to the partitions.
+        shutil.rmtree(spill_dir)
     end = timer()
     logging.info(
         f"[Rank: {rank}] Time to create dgl objects: {timedelta(seconds = end - start)}"
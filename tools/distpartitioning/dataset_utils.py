@@ -89,8 +89,59 @@ def _broadcast_shape(
     return tid_ranges
 
 
+# Number of rows read from a feature file at a time when it is streamed into
+# the spill directory.
+FEATURE_READ_BATCH_ROWS = 65536
+
+
+def _read_feature_files(reader_fmt_meta, data_files, spill_path=None):
+    """Reads the feature data of several files into one array, in order.
+
+    If ``spill_path`` is given, the files are streamed batch by batch into it
+    and the returned array is memory mapped from it, so that neither a whole
+    file nor the concatenated array is held in memory.
+    """
+    parser = array_readwriter.get_array_parser(**reader_fmt_meta)
+    if spill_path is not None:
+        dtype = None
+        row_shape = None
+        with open(spill_path, "wb") as spill_file:
+            for data_file in data_files:
+                for batch in parser.iter_read(
+                    data_file, batch_size=FEATURE_READ_BATCH_ROWS
+                ):
+                    batch = np.ascontiguousarray(batch)
+                    dtype, row_shape = batch.dtype, batch.shape[1:]
+                    spill_file.write(batch.data)
+        if dtype is not None:
+            num_rows = os.path.getsize(spill_path) // (
+                dtype.itemsize * int(np.prod(row_shape))
+            )
+            if num_rows == 0:
+                return np.empty((0,) + row_shape, dtype=dtype)
+            # Copy-on-write mapping, so that the features can be modified in
+            # memory without touching the file.
+            return np.memmap(
+                spill_path,
+                dtype=dtype,
+                mode="c",
+                shape=(num_rows,) + row_shape,
+            )
+        # The files are empty, so reading them at once is cheap.
+    if len(data_files) == 0:
+        return np.array([])
+    return np.concatenate([parser.read(data_file) for data_file in data_files])
+
+
 def get_dataset(
-    input_dir, graph_name, rank, world_size, num_parts, schema_map, ntype_counts
+    input_dir,
+    graph_name,
+    rank,
+    world_size,
+    num_parts,
+    schema_map,
+    ntype_counts,
+    feature_spill_dir=None,
 ):
     """
     Function to read the multiple file formatted dataset.
@@ -110,6 +161,10 @@ def get_dataset(
     schema_map : dictionary
         this is the dictionary created by reading the graph metadata json file
         for the input graph dataset
+    feature_spill_dir : string, optional
+        if specified, the feature files read by the current process are
+        streamed into this directory with ``iter_read`` and the features are
+        memory mapped from it instead of being loaded into memory
 
     Return:
     -------
@@ -150,6 +205,8 @@ def get_dataset(
     # nodes in the corresponding nodes metadata file will always be the same. With this guarantee,
     # we can eliminate the `node_feature_tids` dictionary since the same information is also populated
     # in the `node_tids` dictionary. This will be remnoved in the next iteration of code changes.
+    if feature_spill_dir is not None:
+        os.makedirs(feature_spill_dir, exist_ok=True)
     node_features = {}
     node_feature_tids = {}
 
@@ -240,7 +297,7 @@ def get_dataset(
 
                 # It is guaranteed that num_chunks is always greater
                 # than num_partitions.
-                node_data = []
+                data_files = []
                 num_files = len(feat_data[constants.STR_DATA])
                 if num_files == 0:
                     continue
@@ -252,16 +309,16 @@ def get_dataset(
                     data_file = feat_data[constants.STR_DATA][idx]
                     if not os.path.isabs(data_file):
                         data_file = os.path.join(input_dir, data_file)
-                    node_data.append(
-                        array_readwriter.get_array_parser(
-                            **reader_fmt_meta
-                        ).read(data_file)
+                    data_files.append(data_file)
+                spill_path = None
+                if feature_spill_dir is not None:
+                    spill_path = os.path.join(
+                        feature_spill_dir,
+                        f"input-node-{ntype_name}-{feat_name}",
                     )
-                if len(node_data) > 0:
-                    node_data = np.concatenate(node_data)
-                else:
-                    node_data = np.array([])
-                node_data = torch.from_numpy(node_data)
+                node_data = torch.from_numpy(
+                    _read_feature_files(reader_fmt_meta, data_files, spill_path)
+                )
                 cur_tids = _broadcast_shape(
                     node_data,
                     rank,
@@ -374,7 +431,7 @@ def get_dataset(
                     constants.STR_PARQUET,
                 ]
 
-                edge_data = []
+                data_files = []
                 num_files = len(feat_data[constants.STR_DATA])
                 if num_files == 0:
                     continue
@@ -389,16 +446,16 @@ def get_dataset(
                     logging.debug(
                         f"[Rank: {rank}] Loading edges-feats of {etype_name}[{feat_name}] from {data_file}"
                     )
-                    edge_data.append(
-                        array_readwriter.get_array_parser(
-                            **reader_fmt_meta
-                        ).read(data_file)
+                    data_files.append(data_file)
+                spill_path = None
+                if feature_spill_dir is not None:
+                    spill_path = os.path.join(
+                        feature_spill_dir,
+                        f"input-edge-{etype_name}-{feat_name}",
                     )
-                if len(edge_data) > 0:
-                    edge_data = np.concatenate(edge_data)
-                else:
-                    edge_data = np.array([])
-                edge_data = torch.from_numpy(edge_data)
+                edge_data = torch.from_numpy(
+                    _read_feature_files(reader_fmt_meta, data_files, spill_path)
+                )
 
                 # exchange the amount of data read from the disk.
                 edge_tids = _broadcast_shape(
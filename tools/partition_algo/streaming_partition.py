@@ -0,0 +1,343 @@
+# Requires setting PYTHONPATH=${GITROOT}/tools
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from base import dump_partition_meta, PartitionMeta
+from distpartitioning import array_readwriter
+from files import setdir
+
+
+def _get_edge_chunks(metadata, in_dir):
+    """Returns the edge chunks of the graph as tuples of
+    (path, format, src_offset, dst_offset), where the offsets turn the per-type
+    node IDs of the chunk into homogeneous node IDs."""
+    ntypes = metadata["node_type"]
+    offsets = np.cumsum([0] + metadata["num_nodes_per_type"])
+    ntype_offset = {ntype: int(offsets[i]) for i, ntype in enumerate(ntypes)}
+    chunks = []
+    for etype in metadata["edge_type"]:
+        src_ntype, _, dst_ntype = etype.split(":")
+        edges_meta = metadata["edges"][etype]
+        for path in edges_meta["data"]:
+            if not os.path.isabs(path):
+                path = os.path.join(in_dir, path)
+            chunks.append(
+                (
+                    path,
+                    edges_meta["format"],
+                    ntype_offset[src_ntype],
+                    ntype_offset[dst_ntype],
+                )
+            )
+    return chunks
+
+
+def _read_edge_chunk(path, fmt_meta, src_offset, dst_offset):
+    """Reads an edge chunk and returns its homogeneous source and destination
+    node IDs."""
+    edges = array_readwriter.get_array_parser(**fmt_meta).read(path)
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    return edges[:, 0] + src_offset, edges[:, 1] + dst_offset
+
+
+def _edge_chunk_stats(
+    path, fmt_meta, src_offset, dst_offset, parts_path, num_parts
+):
+    """Returns the number of cut edges of an edge chunk and the number of its
+    edges assigned to each partition, i.e. to the partition of the
+    destination node."""
+    parts = np.load(parts_path, mmap_mode="r")
+    src, dst = _read_edge_chunk(path, fmt_meta, src_offset, dst_offset)
+    src_parts, dst_parts = parts[src], parts[dst]
+    return (
+        int(np.count_nonzero(src_parts != dst_parts)),
+        np.bincount(dst_parts, minlength=num_parts),
+    )
+
+
+def _map_in_order(executor, func, args_list, max_pending):
+    """Like ``executor.map`` but with at most ``max_pending`` tasks in flight
+    so that the results, e.g. the edge chunks read, are not accumulated in
+    memory when the consumer is slower than the workers."""
+    pending = deque()
+    for args in args_list:
+        pending.append(executor.submit(func, *args))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class LDGPartitioner(object):
+    """Assigns the nodes to partitions in a single pass over a stream of
+    edges, following Linear Deterministic Greedy (LDG) [1].
+
+    An unassigned node is placed in the partition holding most of its
+    neighbors seen so far, weighted by the room left in the partition. The
+    edges are processed in batches, in which the nodes are assigned in a few
+    vectorized rounds so that the nodes assigned in a round guide the
+    assignment of their neighbors in the next round. A round gives a
+    partition at most the room it has left, to its best scoring nodes, so no
+    partition ever holds more than :attr:`capacity` nodes.
+
+    [1] Stanton and Kliot. Streaming Graph Partitioning for Large Distributed
+        Graphs. KDD 2012.
+
+    Parameters
+    ----------
+    num_nodes : int
+        The number of nodes of the graph.
+    num_parts : int
+        The number of partitions.
+    balance_slack : float, optional
+        A partition does not accept nodes once it holds
+        ``(1 + balance_slack) * num_nodes / num_parts`` nodes, rounded down
+        but no less than ``ceil(num_nodes / num_parts)``.
+    max_rounds : int, optional
+        The maximum number of assignment rounds per batch of edges. The nodes
+        still unassigned afterwards go to the smallest partitions.
+    """
+
+    def __init__(self, num_nodes, num_parts, balance_slack=0.05, max_rounds=8):
+        self.num_parts = num_parts
+        self.parts = np.full(num_nodes, -1, dtype=np.int32)
+        self.sizes = np.zeros(num_parts, dtype=np.int64)
+        self.capacity = max(
+            int((1 + balance_slack) * num_nodes / num_parts),
+            -(-num_nodes // num_parts),
+        )
+        self.max_rounds = max_rounds
+
+    def _assign(self, nodes, parts):
+        self.parts[nodes] = parts
+        self.sizes += np.bincount(parts, minlength=self.num_parts)
+
+    def _assign_to_smallest(self, nodes):
+        """Spreads ``nodes`` over the partitions, each node going to the
+        smallest partition at the time, without exceeding the capacity."""
+        if len(nodes) == 0:
+            return
+        # Every free place of a partition, keyed by the size the partition
+        # has once it is taken, is taken in increasing order of that key.
+        room = np.minimum(self.capacity - self.sizes, len(nodes))
+        parts = np.repeat(np.arange(self.num_parts), room)
+        rank = np.arange(len(parts)) - np.repeat(np.cumsum(room) - room, room)
+        order = np.argsort(self.sizes[parts] + rank, kind="stable")
+        self._assign(nodes, parts[order[: len(nodes)]].astype(np.int32))
+
+    def _assign_by_votes(self, ends, others):
+        """Assigns the unassigned nodes in ``ends`` which have an assigned
+        neighbor in ``others``. Returns the number of assigned nodes."""
+        other_parts = self.parts[others]
+        voted = other_parts >= 0
+        if not np.any(voted):
+            return 0
+        keys = ends[voted] * self.num_parts + other_parts[voted]
+        keys, votes = np.unique(keys, return_counts=True)
+        nodes, parts = keys // self.num_parts, keys % self.num_parts
+        sizes = self.sizes[parts]
+        scores = votes * (1 - sizes / self.capacity)
+        scores[sizes >= self.capacity] = -np.inf
+        # The best partition of every node comes first.
+        order = np.lexsort((-scores, nodes))
+        nodes, parts, scores = nodes[order], parts[order], scores[order]
+        first = np.ones(len(nodes), dtype=bool)
+        first[1:] = nodes[1:] != nodes[:-1]
+        first &= scores > -np.inf
+        nodes, parts, scores = nodes[first], parts[first], scores[first]
+        # A partition only takes its best scoring nodes up to the room it has
+        # left, the others try their next best partition in the next round.
+        order = np.lexsort((-scores, parts))
+        nodes, parts = nodes[order], parts[order]
+        counts = np.bincount(parts, minlength=self.num_parts)
+        rank = np.arange(len(parts)) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        kept = rank < (self.capacity - self.sizes)[parts]
+        self._assign(nodes[kept], parts[kept].astype(np.int32))
+        return int(np.count_nonzero(kept))
+
+    def partition_edges(self, src, dst):
+        """Assigns the unassigned end points of a batch of edges."""
+        ends = np.concatenate([src, dst])
+        others = np.concatenate([dst, src])
+        for _ in range(self.max_rounds):
+            unassigned = self.parts[ends] < 0
+            if not np.any(unassigned):
+                return
+            ends, others = ends[unassigned], others[unassigned]
+            if self._assign_by_votes(ends, others) == 0:
+                # Nothing to follow yet, seed the smallest partitions with
+                # the nodes of highest degree in the batch.
+                nodes, degrees = np.unique(ends, return_counts=True)
+                seeds = nodes[np.argsort(-degrees, kind="stable")]
+                self._assign_to_smallest(seeds[: self.num_parts])
+        rest = np.unique(ends[self.parts[ends] < 0])
+        self._assign_to_smallest(rest)
+
+    def finalize(self):
+        """Assigns the isolated nodes and returns the partition of every
+        node."""
+        self._assign_to_smallest(np.nonzero(self.parts < 0)[0])
+        return self.parts
+
+
+def _streaming_partition(
+    metadata, in_dir, num_parts, num_workers, batch_size, parts_path
+):
+    num_nodes = int(sum(metadata["num_nodes_per_type"]))
+    num_edges = int(sum(sum(n) for n in metadata["num_edges_per_chunk"]))
+    partitioner = LDGPartitioner(num_nodes, num_parts)
+    chunks = _get_edge_chunks(metadata, in_dir)
+
+    tic = time.time()
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        for i, (src, dst) in enumerate(
+            _map_in_order(executor, _read_edge_chunk, chunks, 2 * num_workers)
+        ):
+            for start in range(0, len(src), batch_size):
+                partitioner.partition_edges(
+                    src[start : start + batch_size],
+                    dst[start : start + batch_size],
+                )
+            logging.info(
+                "Partitioned edge chunk %d/%d in %.2f seconds"
+                % (i + 1, len(chunks), time.time() - tic)
+            )
+        parts = partitioner.finalize()
+        np.save(parts_path, parts)
+
+        # Compute the quality metrics in parallel over the edge chunks.
+        num_cut_edges = 0
+        part_num_edges = np.zeros(num_parts, dtype=np.int64)
+        for num_cut, counts in _map_in_order(
+            executor,
+            _edge_chunk_stats,
+            [chunk + (parts_path, num_parts) for chunk in chunks],
+            2 * num_workers,
+        ):
+            num_cut_edges += num_cut
+            part_num_edges += counts
+
+    part_num_nodes = np.bincount(parts, minlength=num_parts)
+    stats = {
+        "num_nodes": num_nodes,
+        "num_edges": num_edges,
+        "num_cut_edges": num_cut_edges,
+        "edge_cut_ratio": num_cut_edges / max(num_edges, 1),
+        "node_balance": float(
+            part_num_nodes.max() / max(part_num_nodes.mean(), 1)
+        ),
+        "edge_balance": float(
+            part_num_edges.max() / max(part_num_edges.mean(), 1)
+        ),
+        "part_num_nodes": part_num_nodes.tolist(),
+        "part_num_edges": part_num_edges.tolist(),
+    }
+    logging.info(
+        "Edge cut: %d/%d (%.4f), node balance: %.4f, edge balance: %.4f"
+        % (
+            num_cut_edges,
+            num_edges,
+            stats["edge_cut_ratio"],
+            stats["node_balance"],
+            stats["edge_balance"],
+        )
+    )
+    return parts, stats
+
+
+def streaming_partition(
+    metadata, in_dir, num_parts, output_path, num_workers=4, batch_size=65536
+):
+    """
+    Partition the graph described in metadata with a single streaming pass
+    over its edge chunks and generate partition ID mapping in
+    :attr:`output_path`.
+
+    The nodes are assigned with the LDG heuristic, which gives a much lower
+    edge cut than random partitioning while keeping the partitions balanced.
+    Only the partition IDs of the nodes and a bounded number of edge chunks
+    are held in memory. The edge chunks are read, and the quality metrics
+    computed, by :attr:`num_workers` processes, but the assignment itself runs
+    in the main process: LDG places every node based on all the nodes placed
+    before it, so it is inherently sequential.
+
+    The output has the same layout as :func:`random_partition`: a
+    "<node-type>.txt" file per node type containing one line per node
+    representing the partition ID the node belongs to, and the partition
+    metadata. In addition, the edge cut and balance of the partitions are
+    dumped into "partition_stats.json".
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        parts, stats = _streaming_partition(
+            metadata,
+            in_dir,
+            num_parts,
+            num_workers,
+            batch_size,
+            os.path.join(tmp_dir, "parts.npy"),
+        )
+    with setdir(output_path):
+        offset = 0
+        for ntype, n in zip(
+            metadata["node_type"], metadata["num_nodes_per_type"]
+        ):
+            logging.info("Writing partition for node type %s" % ntype)
+            array_readwriter.get_array_parser(name="csv").write(
+                ntype + ".txt", parts[offset : offset + n]
+            )
+            offset += n
+        part_meta = PartitionMeta(
+            version="1.0.0", num_parts=num_parts, algo_name="ldg"
+        )
+        dump_partition_meta(part_meta, "partition_meta.json")
+        with open("partition_stats.json", "w") as f:
+            json.dump(stats, f, indent=4)
+    return stats
+
+
+# Run with PYTHONPATH=${GIT_ROOT_DIR}/tools
+# where ${GIT_ROOT_DIR} is the directory to the DGL git repository.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--in_dir",
+        type=str,
+        help="input directory that contains the metadata file",
+    )
+    parser.add_argument("--out_dir", type=str, help="output directory")
+    parser.add_argument(
+        "--num_partitions", type=int, help="number of partitions"
+    )
+    parser.add_argument(
+        "--num_workers",
+        type=int,
+        default=4,
+        help="number of processes reading the edge chunks",
+    )
+    parser.add_argument(
+        "--batch_size",
+        type=int,
+        default=65536,
+        help="number of edges whose end points are assigned at once",
+    )
+    logging.basicConfig(level="INFO")
+    args = parser.parse_args()
+    with open(os.path.join(args.in_dir, "metadata.json")) as f:
+        metadata = json.load(f)
+    streaming_partition(
+        metadata,
+        args.in_dir,
+        args.num_partitions,
+        args.out_dir,
+        args.num_workers,
+        args.batch_size,
+    )